@@ -2,11 +2,19 @@
 
 __version__ = "1.2.5"
 
-from amplify_excel_migrator.client import AmplifyClient
-from amplify_excel_migrator.migration import MigrationOrchestrator
-from amplify_auth import AuthenticationProvider, CognitoAuthProvider
+import importlib
+from typing import Any
+
 from amplify_excel_migrator.core import ConfigManager
 
+# Resolved on first access so importing the package (e.g. for the CLI entry point) stays cheap
+_LAZY_EXPORTS = {
+    "AmplifyClient": "amplify_excel_migrator.client",
+    "MigrationOrchestrator": "amplify_excel_migrator.migration",
+    "AuthenticationProvider": "amplify_auth",
+    "CognitoAuthProvider": "amplify_auth",
+}
+
 __all__ = [
     "AmplifyClient",
     "MigrationOrchestrator",
@@ -15,3 +23,12 @@ __all__ = [
     "ConfigManager",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,23 +1,28 @@
-"""CLI command handlers for Amplify Excel Migrator."""
+"""CLI command handlers for Amplify Excel Migrator.
+
+pandas, the GraphQL client and the auth provider are imported inside the commands that use them, so that
+`show`, `config` and `--help` start without paying for that import chain.
+"""
 
 import argparse
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
-import pandas as pd
-
-from amplify_excel_migrator.client import AmplifyClient
 from amplify_excel_migrator.core import ConfigManager
-from amplify_excel_migrator.schema import FieldParser, SchemaExporter
-from amplify_excel_migrator.data import ExcelReader, DataTransformer
-from amplify_excel_migrator.migration import (
-    FailureTracker,
-    ProgressReporter,
-    BatchUploader,
-    MigrationOrchestrator,
-)
-from amplify_auth import CognitoAuthProvider
+
+# (config key, prompt text, default) for the settings every API-backed command needs
+_CONNECTION_PROMPTS = [
+    ("api_endpoint", "AWS Amplify API endpoint", ""),
+    ("region", "AWS Region", "us-east-1"),
+    ("user_pool_id", "Cognito User Pool ID", ""),
+    ("client_id", "Cognito Client ID", ""),
+    ("username", "Admin Username", ""),
+]
 
 
 def cmd_show(args=None):
@@ -134,6 +139,68 @@ def cmd_config(args=None):
     print(f"💡 You can now run 'amplify-migrator migrate' to start the migration.")
 
 
+def _authenticate(config_manager, settings):
+    """
+    Return an authenticated provider, reusing a still-valid cached ID token instead of prompting when possible.
+
+    A run started from a cached token prompts for the password again once that token nears expiry.
+    Exits with status 1 when the credentials are rejected.
+    """
+    from amplify_excel_migrator.core.auth import CachedTokenAuthProvider
+
+    print("\n🔐 Authentication:")
+    print("-" * 54)
+
+    cached_token = config_manager.load_token(_token_identity(settings))
+    if cached_token:
+        print("Reusing cached session token.")
+        return CachedTokenAuthProvider(cached_token, reauthenticate=lambda: _reauthenticate(config_manager, settings))
+
+    auth_provider = _sign_in(config_manager, settings)
+    if auth_provider is None:
+        # Exit non-zero so scripted runs stop here instead of reading the workbook or reporting success
+        print("\n❌ Authentication failed.")
+        sys.exit(1)
+    return auth_provider
+
+
+def _token_identity(settings):
+    return f"{settings['user_pool_id']}:{settings['client_id']}:{settings['username']}"
+
+
+def _sign_in(config_manager, settings):
+    """Prompt for the password and sign in through Cognito, caching the ID token. Returns None when rejected."""
+    from amplify_auth import CognitoAuthProvider
+    from amplify_excel_migrator.core.auth import token_expiry
+
+    password = config_manager.prompt_for_value("Admin Password", secret=True)
+
+    auth_provider = CognitoAuthProvider(
+        user_pool_id=settings["user_pool_id"],
+        client_id=settings["client_id"],
+        region=settings["region"],
+    )
+
+    if not auth_provider.authenticate(settings["username"], password):
+        return None
+
+    id_token = auth_provider.get_id_token()
+    expires_at = token_expiry(id_token)
+    if expires_at is not None:
+        config_manager.save_token(_token_identity(settings), id_token, expires_at)
+
+    return auth_provider
+
+
+def _reauthenticate(config_manager, settings):
+    print("\n🔐 The cached session token is about to expire; sign in again to continue.")
+    auth_provider = _sign_in(config_manager, settings)
+    if auth_provider is None:
+        print("\n❌ Authentication failed.")
+        return None
+    return auth_provider.get_id_token()
+
+
 def _collect_failures_by_sheet(plan, result):
     executed = {sheet_result.sheet_name: sheet_result for sheet_result in result.sheets}
     failures_by_sheet = {}
@@ -194,6 +261,8 @@ def _display_migration_summary(plan, result, excel_path, progress_reporter):
         print("=" * 60)
         return
 
+    from amplify_excel_migrator.migration import FailureTracker
+
     tracker = FailureTracker.from_failures_by_sheet(failures_by_sheet)
     failed_records_file = tracker.export_to_excel(excel_path)
     if not failed_records_file:
@@ -227,36 +296,22 @@ def cmd_migrate(args=None):
         print("💡 Run 'amplify-migrator config' first to set up your configuration.")
         sys.exit(1)
 
-    excel_path = config_manager.get_or_prompt("excel_path", "Excel file path", "data.xlsx")
-    api_endpoint = config_manager.get_or_prompt("api_endpoint", "AWS Amplify API endpoint")
-    region = config_manager.get_or_prompt("region", "AWS Region", "us-east-1")
-    user_pool_id = config_manager.get_or_prompt("user_pool_id", "Cognito User Pool ID")
-    client_id = config_manager.get_or_prompt("client_id", "Cognito Client ID")
-    username = config_manager.get_or_prompt("username", "Admin Username")
+    settings = config_manager.get_or_prompt_many([("excel_path", "Excel file path", "data.xlsx"), *_CONNECTION_PROMPTS])
+    excel_path = settings["excel_path"]
 
-    print("\n🔐 Authentication:")
-    print("-" * 54)
-    password = config_manager.prompt_for_value("Admin Password", secret=True)
-
-    from amplify_auth import CognitoAuthProvider
+    auth_provider = _authenticate(config_manager, settings)
 
-    auth_provider = CognitoAuthProvider(
-        user_pool_id=user_pool_id,
-        client_id=client_id,
-        region=region,
-    )
-
-    composite_unique_fields = cached_config.get("composite_unique_fields", {})
+    from amplify_excel_migrator.client import AmplifyClient
+    from amplify_excel_migrator.data import DataTransformer, ExcelReader
+    from amplify_excel_migrator.migration import BatchUploader, MigrationOrchestrator, ProgressReporter
+    from amplify_excel_migrator.schema import FieldParser
 
     amplify_client = AmplifyClient(
-        api_endpoint=api_endpoint,
+        api_endpoint=settings["api_endpoint"],
         auth_provider=auth_provider,
-        composite_unique_fields=composite_unique_fields,
+        composite_unique_fields=cached_config.get("composite_unique_fields", {}),
     )
 
-    if not auth_provider.authenticate(username, password):
-        return
-
     field_parser = FieldParser()
     default_fk_values = cached_config.get("default_fk_values", {})
     fill_unknown = cached_config.get("fill_unknown", False)
@@ -291,32 +346,20 @@ def cmd_export_schema(args=None):
         print("💡 Run 'amplify-migrator config' first to set up your configuration.")
         sys.exit(1)
 
-    api_endpoint = config_manager.get_or_prompt("api_endpoint", "AWS Amplify API endpoint")
-    region = config_manager.get_or_prompt("region", "AWS Region", "us-east-1")
-    user_pool_id = config_manager.get_or_prompt("user_pool_id", "Cognito User Pool ID")
-    client_id = config_manager.get_or_prompt("client_id", "Cognito Client ID")
-    username = config_manager.get_or_prompt("username", "Admin Username")
+    settings = config_manager.get_or_prompt_many(_CONNECTION_PROMPTS)
 
     output_path = args.output if args else "schema-reference.xlsx"
 
-    print("\n🔐 Authentication:")
-    print("-" * 54)
-    password = config_manager.prompt_for_value("Admin Password", secret=True)
+    auth_provider = _authenticate(config_manager, settings)
 
-    auth_provider = CognitoAuthProvider(
-        user_pool_id=user_pool_id,
-        client_id=client_id,
-        region=region,
-    )
+    from amplify_excel_migrator.client import AmplifyClient
+    from amplify_excel_migrator.schema import FieldParser, SchemaExporter
 
     amplify_client = AmplifyClient(
-        api_endpoint=api_endpoint,
+        api_endpoint=settings["api_endpoint"],
         auth_provider=auth_provider,
     )
 
-    if not auth_provider.authenticate(username, password):
-        return
-
     print("\n📋 Exporting schema...")
     print("-" * 54)
 
@@ -335,6 +378,53 @@ def cmd_export_schema(args=None):
         sys.exit(1)
 
 
+def _iter_model_records(amplify_client, field_parser, model_names, concurrency, limit=None):
+    """Yield (model_name, records, primary_field, errors) in model order, fetching up to `concurrency` models ahead.
+
+    `errors` lists why a model's listing could not be completed, including an exception raised by the fetch itself.
+
+    Only a window of `concurrency` fetches is in flight or buffered at once, so memory stays bounded while the
+    consumer writes each model out.
+    """
+    names = iter(model_names)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pending = deque(
+            (name, pool.submit(amplify_client.get_complete_model_records, name, field_parser, limit))
+            for name in islice(names, concurrency)
+        )
+        while pending:
+            model_name, future = pending.popleft()
+            for name in islice(names, 1):
+                pending.append(
+                    (name, pool.submit(amplify_client.get_complete_model_records, name, field_parser, limit))
+                )
+            try:
+                records, primary_field, errors = future.result()
+            except Exception as e:
+                yield model_name, None, None, [str(e)]
+                continue
+            yield model_name, records, primary_field, errors
+
+
+def _append_records_sheet(workbook, sheet_name, df):
+    """Stream a frame into a new sheet of a write-only openpyxl workbook, header row first."""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    sheet = workbook.create_sheet(title=sheet_name)
+
+    header = []
+    for column in df.columns:
+        cell = WriteOnlyCell(sheet, value=column)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    sheet.append(header)
+
+    # astype(object) boxes numpy scalars into Python ones openpyxl accepts; nested values are written as text
+    for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+        sheet.append([v if v is None or isinstance(v, (str, int, float, bool)) else str(v) for v in row])
+
+
 def cmd_export_data(args=None):
     print("""
     ╔════════════════════════════════════════════════════╗
@@ -350,30 +440,18 @@ def cmd_export_data(args=None):
         print("💡 Run 'amplify-migrator config' first to set up your configuration.")
         sys.exit(1)
 
-    api_endpoint = config_manager.get_or_prompt("api_endpoint", "AWS Amplify API endpoint")
-    region = config_manager.get_or_prompt("region", "AWS Region", "us-east-1")
-    user_pool_id = config_manager.get_or_prompt("user_pool_id", "Cognito User Pool ID")
-    client_id = config_manager.get_or_prompt("client_id", "Cognito Client ID")
-    username = config_manager.get_or_prompt("username", "Admin Username")
+    settings = config_manager.get_or_prompt_many(_CONNECTION_PROMPTS)
 
-    print("\n🔐 Authentication:")
-    print("-" * 54)
-    password = config_manager.prompt_for_value("Admin Password", secret=True)
+    auth_provider = _authenticate(config_manager, settings)
 
-    auth_provider = CognitoAuthProvider(
-        user_pool_id=user_pool_id,
-        client_id=client_id,
-        region=region,
-    )
+    from amplify_excel_migrator.client import AmplifyClient
+    from amplify_excel_migrator.schema import FieldParser, SchemaExporter
 
     amplify_client = AmplifyClient(
-        api_endpoint=api_endpoint,
+        api_endpoint=settings["api_endpoint"],
         auth_provider=auth_provider,
     )
 
-    if not auth_provider.authenticate(username, password):
-        return
-
     field_parser = FieldParser()
 
     if getattr(args, "all", False):
@@ -393,54 +471,80 @@ def cmd_export_data(args=None):
     else:
         output_path = f"{model_names[0]}_records.xlsx"
 
+    import pandas as pd
+
     print(f"\n📋 Exporting {len(model_names)} model(s)...")
     print("-" * 54)
 
-    dataframes: dict[str, pd.DataFrame] = {}
+    from openpyxl import Workbook
 
-    for model_name in model_names:
-        try:
-            records, primary_field = amplify_client.get_model_records(model_name, field_parser)
-        except Exception as e:
-            print(f"\n❌ Failed to fetch records for '{model_name}': {e}")
-            continue
+    # A write-only workbook spills rows to disk as they are appended, and each sheet is written as soon as its
+    # model is fetched, so memory holds one model's frame rather than the whole workbook. It is created on the
+    # first non-empty model so no file is written when nothing was found.
+    workbook = None
+    exported_models = 0
+    total_records = 0
+    failed_models = []
 
-        if not records:
-            print(f"  ⚠️  No records found for model '{model_name}', skipping.")
-            continue
-
-        df = pd.DataFrame(records)
-
-        cols = list(df.columns)
-        leading = []
-        for col in ["id", primary_field]:
-            if col in cols:
-                cols.remove(col)
-                leading.append(col)
-        df = df[leading + cols]
-
-        if primary_field in df.columns:
-            sort_key = df[primary_field].apply(lambda x: str(x).lower())
-            df = df.iloc[sort_key.argsort()]
-
-        dataframes[model_name] = df
-        print(f"  ✅ {model_name}: {len(records)} records")
+    concurrency = max(1, args.concurrency)
 
-    if not dataframes:
-        print("\n⚠️  No records found for any model.")
-        return
+    try:
+        for model_name, records, primary_field, errors in _iter_model_records(
+            amplify_client, field_parser, model_names, concurrency, args.limit
+        ):
+            if errors:
+                print(f"\n❌ Failed to fetch records for '{model_name}' ({len(errors)} error(s)): {'; '.join(errors)}")
+                failed_models.append(model_name)
+                continue
+
+            if not records:
+                print(f"  ⚠️  No records found for model '{model_name}', skipping.")
+                continue
+
+            # AppSync returns every selected field on every item, so the first record's keys are the full column set;
+            # passing them up front, id and primary field first, spares pandas a key-union scan and a reorder
+            first = records[0]
+            columns = [col for col in dict.fromkeys(["id", primary_field]) if col in first]
+            columns += [col for col in first if col not in columns]
+            df = pd.DataFrame.from_records(records, columns=columns)
+            del records
+
+            if primary_field in df.columns:
+                df = df.sort_values(primary_field, key=lambda col: col.astype(str).str.lower(), kind="mergesort")
+
+            if workbook is None:
+                workbook = Workbook(write_only=True)
+            _append_records_sheet(workbook, model_name, df)
+
+            exported_models += 1
+            total_records += len(df)
+            print(f"  ✅ {model_name}: {len(df)} records")
+            del df
+    finally:
+        if workbook is not None:
+            workbook.save(output_path)
+
+    if failed_models:
+        print(
+            f"\n⚠️  {len(failed_models)} model(s) could not be fully fetched and were not exported: {', '.join(failed_models)}"
+        )
+        print("💡 Re-run export-data for these models once the API is reachable.")
 
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        for model_name, df in dataframes.items():
-            df.to_excel(writer, index=False, sheet_name=model_name)
+    if workbook is None:
+        if not failed_models:
+            print("\n⚠️  No records found for any model.")
+    else:
+        print(f"\n✅ Exported to: {output_path}")
+        if is_multi:
+            print(f"💡 {exported_models} model(s), {total_records} total records")
 
-    print(f"\n✅ Exported to: {output_path}")
-    if is_multi:
-        total = sum(len(df) for df in dataframes.values())
-        print(f"💡 {len(dataframes)} model(s), {total} total records")
+    if failed_models:
+        sys.exit(1)
 
 
-def main():
+# parse_args never mutates the parser, so one instance can serve every main() call in the process
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Amplify Excel Migrator - Migrate Excel data to AWS Amplify GraphQL API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -492,8 +596,27 @@ def main():
         default=None,
         help="Output file path (default: {model}_records.xlsx or all_models_records.xlsx)",
     )
+    export_data_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=4,
+        help="Number of models to fetch in parallel (default: 4)",
+    )
+    export_data_parser.add_argument(
+        "--limit",
+        "-l",
+        type=int,
+        default=None,
+        help="Export at most this many records per model, in listing order (default: all records)",
+    )
     export_data_parser.set_defaults(func=cmd_export_data)
 
+    return parser
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
 
     if args.command is None:
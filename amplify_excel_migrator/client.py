@@ -1,7 +1,7 @@
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List
 
-from amplify_excel_migrator.graphql import GraphQLClient, QueryExecutor
+from amplify_excel_migrator.graphql import GraphQLClient, GraphQLError, QueryExecutor
 from amplify_auth import AuthenticationProvider
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -21,12 +21,18 @@ class AmplifyClient:
         api_endpoint: str,
         auth_provider: Optional[AuthenticationProvider] = None,
         composite_unique_fields: Optional[Dict[str, List[str]]] = None,
+        records_cache_size: Optional[int] = None,
     ):
         self.api_endpoint = api_endpoint
         self._auth_provider = auth_provider
 
         self._client = GraphQLClient(api_endpoint, auth_provider)
-        self._executor = QueryExecutor(self._client, batch_size=20, composite_unique_fields=composite_unique_fields)
+        self._executor = QueryExecutor(
+            self._client,
+            batch_size=20,
+            composite_unique_fields=composite_unique_fields,
+            records_cache_size=records_cache_size,
+        )
 
     @property
     def auth_provider(self) -> Optional[AuthenticationProvider]:
@@ -40,6 +46,9 @@ class AmplifyClient:
     def get_model_structure(self, model_type: str) -> Dict[str, Any]:
         return self._executor.get_model_structure(model_type)
 
+    def prefetch_model_structures(self, model_types: List[str]) -> None:
+        self._executor.prefetch_model_structures(model_types)
+
     def get_all_types(self) -> list[Dict[str, Any]]:
         return self._executor.get_all_types()
 
@@ -49,14 +58,57 @@ class AmplifyClient:
     def get_primary_field_name(self, model_name: str, parsed_model_structure: Dict[str, Any]) -> tuple[str, bool, str]:
         return self._executor.get_primary_field_name(model_name, parsed_model_structure)
 
-    def build_foreign_key_lookups(self, df, parsed_model_structure: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-        return self._executor.build_foreign_key_lookups(df, parsed_model_structure)
+    def build_foreign_key_lookups(
+        self, df, parsed_model_structure: Dict[str, Any], fetch_missing: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        return self._executor.build_foreign_key_lookups(df, parsed_model_structure, fetch_missing=fetch_missing)
+
+    def get_related_models(self, columns: Iterable[str], parsed_model_structure: Dict[str, Any]) -> List[str]:
+        return self._executor.get_related_models(columns, parsed_model_structure)
+
+    def prefetch_foreign_key_lookups(self, related_models: Iterable[str]) -> None:
+        self._executor.prefetch_foreign_key_lookups(related_models)
+
+    def clear_fk_cache(self) -> None:
+        self._executor.clear_fk_cache()
 
     def get_model_records(self, model_name: str, field_parser) -> tuple[List[Dict], str]:
         raw_structure = self.get_model_structure(model_name)
         parsed_structure = field_parser.parse_model_structure(raw_structure)
         primary_field, is_secondary_index, _ = self.get_primary_field_name(model_name, parsed_structure)
+        fields = self._export_field_names(parsed_structure, field_parser)
+
+        records = self._executor.get_records(model_name, primary_field, is_secondary_index, fields=fields)
+
+        return records or [], primary_field
+
+    def get_complete_model_records(
+        self, model_name: str, field_parser, limit: Optional[int] = None
+    ) -> tuple[List[Dict], str, List[str]]:
+        """
+        Like get_model_records, but never returns a listing cut short by a failed page.
 
+        Returns (records, primary_field, errors). A non-empty errors list means the listing could not be completed,
+        in which case no records are returned so callers never mistake a truncated listing for the full one.
+        Records are streamed past the records cache, so an exported model is released once the caller drops it.
+        With `limit`, only the first `limit` records in listing order are returned.
+        """
+        fields, primary_field = self._export_fields(model_name, field_parser)
+
+        try:
+            records = list(self._executor.iter_records(model_name, fields=fields, limit=limit))
+        except GraphQLError as e:
+            return [], primary_field, [str(e)]
+
+        return records, primary_field, []
+
+    def _export_fields(self, model_name: str, field_parser) -> tuple[List[str], str]:
+        raw_structure = self.get_model_structure(model_name)
+        parsed_structure = field_parser.parse_model_structure(raw_structure)
+        primary_field, _, _ = self.get_primary_field_name(model_name, parsed_structure)
+        return self._export_field_names(parsed_structure, field_parser), primary_field
+
+    def _export_field_names(self, parsed_structure: Dict[str, Any], field_parser) -> List[str]:
         fields = ["id"]
         for field in parsed_structure["fields"]:
             if field["name"] in field_parser.metadata_fields:
@@ -70,9 +122,7 @@ class AmplifyClient:
                 if sub_fields:
                     fields.append(f"{field['name']} {{ {' '.join(sub_fields)} }}")
 
-        records = self._executor.get_records(model_name, primary_field, is_secondary_index, fields=fields)
-
-        return records or [], primary_field
+        return fields
 
     def create_record(
         self,
@@ -0,0 +1,63 @@
+"""Authentication backed by an ID token cached from an earlier CLI run.
+
+Kept out of the core package exports because it imports amplify_auth, which pulls in boto3.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+import jwt
+from amplify_auth import AuthenticationProvider
+
+
+def token_expiry(id_token: str) -> Optional[float]:
+    """Return the token's exp claim as a Unix timestamp, or None if it cannot be read."""
+    try:
+        claims = jwt.decode(id_token, options={"verify_signature": False})
+        return float(claims["exp"])
+    except (jwt.PyJWTError, TypeError, ValueError, KeyError):
+        return None
+
+
+class CachedTokenAuthProvider(AuthenticationProvider):
+    """
+    Serves a previously issued ID token; it cannot sign in with a password itself.
+
+    Once the token comes within REAUTHENTICATE_BEFORE_SECONDS of expiry, the reauthenticate callback (a full sign-in,
+    e.g. a password prompt) supplies a new one, so a run that outlasts the cached token keeps working.
+    """
+
+    REAUTHENTICATE_BEFORE_SECONDS = 300
+
+    def __init__(self, id_token: str, reauthenticate: Optional[Callable[[], Optional[str]]] = None):
+        self._id_token = id_token
+        self._expires_at = token_expiry(id_token)
+        self._reauthenticate = reauthenticate
+        # Requests from several threads may find the token expiring at once; only one of them signs in again
+        self._lock = threading.Lock()
+
+    def authenticate(self, username: str, password: str) -> bool:
+        return self.is_authenticated()
+
+    def get_id_token(self) -> Optional[str]:
+        if self._reauthenticate is not None and self._expires_soon():
+            with self._lock:
+                if self._reauthenticate is not None and self._expires_soon():
+                    self._sign_in_again(self._reauthenticate)
+        return self._id_token
+
+    def is_authenticated(self) -> bool:
+        return self._id_token is not None
+
+    def _expires_soon(self) -> bool:
+        return self._expires_at is not None and self._expires_at - time.time() < self.REAUTHENTICATE_BEFORE_SECONDS
+
+    def _sign_in_again(self, reauthenticate: Callable[[], Optional[str]]) -> None:
+        id_token = reauthenticate()
+        if id_token:
+            self._id_token = id_token
+            self._expires_at = token_expiry(id_token)
+        else:
+            # Keep serving the current token rather than prompting again on every request
+            self._reauthenticate = None
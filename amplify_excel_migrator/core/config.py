@@ -2,9 +2,11 @@
 
 import json
 import logging
+import os
+import time
 from getpass import getpass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,10 @@ class ConfigManager:
 
     DEFAULT_CONFIG_DIR = Path.home() / ".amplify-migrator"
     DEFAULT_CONFIG_FILE = "config.json"
+    TOKEN_FILE = "token.json"
+
+    # Cached tokens this close to expiry are not reused, so a command does not start with a token that lapses mid-run
+    TOKEN_MIN_TTL_SECONDS = 300
 
     SENSITIVE_KEYS = {"password", "ADMIN_PASSWORD"}
 
@@ -24,15 +30,23 @@ class ConfigManager:
             self.config_path = self.DEFAULT_CONFIG_DIR / self.DEFAULT_CONFIG_FILE
 
         self._config: Dict[str, Any] = {}
+        # mtime of the file contents currently held in _config; None means _config is not known to match the file
+        self._loaded_mtime: Optional[int] = None
 
     def load(self) -> Dict[str, Any]:
-        if not self.config_path.exists():
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             logger.debug(f"Config file not found at {self.config_path}")
             return {}
 
+        if mtime == self._loaded_mtime:
+            return self._config
+
         try:
             with open(self.config_path, "r") as f:
                 self._config = json.load(f)
+                self._loaded_mtime = mtime
                 logger.debug(f"Loaded configuration from {self.config_path}")
                 return self._config
         except Exception as e:
@@ -48,6 +62,7 @@ class ConfigManager:
             json.dump(sanitized_config, f, indent=2)
 
         self._config = sanitized_config
+        self._loaded_mtime = self.config_path.stat().st_mtime_ns
         logger.info(f"✅ Configuration saved to {self.config_path}")
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -59,6 +74,7 @@ class ConfigManager:
         if not self._config:
             self.load()
         self._config[key] = value
+        self._loaded_mtime = None
 
     def update(self, updates: Dict[str, Any]) -> None:
         if not self._config:
@@ -89,11 +105,57 @@ class ConfigManager:
 
         return self.prompt_for_value(prompt_text, default, secret)
 
+    def get_or_prompt_many(self, specs: Iterable[Tuple[str, str, str]]) -> Dict[str, str]:
+        """Resolve several (key, prompt_text, default) specs against one config snapshot, prompting in order."""
+        if not self._config:
+            self.load()
+
+        return {
+            key: self._config[key] if key in self._config else self.prompt_for_value(prompt_text, default)
+            for key, prompt_text, default in specs
+        }
+
+    @property
+    def token_path(self) -> Path:
+        return self.config_path.with_name(self.TOKEN_FILE)
+
+    def save_token(self, identity: str, id_token: str, expires_at: float) -> None:
+        """Persist an ID token for reuse by later runs, readable only by the current user."""
+        self.token_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # The mode passed to os.open only applies when the file is created, so tighten an existing file too
+        os.chmod(self.token_path, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"identity": identity, "id_token": id_token, "expires_at": expires_at}, f)
+
+    def load_token(self, identity: str) -> Optional[str]:
+        """Return the cached ID token for this identity if it is still valid for at least TOKEN_MIN_TTL_SECONDS."""
+        try:
+            with open(self.token_path, "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("identity") != identity:
+            return None
+        expires_at = cached.get("expires_at")
+        if not isinstance(expires_at, (int, float)) or expires_at - time.time() < self.TOKEN_MIN_TTL_SECONDS:
+            return None
+
+        id_token: Optional[str] = cached.get("id_token")
+        return id_token
+
+    def clear_token(self) -> None:
+        if self.token_path.exists():
+            self.token_path.unlink()
+
     def exists(self) -> bool:
         return self.config_path.exists()
 
     def clear(self) -> None:
         self._config = {}
+        self._loaded_mtime = None
+        self.clear_token()
         if self.config_path.exists():
             self.config_path.unlink()
             logger.info(f"Configuration cleared from {self.config_path}")
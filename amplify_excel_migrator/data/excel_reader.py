@@ -1,14 +1,18 @@
 """Excel file reading functionality."""
 
+import importlib.util
 import logging
 import warnings
 from contextlib import contextmanager
-from typing import Dict, Iterator, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# python-calamine (the "fast" extra) parses xlsx in Rust, several times faster and leaner than openpyxl
+_CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
 
 @contextmanager
 def _suppress_openpyxl_extension_warning() -> Iterator[None]:
@@ -29,17 +33,23 @@ class ExcelReader:
 
     def read_all_sheets(self) -> Dict[str, pd.DataFrame]:
         logger.info(f"Reading Excel file: {self.file_path}")
-        try:
-            with _suppress_openpyxl_extension_warning():
-                all_sheets: Dict[str, pd.DataFrame] = pd.read_excel(self.file_path, sheet_name=None)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Excel file not found: {self.file_path}")
+        all_sheets: Dict[str, pd.DataFrame] = self._read_excel(sheet_name=None)
         logger.info(f"Loaded {len(all_sheets)} sheets from Excel")
         return all_sheets
 
     def read_sheet(self, sheet_name: str) -> pd.DataFrame:
         logger.info(f"Reading sheet '{sheet_name}' from Excel file: {self.file_path}")
+        return self._read_excel(sheet_name=sheet_name)
+
+    def _read_excel(self, sheet_name: Optional[str]) -> Any:
         try:
+            if _CALAMINE_AVAILABLE:
+                try:
+                    return pd.read_excel(self.file_path, sheet_name=sheet_name, engine="calamine")
+                except FileNotFoundError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"calamine could not read {self.file_path} ({e}), falling back to openpyxl")
             with _suppress_openpyxl_extension_warning():
                 return pd.read_excel(self.file_path, sheet_name=sheet_name)
         except FileNotFoundError:
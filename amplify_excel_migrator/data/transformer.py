@@ -2,6 +2,8 @@
 
 import logging
 import re
+from functools import lru_cache
+from itertools import repeat
 from typing import Dict, Any, Optional, List, Tuple
 
 import pandas as pd
@@ -12,6 +14,22 @@ from amplify_excel_migrator.data.similarity import closest
 
 logger = logging.getLogger(__name__)
 
+# Header normalization runs for every column of every sheet, so its patterns are compiled once
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+_WORD_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+def _is_missing(value: Any) -> bool:
+    """pd.isna for a single cell, answering text, integer and float cells without pandas' scalar dispatch."""
+    if value is None:
+        return True
+    if isinstance(value, (str, int)):
+        return False
+    if isinstance(value, float):
+        # NaN is the only float that is not equal to itself; also covers numpy float64 cells
+        return bool(value != value)
+    return bool(pd.isna(value))
+
 
 class FieldParseError(ValueError):
     def __init__(
@@ -56,16 +74,24 @@ class DataTransformer:
         records = []
         row_dict_by_primary = {}
         failed_rows = []
-        row_count = 0
-
-        for row_dict in df.to_dict("records"):
-            row_count += 1
+        resolved_fk_columns = self.resolve_foreign_key_columns(df, parsed_model_structure, fk_lookup_cache)
+        fk_names = list(resolved_fk_columns)
+        planned_structure = {
+            **parsed_model_structure,
+            "fields": self._plan_fields(df.columns, parsed_model_structure["fields"]),
+        }
+        # One tuple of resolved IDs per row, walked in step with the rows instead of indexing every column per row
+        fk_rows = zip(*resolved_fk_columns.values()) if fk_names else repeat(())
+
+        # Rows are never mutated downstream (the failure tracker copies before editing), so they are shared as-is
+        for row_count, (row_dict, fk_ids) in enumerate(zip(df.to_dict("records"), fk_rows), start=1):
             primary_field_value = row_dict.get(primary_field, f"Row {row_count}")
 
-            row_dict_by_primary[str(primary_field_value)] = row_dict.copy()
+            row_dict_by_primary[str(primary_field_value)] = row_dict
+            resolved_fks = dict(zip(fk_names, fk_ids))
 
             try:
-                record = self.transform_row_to_record(row_dict, parsed_model_structure, fk_lookup_cache)
+                record = self.transform_row_to_record(row_dict, planned_structure, fk_lookup_cache, resolved_fks)
                 if record:
                     records.append(record)
             except Exception as e:
@@ -89,18 +115,87 @@ class DataTransformer:
 
         return records, row_dict_by_primary, failed_rows
 
+    def _plan_fields(self, columns: Any, fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Specialize the model's fields to one sheet.
+
+        Every row of a sheet has the same columns, so the column each field reads and, for foreign keys, the related
+        model are resolved once here rather than by parse_input on every row. Optional fields whose column is absent
+        from the sheet would parse to None on every row, so they are left out of the plan entirely.
+        """
+        planned = []
+        for field in fields:
+            column = self._column_for_field(field, columns)
+            if column not in columns and not field["is_required"] and not field.get("is_custom_type"):
+                continue
+            field = {**field, "column": column}
+            if field["is_id"]:
+                field["related_model"] = self._get_related_model(field)
+            planned.append(field)
+        return planned
+
+    @staticmethod
+    def _column_for_field(field: Dict[str, Any], columns: Any) -> str:
+        if not field["is_id"]:
+            return str(field["name"])
+
+        column = str(field["name"]).removesuffix("Id")
+        # Also accept the full field name with Id suffix (e.g. reporterId as well as reporter)
+        if column not in columns and field["name"] in columns:
+            return str(field["name"])
+        return column
+
+    def resolve_foreign_key_columns(
+        self,
+        df: pd.DataFrame,
+        parsed_model_structure: Dict[str, Any],
+        fk_lookup_cache: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, List[Any]]:
+        """
+        Resolve every foreign key column to record IDs in one pass per column.
+
+        Each distinct value is looked up once and mapped back onto the column, so the per-row path only picks up the
+        result. Entries are None where the value is missing or unknown; those rows go through parse_input's regular
+        handling, which reports the error with its closest matches.
+        """
+        resolved: Dict[str, List[Any]] = {}
+
+        for field in parsed_model_structure["fields"]:
+            if not field["is_id"] or field.get("is_custom_type"):
+                continue
+
+            column = self._column_for_field(field, df.columns)
+            if column not in df.columns:
+                continue
+
+            related_model = self._get_related_model(field)
+            if related_model not in fk_lookup_cache:
+                continue
+
+            lookup: Dict[str, str] = fk_lookup_cache[related_model]["lookup"]
+            values = df[column]
+            ids_by_value = {
+                value: lookup.get(str(self.field_parser.clean_input(value))) for value in values.dropna().unique()
+            }
+            resolved[field["name"]] = [
+                record_id if isinstance(record_id, str) else None for record_id in values.map(ids_by_value)
+            ]
+
+        return resolved
+
     def transform_row_to_record(
         self,
         row_dict: Dict,
         parsed_model_structure: Dict[str, Any],
         fk_lookup_cache: Dict[str, Dict[str, Any]],
+        resolved_fks: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict]:
         model_record = {}
         field_errors: List[FieldError] = []
 
         for field in parsed_model_structure["fields"]:
             try:
-                input_value = self.parse_input(row_dict, field, fk_lookup_cache)
+                input_value = self.parse_input(row_dict, field, fk_lookup_cache, resolved_fks)
                 if input_value is not None:
                     model_record[field["name"]] = input_value
             except FieldParseError as e:
@@ -122,12 +217,9 @@ class DataTransformer:
         row_dict: Dict,
         field: Dict[str, Any],
         fk_lookup_cache: Dict[str, Dict[str, Any]],
+        resolved_fks: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        field_name = field["name"][:-2] if field["is_id"] else field["name"]
-
-        # Also accept the full field name with Id suffix (e.g. reporterId as well as reporter)
-        if field["is_id"] and field_name not in row_dict and field["name"] in row_dict:
-            field_name = field["name"]
+        field_name = field.get("column") or self._column_for_field(field, row_dict)
 
         if field.get("is_custom_type"):
             custom_type_fields = field.get("custom_type_fields", [])
@@ -135,7 +227,7 @@ class DataTransformer:
                 pd.Series(row_dict), custom_type_fields, field["type"], self.fill_unknown
             )
 
-        if field_name not in row_dict or pd.isna(row_dict[field_name]):
+        if field_name not in row_dict or _is_missing(row_dict[field_name]):
             if field["is_required"]:
                 if field["is_id"] and self.default_fk_values:
                     related_model = self._get_related_model(field)
@@ -151,6 +243,9 @@ class DataTransformer:
                 )
             return None
 
+        if field["is_id"] and resolved_fks and resolved_fks.get(field["name"]):
+            return resolved_fks[field["name"]]
+
         value = self.field_parser.clean_input(row_dict[field_name])
 
         if field["is_id"]:
@@ -172,7 +267,7 @@ class DataTransformer:
     def _get_related_model(field: Dict[str, Any]) -> str:
         if "related_model" in field:
             return str(field["related_model"])
-        temp = str(field["name"])[:-2]
+        temp = str(field["name"]).removesuffix("Id")
         return temp[0].upper() + temp[1:]
 
     @staticmethod
@@ -195,7 +290,7 @@ class DataTransformer:
         field: Dict[str, Any], value: Any, fk_lookup_cache: Dict[str, Dict[str, Any]]
     ) -> Optional[str]:
         related_model = DataTransformer._get_related_model(field)
-        column_name = field["name"][:-2] if field["name"].endswith("Id") else field["name"]
+        column_name = field["name"].removesuffix("Id")
 
         if related_model in fk_lookup_cache:
             lookup_dict: Dict[str, str] = fk_lookup_cache[related_model]["lookup"]
@@ -218,8 +313,10 @@ class DataTransformer:
         else:
             raise ValueError(f"No pre-fetched data for '{column_name}'")
 
+    # Memoized because the same headers recur across sheets and across passes of the agent's header matching
     @staticmethod
+    @lru_cache(maxsize=4096)
     def to_camel_case(s: str) -> str:
-        s_with_spaces = re.sub(r"(?<!^)(?=[A-Z])", " ", s)
-        parts = re.split(r"[\s_\-]+", s_with_spaces.strip())
+        s_with_spaces = _CAMEL_BOUNDARY.sub(" ", s)
+        parts = _WORD_SEPARATORS.split(s_with_spaces.strip())
         return parts[0].lower() + "".join(word.capitalize() for word in parts[1:])
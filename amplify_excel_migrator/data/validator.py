@@ -17,7 +17,7 @@ class RecordValidator:
             if not field["is_required"]:
                 continue
 
-            field_name = field["name"][:-2] if field["is_id"] else field["name"]
+            field_name = field["name"].removesuffix("Id") if field["is_id"] else field["name"]
 
             if field_name not in row_dict or pd.isna(row_dict[field_name]):
                 errors.append(f"Required field '{field_name}' is missing")
@@ -33,7 +33,7 @@ class RecordValidator:
         if "related_model" in field:
             related_model = field["related_model"]
         else:
-            related_model = (temp := field["name"][:-2])[0].upper() + temp[1:]
+            related_model = (temp := field["name"].removesuffix("Id"))[0].upper() + temp[1:]
 
         if related_model not in fk_lookup_cache:
             if field["is_required"]:
@@ -1,15 +1,23 @@
 """GraphQL HTTP client for making requests to GraphQL APIs."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import random
+import time
+from typing import Dict, Any, Optional, Tuple, Type
 
 import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from amplify_auth import AuthenticationProvider
 
 logger = logging.getLogger(__name__)
 
+# Cells read through pandas can surface as numpy scalars (e.g. int64), which orjson rejects without this option
+_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
 
 class AuthenticationError(Exception):
     """Raised when authentication is required but not completed"""
@@ -24,31 +32,120 @@ class GraphQLError(Exception):
 
 
 class GraphQLClient:
+    REQUEST_TIMEOUT = 30
+    MAX_RETRIES = 5
+    RETRY_INITIAL_DELAY = 0.5
+    RETRY_MAX_DELAY = 30.0
+    # Sized above the default of 10 so export-data and FK lookups fetching from several threads keep their
+    # keep-alive connections instead of discarding them when the pool is full
+    POOL_MAXSIZE = 32
+
     def __init__(self, api_endpoint: str, auth_provider: Optional[AuthenticationProvider] = None):
         self.api_endpoint = api_endpoint
         self.auth_provider = auth_provider
+        # Reused so synchronous requests share pooled keep-alive connections instead of a new TLS handshake each
+        self._requests_session = requests.Session()
+        # Retries stay in _post, which also retries 5xx responses, so the adapter itself never retries
+        adapter = HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE, max_retries=0)
+        self._requests_session.mount("https://", adapter)
+        self._requests_session.mount("http://", adapter)
+        self._headers: Optional[Dict[str, str]] = None
+
+    def _auth_headers(self, auth_provider: AuthenticationProvider) -> Dict[str, str]:
+        """Return request headers, rebuilt only when the provider hands out a new (refreshed) token."""
+        id_token = auth_provider.get_id_token()
+        if self._headers is None or self._headers["Authorization"] != id_token:
+            self._headers = {"Authorization": id_token, "Content-Type": "application/json"}
+        return self._headers
+
+    def _retry_delay(self, attempt: int) -> float:
+        # Full jitter keeps concurrent batches that failed together from retrying in lockstep
+        return random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_INITIAL_DELAY * 2**attempt))
+
+    def _post(
+        self, headers: Dict[str, str], data: bytes, context_msg: str, idempotent: bool = True
+    ) -> requests.Response:
+        """
+        POST the payload, retrying connection failures and 5xx responses with exponential backoff.
+
+        Non-idempotent requests are only retried when the connection could not be established, since a 5xx response
+        or dropped connection may come after the server already applied the mutation.
+        """
+        retryable_errors: Tuple[Type[Exception], ...] = (
+            (requests.exceptions.ConnectionError,) if idempotent else (requests.exceptions.ConnectTimeout,)
+        )
+        attempt = 0
+        while True:
+            try:
+                response = self._requests_session.post(
+                    self.api_endpoint, headers=headers, data=data, timeout=self.REQUEST_TIMEOUT
+                )
+                if response.status_code < 500 or not idempotent or attempt == self.MAX_RETRIES:
+                    return response
+                reason = f"HTTP {response.status_code}"
+            except retryable_errors as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                reason = str(e)
+
+            delay = self._retry_delay(attempt)
+            logger.warning(f"Retrying request{context_msg} in {delay:.1f}s after {reason}")
+            time.sleep(delay)
+            attempt += 1
+
+    async def _post_async(
+        self,
+        session: aiohttp.ClientSession,
+        headers: Dict[str, str],
+        data: bytes,
+        context_msg: str,
+        idempotent: bool = True,
+    ) -> Tuple[int, bytes]:
+        """Async counterpart of _post, returning the status and raw body of the final attempt."""
+        retryable_errors: Tuple[Type[Exception], ...] = (
+            (aiohttp.ClientConnectorError, aiohttp.ServerDisconnectedError)
+            if idempotent
+            else (aiohttp.ClientConnectorError,)
+        )
+        attempt = 0
+        while True:
+            try:
+                async with session.post(self.api_endpoint, headers=headers, data=data) as response:
+                    body = await response.read()
+                    if response.status < 500 or not idempotent or attempt == self.MAX_RETRIES:
+                        return response.status, body
+                    reason = f"HTTP {response.status}"
+            except retryable_errors as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                reason = str(e)
+
+            delay = self._retry_delay(attempt)
+            logger.warning(f"Retrying request{context_msg} in {delay:.1f}s after {reason}")
+            await asyncio.sleep(delay)
+            attempt += 1
 
     def request(
         self,
         query: str,
         variables: Optional[Dict[str, Any]] = None,
         context: Optional[str] = None,
+        idempotent: bool = True,
     ) -> Optional[Dict[str, Any]]:
         if not self.auth_provider or not self.auth_provider.is_authenticated():
             raise AuthenticationError("Not authenticated. Call authenticate() on the auth provider first.")
 
-        id_token = self.auth_provider.get_id_token()
-        headers = {"Authorization": id_token, "Content-Type": "application/json"}
+        headers = self._auth_headers(self.auth_provider)
 
         payload: Dict[str, Any] = {"query": query, "variables": variables or {}}
 
         context_msg = f" [{context}]" if context else ""
 
         try:
-            response = requests.post(self.api_endpoint, headers=headers, json=payload)
+            response = self._post(headers, orjson.dumps(payload, option=_DUMPS_OPTIONS), context_msg, idempotent)
 
             if response.status_code == 200:
-                result: Dict[str, Any] = response.json()
+                result: Dict[str, Any] = orjson.loads(response.content)
 
                 if "errors" in result:
                     raise GraphQLError(f"GraphQL errors{context_msg}: {result['errors']}")
@@ -75,6 +172,10 @@ class GraphQLClient:
             logger.error(str(e))
             return None
 
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON response{context_msg}: {e}")
+            return None
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error{context_msg}: {e}")
             return None
@@ -85,31 +186,42 @@ class GraphQLClient:
         query: str,
         variables: Optional[Dict[str, Any]] = None,
         context: Optional[str] = None,
+        allow_partial_errors: bool = False,
+        idempotent: bool = True,
     ) -> Optional[Dict[str, Any]]:
+        """
+        Send a request on an aiohttp session.
+
+        With allow_partial_errors, a response carrying both data and errors is returned instead of raising, so
+        callers of multi-field operations can attribute each error to its field through the error path. Pass
+        idempotent=False for mutations so they are not re-sent after the server may already have applied them.
+        """
         if not self.auth_provider or not self.auth_provider.is_authenticated():
             raise AuthenticationError("Not authenticated. Call authenticate() on the auth provider first.")
 
-        id_token = self.auth_provider.get_id_token()
-        headers = {"Authorization": id_token, "Content-Type": "application/json"}
+        headers = self._auth_headers(self.auth_provider)
 
         payload: Dict[str, Any] = {"query": query, "variables": variables or {}}
 
         context_msg = f" [{context}]" if context else ""
 
         try:
-            async with session.post(self.api_endpoint, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    result: Dict[str, Any] = await response.json()
+            status, body = await self._post_async(
+                session, headers, orjson.dumps(payload, option=_DUMPS_OPTIONS), context_msg, idempotent
+            )
+            if status == 200:
+                result: Dict[str, Any] = orjson.loads(body)
 
-                    if "errors" in result:
-                        raise GraphQLError(f"GraphQL errors{context_msg}: {result['errors']}")
+                if "errors" in result:
+                    if allow_partial_errors and result.get("data"):
+                        return result
+                    raise GraphQLError(f"GraphQL errors{context_msg}: {result['errors']}")
 
-                    return result
-                else:
-                    text = await response.text()
-                    error_msg = f"HTTP Error {response.status}{context_msg}: {text}"
-                    logger.error(error_msg)
-                    raise aiohttp.ClientError(error_msg)
+                return result
+            else:
+                error_msg = f"HTTP Error {status}{context_msg}: {body.decode(errors='replace')}"
+                logger.error(error_msg)
+                raise aiohttp.ClientError(error_msg)
 
         except aiohttp.ServerTimeoutError as e:
             error_msg = f"Request timeout{context_msg}: {e}"
@@ -135,6 +247,11 @@ class GraphQLClient:
             logger.error(str(e))
             raise
 
+        except orjson.JSONDecodeError as e:
+            error_msg = f"Invalid JSON response{context_msg}: {e}"
+            logger.error(error_msg)
+            raise aiohttp.ClientError(error_msg)
+
         except aiohttp.ClientError as e:
             error_msg = f"Client error{context_msg}: {e}"
             logger.error(error_msg)
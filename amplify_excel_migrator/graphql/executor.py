@@ -2,34 +2,100 @@
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, List, Set, Tuple
 
 import aiohttp
+import orjson
 
-from .client import GraphQLClient
+from .client import GraphQLClient, GraphQLError
 from .query_builder import QueryBuilder
 from .mutation_builder import MutationBuilder
-from amplify_excel_migrator.schema import SchemaIntrospector
+from amplify_excel_migrator.schema.field_parser import FieldParser
 
 logger = logging.getLogger(__name__)
 
+# Keeps batched mutation payloads well below the AppSync request size limit
+MAX_MUTATION_PAYLOAD_BYTES = 1_000_000
+
+
+class LRURecordsCache(OrderedDict):
+    """Records cache that evicts the least recently used model once it holds more than maxsize entries."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        # Listings are fetched from worker threads; a read must not reorder entries while a write is evicting
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        # Checks and reads under one lock, so an eviction from another thread cannot land in between
+        with self._lock:
+            if key not in self:
+                return default
+            return self[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                evicted, _ = self.popitem(last=False)
+                logger.debug(f"Evicted cached records for {evicted}")
+
 
 class QueryExecutor:
+    # Related models are listed in parallel when building FK lookups; each listing is its own pagination chain
+    FK_FETCH_CONCURRENCY = 8
+
     def __init__(
         self,
         client: GraphQLClient,
         batch_size: int = 20,
         composite_unique_fields: Optional[Dict[str, List[str]]] = None,
+        max_concurrent_batches: int = 4,
+        records_cache_size: Optional[int] = None,
     ):
         self.client = client
         self.batch_size = batch_size
-        self.records_cache: Dict[str, List[Dict]] = {}
+        self.max_concurrent_batches = max_concurrent_batches
+        # Unbounded by default; records_cache_size caps how many models' listings stay in memory
+        self.records_cache: Dict[str, List[Dict]] = (
+            LRURecordsCache(records_cache_size) if records_cache_size is not None else {}
+        )
+        # schema.introspector imports this package, so importing it at module level would be circular
+        from amplify_excel_migrator.schema.introspector import SchemaIntrospector
+
         self.schema = SchemaIntrospector(client)
         self.composite_unique_fields: Dict[str, List[str]] = composite_unique_fields or {}
+        # Operation strings keyed by their shape, so the hot upload path formats each one once
+        self._operation_cache: Dict[Tuple, str] = {}
+        # FK lookups per related model, reused by every sheet that references it until the model is uploaded to
+        self._fk_lookup_cache: Dict[str, Dict[str, Any]] = {}
+        # One lock per related model, so concurrent callers wait for a listing in flight instead of repeating it
+        self._fk_fetch_locks: Dict[str, threading.Lock] = {}
+        self._fk_fetch_locks_guard = threading.Lock()
+
+    def _cached_operation(self, key: Tuple, build: Callable[[], str]) -> str:
+        operation = self._operation_cache.get(key)
+        if operation is None:
+            operation = self._operation_cache[key] = build()
+        return operation
 
     def get_model_structure(self, model_type: str) -> Dict[str, Any]:
         return self.schema.get_model_structure(model_type)
 
+    def prefetch_model_structures(self, model_types: List[str]) -> None:
+        self.schema.prefetch_model_structures(model_types)
+
     def get_all_types(self) -> list[Dict[str, Any]]:
         return self.schema.get_all_types()
 
@@ -42,6 +108,90 @@ class QueryExecutor:
     def _get_list_query_name(self, model_name: str) -> Optional[str]:
         return self.schema.get_list_query_name(model_name)
 
+    def _list_query(self, model_name: str, fields: Optional[List[str]], query_name: Optional[str]) -> str:
+        return self._cached_operation(
+            ("list", model_name, query_name, *(fields if fields is not None else ["id"])),
+            lambda: QueryBuilder.build_list_query(model_name, fields=fields, query_name=query_name),
+        )
+
+    def _iter_pages(
+        self,
+        query: str,
+        query_name: str,
+        build_variables: Callable[[Optional[str]], Dict[str, Any]],
+    ) -> Iterator[List[Dict]]:
+        """Yield each page of items, following nextToken. Raises GraphQLError when a page cannot be fetched."""
+        next_token = None
+
+        while True:
+            result = self.client.request(query, build_variables(next_token))
+            if not result or "data" not in result:
+                raise GraphQLError(f"Failed to fetch a page of {query_name}")
+
+            data = result["data"].get(query_name) or {}
+            yield data.get("items", [])
+            next_token = data.get("nextToken")
+
+            if not next_token:
+                return
+
+    def _paginate(
+        self,
+        query: str,
+        query_name: str,
+        build_variables: Callable[[Optional[str]], Dict[str, Any]],
+    ) -> tuple[List[Dict], bool]:
+        """Collect every page. The flag is False when a page request failed."""
+        all_items: List[Dict] = []
+        try:
+            for items in self._iter_pages(query, query_name, build_variables):
+                all_items.extend(items)
+        except GraphQLError:
+            return all_items, False
+        return all_items, True
+
+    def iter_records(
+        self,
+        model_name: str,
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream every record of a model, one page at a time, stopping after `limit` records when it is given.
+
+        Unlike get_records, nothing is buffered or cached, so consumers can build their own structures incrementally.
+        Raises GraphQLError if the model has no list query or a page cannot be fetched.
+        """
+        query_name = self._get_list_query_name(model_name)
+        if not query_name:
+            raise GraphQLError(f"No list query found for model {model_name}")
+
+        remaining = limit
+        if remaining is not None and remaining <= 0:
+            return
+
+        def build_variables(token: Optional[str]) -> Dict[str, Any]:
+            size = page_size if remaining is None else min(page_size, remaining)
+            return QueryBuilder.build_variables_for_list(limit=size, next_token=token)
+
+        query = self._list_query(model_name, fields, query_name)
+        for items in self._iter_pages(query, query_name, build_variables):
+            if remaining is None:
+                yield from items
+                continue
+            yield from items[:remaining]
+            remaining -= min(len(items), remaining)
+            if not remaining:
+                return
+
+    @staticmethod
+    def _no_list_query(model_name: str, strict: bool) -> None:
+        # The introspector has already logged the names it tried
+        if strict:
+            raise GraphQLError(f"No list query found for model {model_name}")
+        return None
+
     def list_records_by_secondary_index(
         self,
         model_name: str,
@@ -49,55 +199,40 @@ class QueryExecutor:
         value: Optional[str] = None,
         fields: Optional[List[str]] = None,
         field_type: str = "String",
+        strict: bool = False,
     ) -> Optional[List[Dict]]:
+        """With strict=True, raise GraphQLError instead of returning a listing cut short by a failed page."""
         if fields is None:
             fields = ["id", secondary_index]
 
-        all_items = []
-        next_token = None
-
         if not value:
             query_name = self._get_list_query_name(model_name)
-            query = QueryBuilder.build_list_query(model_name, fields=fields, query_name=query_name)
-
-            while True:
-                variables = QueryBuilder.build_variables_for_list(next_token=next_token)
-                result = self.client.request(query, variables)
-
-                if result and "data" in result:
-                    data = result["data"].get(query_name, {})
-                    items = data.get("items", [])
-                    all_items.extend(items)
-                    next_token = data.get("nextToken")
-
-                    if not next_token:
-                        break
-                else:
-                    break
+            if not query_name:
+                return self._no_list_query(model_name, strict)
+            query = self._list_query(model_name, fields, query_name)
+            all_items, complete = self._paginate(
+                query, query_name, lambda token: QueryBuilder.build_variables_for_list(next_token=token)
+            )
         else:
-            query = QueryBuilder.build_secondary_index_query(
-                model_name, secondary_index, fields=fields, field_type=field_type
+            query = self._cached_operation(
+                ("list_index", model_name, secondary_index, field_type, *fields),
+                lambda: QueryBuilder.build_secondary_index_query(
+                    model_name, secondary_index, fields=fields, field_type=field_type
+                ),
             )
             query_name = f"list{model_name}By{secondary_index[0].upper() + secondary_index[1:]}"
+            all_items, complete = self._paginate(
+                query,
+                query_name,
+                lambda token: QueryBuilder.build_variables_for_secondary_index(
+                    secondary_index, value, next_token=token
+                ),
+            )
 
-            while True:
-                variables = {
-                    secondary_index: value,
-                    "limit": 1000,
-                    "nextToken": next_token,
-                }
-                result = self.client.request(query, variables)
-
-                if result and "data" in result:
-                    data = result["data"].get(query_name, {})
-                    items = data.get("items", [])
-                    all_items.extend(items)
-                    next_token = data.get("nextToken")
-
-                    if not next_token:
-                        break
-                else:
-                    break
+        if strict and not complete:
+            raise GraphQLError(
+                f"Incomplete listing of {model_name}: fetched {len(all_items)} records before a page failed"
+            )
 
         return all_items if all_items else None
 
@@ -107,53 +242,37 @@ class QueryExecutor:
         field_name: str,
         value: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        strict: bool = False,
     ) -> Optional[List[Dict]]:
+        """With strict=True, raise GraphQLError instead of returning a listing cut short by a failed page."""
         if fields is None:
             fields = ["id", field_name]
 
-        all_items = []
-        next_token = None
         query_name = self._get_list_query_name(model_name)
+        if not query_name:
+            return self._no_list_query(model_name, strict)
 
         if not value:
-            query = QueryBuilder.build_list_query(model_name, fields=fields, query_name=query_name)
-
-            while True:
-                variables = QueryBuilder.build_variables_for_list(next_token=next_token)
-                result = self.client.request(query, variables)
-
-                if result and "data" in result:
-                    data = result["data"].get(query_name, {})
-                    items = data.get("items", [])
-                    all_items.extend(items)
-                    next_token = data.get("nextToken")
-
-                    if not next_token:
-                        break
-                else:
-                    break
+            query = self._list_query(model_name, fields, query_name)
+            all_items, complete = self._paginate(
+                query, query_name, lambda token: QueryBuilder.build_variables_for_list(next_token=token)
+            )
         else:
-            query = QueryBuilder.build_list_query_with_filter(model_name, fields=fields, query_name=query_name)
+            query = self._cached_operation(
+                ("list_filter", model_name, query_name, *fields),
+                lambda: QueryBuilder.build_list_query_with_filter(model_name, fields=fields, query_name=query_name),
+            )
             filter_input = QueryBuilder.build_filter_equals(field_name, value)
+            all_items, complete = self._paginate(
+                query,
+                query_name,
+                lambda token: QueryBuilder.build_variables_for_filter(filter_input, next_token=token),
+            )
 
-            while True:
-                variables = {
-                    "filter": filter_input,
-                    "limit": 1000,
-                    "nextToken": next_token,
-                }
-                result = self.client.request(query, variables)
-
-                if result and "data" in result:
-                    data = result["data"].get(query_name, {})
-                    items = data.get("items", [])
-                    all_items.extend(items)
-                    next_token = data.get("nextToken")
-
-                    if not next_token:
-                        break
-                else:
-                    break
+        if strict and not complete:
+            raise GraphQLError(
+                f"Incomplete listing of {model_name}: fetched {len(all_items)} records before a page failed"
+            )
 
         return all_items if all_items else None
 
@@ -161,7 +280,9 @@ class QueryExecutor:
         if fields is None:
             fields = ["id"]
 
-        query = QueryBuilder.build_get_by_id_query(model_name, fields=fields)
+        query = self._cached_operation(
+            ("get_by_id", model_name, *fields), lambda: QueryBuilder.build_get_by_id_query(model_name, fields=fields)
+        )
         query_name = f"get{model_name}"
 
         result = self.client.request(query, {"id": record_id})
@@ -178,17 +299,19 @@ class QueryExecutor:
         primary_field: Optional[str] = None,
         is_secondary_index: Optional[bool] = None,
         fields: Optional[List[str]] = None,
+        strict: bool = False,
     ) -> Optional[List[Dict]]:
-        if model_name in self.records_cache:
-            return self.records_cache[model_name]
+        cached = self.records_cache.get(model_name)
+        if cached is not None:
+            return cached
 
         if not primary_field:
             return None
 
         if is_secondary_index:
-            records = self.list_records_by_secondary_index(model_name, primary_field, fields=fields)
+            records = self.list_records_by_secondary_index(model_name, primary_field, fields=fields, strict=strict)
         else:
-            records = self.list_records_by_field(model_name, primary_field, fields=fields)
+            records = self.list_records_by_field(model_name, primary_field, fields=fields, strict=strict)
 
         if records:
             self.records_cache[model_name] = records
@@ -228,11 +351,14 @@ class QueryExecutor:
         model_name: str,
         primary_field: str,
     ) -> Optional[Dict]:
-        mutation = MutationBuilder.build_create_mutation(model_name, return_fields=["id", primary_field])
+        mutation = self._cached_operation(
+            ("create", model_name, "id", primary_field),
+            lambda: MutationBuilder.build_create_mutation(model_name, return_fields=["id", primary_field]),
+        )
         variables = MutationBuilder.build_create_variables(data)
 
         context = f"{model_name}: {primary_field}={data.get(primary_field)}"
-        result = await self.client.request_async(session, mutation, variables, context)
+        result = await self.client.request_async(session, mutation, variables, context, idempotent=False)
 
         if result and "data" in result:
             created: Optional[Dict] = result["data"].get(f"create{model_name}")
@@ -244,6 +370,84 @@ class QueryExecutor:
 
         return None
 
+    async def create_records_async(
+        self,
+        session: aiohttp.ClientSession,
+        records: List[Dict],
+        model_name: str,
+        primary_field: str,
+    ) -> List[Any]:
+        """
+        Create several records with one aliased mutation request.
+
+        Returns one entry per record, in order: the created record, an exception describing why it failed, or None
+        when the backend returned nothing for it.
+        """
+        mutation = self._cached_operation(
+            ("batch_create", model_name, primary_field, len(records)),
+            lambda: MutationBuilder.build_batch_create_mutation(
+                model_name, len(records), return_fields=["id", primary_field]
+            ),
+        )
+        variables = MutationBuilder.build_batch_create_variables(records)
+
+        context = f"{model_name}: batch of {len(records)}"
+        try:
+            result = await self.client.request_async(
+                session, mutation, variables, context, allow_partial_errors=True, idempotent=False
+            )
+        except Exception as e:
+            return [e] * len(records)
+
+        data = (result or {}).get("data") or {}
+        # Errors without a path (None key) apply to every record in the batch
+        errors_by_alias: Dict[Optional[str], List[Any]] = {}
+        for error in (result or {}).get("errors", []):
+            path = error.get("path") or [None]
+            errors_by_alias.setdefault(path[0], []).append(error.get("message", error))
+
+        results: List[Any] = []
+        for i, record in enumerate(records):
+            alias = f"r{i}"
+            created = data.get(alias)
+            if created:
+                logger.info(
+                    f'Created {model_name} with {primary_field}="{record[primary_field]}" (ID: {created["id"]})'
+                )
+                results.append(created)
+                continue
+
+            errors = errors_by_alias.get(alias) or errors_by_alias.get(None)
+            if errors:
+                results.append(
+                    GraphQLError(
+                        f"GraphQL errors [{model_name}: {primary_field}={record.get(primary_field)}]: {errors}"
+                    )
+                )
+            else:
+                logger.error(f'Failed to create {model_name} with {primary_field}="{record[primary_field]}"')
+                results.append(None)
+
+        return results
+
+    @staticmethod
+    def _chunk_by_payload_size(records: List[Dict]) -> List[List[Dict]]:
+        chunks: List[List[Dict]] = []
+        current: List[Dict] = []
+        current_size = 0
+
+        for record in records:
+            record_size = len(orjson.dumps(record, default=str))
+            if current and current_size + record_size > MAX_MUTATION_PAYLOAD_BYTES:
+                chunks.append(current)
+                current, current_size = [], 0
+            current.append(record)
+            current_size += record_size
+
+        if current:
+            chunks.append(current)
+        return chunks
+
     @staticmethod
     def _resolve_composite_keys(composite_fields: List[str], record: Dict) -> List[str]:
         resolved = []
@@ -277,12 +481,15 @@ class QueryExecutor:
         fetch_fields = ["id"] + resolved_keys
 
         if is_secondary_index:
-            query = QueryBuilder.build_secondary_index_query(
-                model_name,
-                primary_field,
-                fields=fetch_fields,
-                field_type=field_type,
-                with_pagination=False,
+            query = self._cached_operation(
+                ("check_index", model_name, primary_field, field_type, *fetch_fields),
+                lambda: QueryBuilder.build_secondary_index_query(
+                    model_name,
+                    primary_field,
+                    fields=fetch_fields,
+                    field_type=field_type,
+                    with_pagination=False,
+                ),
             )
             check_variables: Dict[str, Any] = {primary_field: value}
             query_name: str = f"list{model_name}By{primary_field[0].upper() + primary_field[1:]}"
@@ -296,8 +503,11 @@ class QueryExecutor:
                         return None
         else:
             query_name = self._get_list_query_name(model_name) or f"list{model_name}s"
-            query = QueryBuilder.build_list_query_with_filter(
-                model_name, fields=fetch_fields, with_pagination=False, query_name=query_name
+            query = self._cached_operation(
+                ("check_filter", model_name, query_name, *fetch_fields),
+                lambda: QueryBuilder.build_list_query_with_filter(
+                    model_name, fields=fetch_fields, with_pagination=False, query_name=query_name
+                ),
             )
             conditions = [QueryBuilder.build_filter_equals(primary_field, value)]
             conditions += [QueryBuilder.build_filter_equals(key, record.get(key)) for key in resolved_keys]
@@ -313,6 +523,191 @@ class QueryExecutor:
 
         return record
 
+    @staticmethod
+    def _record_key(record: Dict, key_fields: List[str]) -> Tuple:
+        return tuple(record.get(field) for field in key_fields)
+
+    def _resolve_upload_key_fields(
+        self, records: List[Dict], primary_field: str, composite_fields: List[str], model_name: str
+    ) -> Optional[List[str]]:
+        """Return the fields identifying a record, or None when records disagree on them or none resolve."""
+        shapes = set()
+        for record in records:
+            try:
+                shapes.add(tuple(self._resolve_composite_keys(composite_fields, record)))
+            except ValueError:
+                continue
+
+        if len(shapes) > 1:
+            logger.warning(f"{model_name} records disagree on their key fields, checking duplicates per record")
+        if len(shapes) != 1:
+            return None
+
+        return [primary_field, *shapes.pop()]
+
+    def _fetch_existing_keys(self, model_name: str, key_fields: List[str]) -> Optional[Set[Tuple]]:
+        """
+        Fetch the unique keys of every existing record with a single paginated listing.
+
+        Returns None when the listing is incomplete, so callers can fall back to per-record checks.
+        """
+        try:
+            return {self._record_key(item, key_fields) for item in self.iter_records(model_name, ["id", *key_fields])}
+        except GraphQLError as e:
+            logger.debug(f"Existing key listing failed for {model_name}: {e}")
+            return None
+
+    async def check_records_exist_async(
+        self,
+        session: aiohttp.ClientSession,
+        batch: List[Dict],
+        model_name: str,
+        primary_field: str,
+        is_secondary_index: bool,
+        field_type: str = "String",
+        composite_fields: Optional[List[str]] = None,
+    ) -> List[Any]:
+        """
+        Check a batch of records for existing duplicates with one aliased query request.
+
+        Returns one entry per record, in order, matching check_record_exists_async: the record when it is new, None
+        when it already exists, or an exception when it could not be checked.
+        """
+        composite_fields = composite_fields or []
+        results: List[Any] = [None] * len(batch)
+        resolved_keys: Dict[int, List[str]] = {}
+
+        for i, record in enumerate(batch):
+            try:
+                resolved_keys[i] = self._resolve_composite_keys(composite_fields, record)
+            except ValueError as e:
+                results[i] = e
+
+        pending = list(resolved_keys)
+        if not pending:
+            return results
+
+        fetch_fields = ["id", *dict.fromkeys(key for i in pending for key in resolved_keys[i])]
+
+        if is_secondary_index:
+            query = self._cached_operation(
+                ("batch_check_index", model_name, primary_field, field_type, len(pending), *fetch_fields),
+                lambda: QueryBuilder.build_batch_secondary_index_query(
+                    model_name, primary_field, len(pending), fields=fetch_fields, field_type=field_type
+                ),
+            )
+            variables = {f"v{n}": batch[i][primary_field] for n, i in enumerate(pending)}
+        else:
+            query_name = self._get_list_query_name(model_name) or f"list{model_name}s"
+            query = self._cached_operation(
+                ("batch_check_filter", model_name, query_name, len(pending), *fetch_fields),
+                lambda: QueryBuilder.build_batch_list_query_with_filter(
+                    model_name, len(pending), fields=fetch_fields, query_name=query_name
+                ),
+            )
+            variables = {}
+            for n, i in enumerate(pending):
+                conditions = [QueryBuilder.build_filter_equals(primary_field, batch[i][primary_field])]
+                conditions += [QueryBuilder.build_filter_equals(key, batch[i].get(key)) for key in resolved_keys[i]]
+                variables[f"f{n}"] = conditions[0] if len(conditions) == 1 else {"and": conditions}
+
+        context = f"{model_name}: duplicate check for {len(pending)} records"
+        try:
+            result = await self.client.request_async(session, query, variables, context, allow_partial_errors=True)
+        except Exception as e:
+            for i in pending:
+                results[i] = e
+            return results
+
+        data = (result or {}).get("data") or {}
+        errors = (result or {}).get("errors", [])
+
+        for n, i in enumerate(pending):
+            record = batch[i]
+            listing = data.get(f"c{n}")
+            if listing is None:
+                results[i] = GraphQLError(
+                    f"GraphQL errors [{model_name}: {primary_field}={record[primary_field]}]: {errors}"
+                )
+                continue
+
+            # Filtered listings already match the composite keys server-side
+            keys = resolved_keys[i] if is_secondary_index else []
+            if any(self._item_matches_record(item, keys, record) for item in listing.get("items", [])):
+                logger.warning(f'Record with {primary_field}="{record[primary_field]}" already exists in {model_name}')
+            else:
+                results[i] = record
+
+        return results
+
+    async def _filter_existing_remote(
+        self,
+        session: aiohttp.ClientSession,
+        batch: List[Dict],
+        model_name: str,
+        primary_field: str,
+        is_secondary_index: bool,
+        field_type: str,
+        composite_fields: Optional[List[str]],
+        failed_records: List[Dict],
+    ) -> List[Dict]:
+        check_results = await self.check_records_exist_async(
+            session, batch, model_name, primary_field, is_secondary_index, field_type, composite_fields
+        )
+
+        filtered_batch: List[Dict] = []
+        for i, result in enumerate(check_results):
+            if isinstance(result, BaseException):
+                failed_records.append(
+                    {
+                        "primary_field": primary_field,
+                        "primary_field_value": batch[i].get(primary_field, "Unknown"),
+                        "error": f"Duplicate check error: {result}",
+                    }
+                )
+                logger.error(f"Error checking duplicate: {result}")
+            elif result is not None:
+                filtered_batch.append(result)
+
+        return filtered_batch
+
+    def _filter_existing_local(
+        self,
+        batch: List[Dict],
+        model_name: str,
+        primary_field: str,
+        composite_fields: List[str],
+        existing_keys: Set[Tuple],
+        failed_records: List[Dict],
+    ) -> List[Dict]:
+        filtered_batch: List[Dict] = []
+        for record in batch:
+            try:
+                key_fields = [primary_field, *self._resolve_composite_keys(composite_fields, record)]
+            except ValueError as e:
+                failed_records.append(
+                    {
+                        "primary_field": primary_field,
+                        "primary_field_value": record.get(primary_field, "Unknown"),
+                        "error": f"Duplicate check error: {e}",
+                    }
+                )
+                logger.error(f"Error checking duplicate: {e}")
+                continue
+
+            key = self._record_key(record, key_fields)
+            if key in existing_keys:
+                logger.warning(
+                    f'Record with {primary_field}="{record.get(primary_field)}" already exists in {model_name}'
+                )
+                continue
+
+            # Reserve the key so later records in the same upload are treated as duplicates
+            existing_keys.add(key)
+            filtered_batch.append(record)
+
+        return filtered_batch
+
     async def upload_batch_async(
         self,
         batch: List[Dict],
@@ -321,84 +716,174 @@ class QueryExecutor:
         is_secondary_index: bool,
         field_type: str = "String",
         composite_fields: Optional[List[str]] = None,
+        existing_keys: Optional[Set[Tuple]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        in_flight_keys: Optional[Set[Tuple]] = None,
     ) -> tuple[int, int, List[Dict]]:
-        async with aiohttp.ClientSession() as session:
-            duplicate_checks = [
-                self.check_record_exists_async(
-                    session,
+        """
+        Upload one batch, skipping records that already exist.
+
+        Without existing_keys, each record is checked remotely. Batches running concurrently cannot see each
+        other's pending creates that way, so they share in_flight_keys to drop keys another batch already sent.
+        """
+        if session is None:
+            async with self._create_session() as session:
+                return await self.upload_batch_async(
+                    batch,
                     model_name,
                     primary_field,
-                    record[primary_field],
                     is_secondary_index,
-                    record,
                     field_type,
                     composite_fields,
+                    existing_keys=existing_keys,
+                    session=session,
+                    in_flight_keys=in_flight_keys,
                 )
-                for record in batch
-            ]
-            check_results = await asyncio.gather(*duplicate_checks, return_exceptions=True)
-
-            filtered_batch: List[Dict] = []
-            failed_records: List[Dict] = []
-
-            for i, result in enumerate(check_results):
-                if isinstance(result, BaseException):
-                    error_msg = str(result)
-                    failed_records.append(
-                        {
-                            "primary_field": primary_field,
-                            "primary_field_value": batch[i].get(primary_field, "Unknown"),
-                            "error": f"Duplicate check error: {error_msg}",
-                        }
-                    )
-                    logger.error(f"Error checking duplicate: {result}")
-                elif result is not None:
-                    filtered_batch.append(result)
-
-            if not filtered_batch:
-                return 0, len(batch), failed_records
-
-            create_tasks = [
-                self.create_record_async(session, record, model_name, primary_field) for record in filtered_batch
-            ]
-            create_results = await asyncio.gather(*create_tasks, return_exceptions=True)
-
-            for i, create_result in enumerate(create_results):
-                if isinstance(create_result, BaseException):
-                    error_msg = str(create_result)
-                    failed_records.append(
-                        {
-                            "primary_field": primary_field,
-                            "primary_field_value": filtered_batch[i].get(primary_field, "Unknown"),
-                            "error": error_msg,
-                        }
-                    )
-                elif not create_result:
-                    failed_records.append(
-                        {
-                            "primary_field": primary_field,
-                            "primary_field_value": filtered_batch[i].get(primary_field, "Unknown"),
-                            "error": "Creation failed - no response",
-                        }
-                    )
 
-            success_count = sum(1 for r in create_results if r and not isinstance(r, BaseException))
-            error_count = len(batch) - success_count
+        composite_fields = composite_fields or []
+        failed_records: List[Dict] = []
+
+        if existing_keys is None:
+            filtered_batch = await self._filter_existing_remote(
+                session,
+                batch,
+                model_name,
+                primary_field,
+                is_secondary_index,
+                field_type,
+                composite_fields,
+                failed_records,
+            )
+            if in_flight_keys is not None:
+                filtered_batch = self._filter_existing_local(
+                    filtered_batch, model_name, primary_field, composite_fields, in_flight_keys, failed_records
+                )
+            reserved_keys = in_flight_keys
+        else:
+            filtered_batch = self._filter_existing_local(
+                batch, model_name, primary_field, composite_fields, existing_keys, failed_records
+            )
+            reserved_keys = existing_keys
 
-            return success_count, error_count, failed_records
+        if not filtered_batch:
+            return 0, len(batch), failed_records
 
-    def upload(
+        chunk_results = await asyncio.gather(
+            *(
+                self.create_records_async(session, chunk, model_name, primary_field)
+                for chunk in self._chunk_by_payload_size(filtered_batch)
+            )
+        )
+        create_results = [result for chunk in chunk_results for result in chunk]
+
+        for i, create_result in enumerate(create_results):
+            if create_result and not isinstance(create_result, BaseException):
+                continue
+
+            record = filtered_batch[i]
+            failed_records.append(
+                {
+                    "primary_field": primary_field,
+                    "primary_field_value": record.get(primary_field, "Unknown"),
+                    "error": str(create_result) if create_result else "Creation failed - no response",
+                }
+            )
+            if reserved_keys is not None:
+                key_fields = [primary_field, *self._resolve_composite_keys(composite_fields, record)]
+                reserved_keys.discard(self._record_key(record, key_fields))
+
+        success_count = sum(1 for r in create_results if r and not isinstance(r, BaseException))
+        error_count = len(batch) - success_count
+
+        return success_count, error_count, failed_records
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.batch_size * 2,
+            limit_per_host=self.batch_size * 2,
+            ttl_dns_cache=300,
+            keepalive_timeout=300,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def _upload_async(
         self,
         records: List[Dict],
         model_name: str,
-        parsed_model_structure: Dict[str, Any],
+        primary_field: str,
+        is_secondary_index: bool,
+        field_type: str,
+        composite_fields: List[str],
+        existing_keys: Optional[Set[Tuple]],
     ) -> tuple[int, int, List[Dict]]:
-        logger.info("Uploading to Amplify backend...")
+        num_of_batches = (len(records) + self.batch_size - 1) // self.batch_size
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        in_flight_keys: Optional[Set[Tuple]] = set() if existing_keys is None else None
+
+        async def run_batch(batch_number: int, batch: List[Dict], session: aiohttp.ClientSession):
+            async with semaphore:
+                logger.info(f"Uploading batch {batch_number} / {num_of_batches} ({len(batch)} items)...")
+                result = await self.upload_batch_async(
+                    batch,
+                    model_name,
+                    primary_field,
+                    is_secondary_index,
+                    field_type,
+                    composite_fields,
+                    existing_keys=existing_keys,
+                    session=session,
+                    in_flight_keys=in_flight_keys,
+                )
+                logger.info(
+                    f"Processed batch {batch_number} of model {model_name}: {result[0]} success, {result[1]} errors"
+                )
+                return result
+
+        # One session for the whole upload so connections are reused across batches
+        async with self._create_session() as session:
+            batches = [records[i : i + self.batch_size] for i in range(0, len(records), self.batch_size)]
+            batch_results = await asyncio.gather(
+                *(run_batch(n, batch, session) for n, batch in enumerate(batches, start=1)),
+                return_exceptions=True,
+            )
 
         success_count = 0
         error_count = 0
-        all_failed_records = []
-        num_of_batches = (len(records) + self.batch_size - 1) // self.batch_size
+        all_failed_records: List[Dict] = []
+
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, BaseException):
+                logger.error(f"Batch upload failed for model {model_name}: {batch_result}")
+                error_count += len(batch)
+                all_failed_records.extend(
+                    {
+                        "primary_field": primary_field,
+                        "primary_field_value": record.get(primary_field, "Unknown"),
+                        "error": str(batch_result),
+                    }
+                    for record in batch
+                )
+                continue
+
+            batch_success, batch_error, batch_failed_records = batch_result
+            success_count += batch_success
+            error_count += batch_error
+            all_failed_records.extend(batch_failed_records)
+
+        logger.info(f"Uploaded model {model_name}: {success_count} success, {error_count} errors")
+
+        return success_count, error_count, all_failed_records
+
+    def upload(
+        self,
+        records: List[Dict],
+        model_name: str,
+        parsed_model_structure: Dict[str, Any],
+    ) -> tuple[int, int, List[Dict]]:
+        if not records:
+            return 0, 0, []
+
+        logger.info("Uploading to Amplify backend...")
 
         primary_field, is_secondary_index, field_type = self.get_primary_field_name(model_name, parsed_model_structure)
         if not primary_field:
@@ -407,22 +892,25 @@ class QueryExecutor:
 
         composite_fields = self.composite_unique_fields.get(model_name, [])
 
-        for i in range(0, len(records), self.batch_size):
-            batch = records[i : i + self.batch_size]
-            logger.info(f"Uploading batch {i // self.batch_size + 1} / {num_of_batches} ({len(batch)} items)...")
+        existing_keys = None
+        key_fields = self._resolve_upload_key_fields(records, primary_field, composite_fields, model_name)
+        if key_fields:
+            existing_keys = self._fetch_existing_keys(model_name, key_fields)
+            if existing_keys is None:
+                logger.warning(f"Could not prefetch existing {model_name} records, checking duplicates per record")
+            else:
+                logger.info(f"Found {len(existing_keys)} existing {model_name} records")
 
-            batch_success, batch_error, batch_failed_records = asyncio.run(
-                self.upload_batch_async(
-                    batch, model_name, primary_field, is_secondary_index, field_type, composite_fields
-                )
+        success_count, error_count, all_failed_records = asyncio.run(
+            self._upload_async(
+                records, model_name, primary_field, is_secondary_index, field_type, composite_fields, existing_keys
             )
-            success_count += batch_success
-            error_count += batch_error
-            all_failed_records.extend(batch_failed_records)
+        )
 
-            logger.info(
-                f"Processed batch {i // self.batch_size + 1} of model {model_name}: {success_count} success, {error_count} errors"
-            )
+        if success_count:
+            # Cached listings of this model no longer reflect the backend
+            self.records_cache.pop(model_name, None)
+            self._fk_lookup_cache.pop(model_name, None)
 
         return success_count, error_count, all_failed_records
 
@@ -435,10 +923,13 @@ class QueryExecutor:
         if return_fields is None:
             return_fields = ["id"]
 
-        mutation = MutationBuilder.build_create_mutation(model_name, return_fields=return_fields)
+        mutation = self._cached_operation(
+            ("create", model_name, *return_fields),
+            lambda: MutationBuilder.build_create_mutation(model_name, return_fields=return_fields),
+        )
         variables = MutationBuilder.build_create_variables(data)
 
-        result = self.client.request(mutation, variables)
+        result = self.client.request(mutation, variables, idempotent=False)
 
         if result and "data" in result:
             created: Optional[Dict] = result["data"].get(f"create{model_name}")
@@ -456,10 +947,13 @@ class QueryExecutor:
         if return_fields is None:
             return_fields = ["id"]
 
-        mutation = MutationBuilder.build_update_mutation(model_name, return_fields=return_fields)
+        mutation = self._cached_operation(
+            ("update", model_name, *return_fields),
+            lambda: MutationBuilder.build_update_mutation(model_name, return_fields=return_fields),
+        )
         variables = MutationBuilder.build_update_variables(record_id, updates)
 
-        result = self.client.request(mutation, variables)
+        result = self.client.request(mutation, variables, idempotent=False)
 
         if result and "data" in result:
             updated: Optional[Dict] = result["data"].get(f"update{model_name}")
@@ -476,10 +970,13 @@ class QueryExecutor:
         if return_fields is None:
             return_fields = ["id"]
 
-        mutation = MutationBuilder.build_delete_mutation(model_name, return_fields=return_fields)
+        mutation = self._cached_operation(
+            ("delete", model_name, *return_fields),
+            lambda: MutationBuilder.build_delete_mutation(model_name, return_fields=return_fields),
+        )
         variables = MutationBuilder.build_delete_variables(record_id)
 
-        result = self.client.request(mutation, variables)
+        result = self.client.request(mutation, variables, idempotent=False)
 
         if result and "data" in result:
             deleted: Optional[Dict] = result["data"].get(f"delete{model_name}")
@@ -487,7 +984,9 @@ class QueryExecutor:
 
         return None
 
-    def build_foreign_key_lookups(self, df, parsed_model_structure: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    def build_foreign_key_lookups(
+        self, df, parsed_model_structure: Dict[str, Any], fetch_missing: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Build a cache of foreign key lookups for all ID fields in the DataFrame.
 
@@ -496,51 +995,140 @@ class QueryExecutor:
         Args:
             df: pandas DataFrame containing the data to be processed
             parsed_model_structure: Parsed model structure containing field information
+            fetch_missing: List related models not cached yet; False only reads what prefetch_foreign_key_lookups
+                already built
 
         Returns:
             Dictionary mapping model names to lookup dictionaries and primary fields
         """
-        fk_lookup_cache = {}
+        related_models = self.get_related_models(df.columns, parsed_model_structure)
+        if fetch_missing:
+            self.prefetch_foreign_key_lookups(related_models)
+        fk_lookup_cache: Dict[str, Dict[str, Any]] = {}
+        for related_model in related_models:
+            entry = self._fk_lookup_cache.get(related_model)
+            if entry is not None:
+                fk_lookup_cache[related_model] = entry
+        return fk_lookup_cache
+
+    @staticmethod
+    def get_related_models(columns: Iterable[str], parsed_model_structure: Dict[str, Any]) -> List[str]:
+        """Return the models referenced by the ID fields that have a column, in field order and without repeats."""
+        related_models: Dict[str, None] = {}
+        # Hashed once; pandas Index membership is not guaranteed to be a constant-time lookup
+        columns = frozenset(columns)
 
         for field in parsed_model_structure["fields"]:
             if not field["is_id"]:
                 continue
 
-            field_name = field["name"][:-2]
-
             # Accept both reporter and reporterId as column names
-            if field_name not in df.columns:
-                if field["name"] in df.columns:
-                    field_name = field["name"]
-                else:
-                    continue
+            if field["name"].removesuffix("Id") not in columns and field["name"] not in columns:
+                continue
 
             if "related_model" in field:
                 related_model = field["related_model"]
             else:
-                related_model = field_name[0].upper() + field_name[1:]
+                # From the field name, not the matched column: a reporterId column still relates to Reporter
+                model_name = field["name"].removesuffix("Id")
+                related_model = model_name[0].upper() + model_name[1:]
 
-            if related_model in fk_lookup_cache:
-                continue
+            related_models.setdefault(related_model)
 
-            try:
-                primary_field, is_secondary_index, _ = self.get_primary_field_name(
-                    related_model, parsed_model_structure
+        return list(related_models)
+
+    def prefetch_foreign_key_lookups(self, related_models: Iterable[str]) -> None:
+        """
+        List every related model not already in the FK lookup cache, the distinct models concurrently.
+
+        Callers planning several sheets should pass all their related models in one call, so a model shared by
+        several sheets is listed once instead of once per sheet.
+        """
+        pending = [
+            related_model
+            for related_model in dict.fromkeys(related_models)
+            if related_model not in self._fk_lookup_cache
+        ]
+        if not pending:
+            return
+
+        try:
+            primary_fields = self.get_primary_field_names_batch(pending)
+        except Exception as e:
+            logger.warning(f"  ⚠️  Could not introspect related models {', '.join(pending)}: {e}")
+            primary_fields = {}
+
+        max_workers = min(self.FK_FETCH_CONCURRENCY, len(pending))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(
+                pool.map(
+                    lambda related_model: self._fetch_foreign_key_lookup(
+                        related_model, primary_fields.get(related_model)
+                    ),
+                    pending,
                 )
-                records = self.get_records(related_model, primary_field, is_secondary_index)
+            )
 
-                if records:
-                    lookup = {
-                        str(record.get(primary_field)): record.get("id")
-                        for record in records
-                        if record.get(primary_field)
-                    }
-                    fk_lookup_cache[related_model] = {
-                        "lookup": lookup,
-                        "primary_field": primary_field,
-                    }
-                    logger.debug(f"  📦 Cached {len(lookup)} {related_model} records")
-            except Exception as e:
-                logger.warning(f"  ⚠️  Could not pre-fetch {related_model}: {e}")
+    def clear_fk_cache(self) -> None:
+        """Forget the FK lookups built so far, so the next build_foreign_key_lookups lists related models again."""
+        self._fk_lookup_cache.clear()
 
-        return fk_lookup_cache
+    def get_primary_field_names_batch(self, model_names: List[str]) -> Dict[str, tuple[str, bool, str]]:
+        """
+        Resolve the primary field of each model from that model's own structure.
+
+        The structures are introspected together in one aliased request. Models missing from the schema are left out of
+        the result.
+        """
+        self.prefetch_model_structures(model_names)
+        field_parser = FieldParser()
+
+        primary_fields: Dict[str, tuple[str, bool, str]] = {}
+        for model_name in model_names:
+            try:
+                parsed_model_structure = field_parser.parse_model_structure(self.get_model_structure(model_name))
+            except ValueError as e:
+                logger.warning(f"  ⚠️  Could not introspect {model_name}: {e}")
+                continue
+            primary_fields[model_name] = self.get_primary_field_name(model_name, parsed_model_structure)
+
+        return primary_fields
+
+    def _fetch_foreign_key_lookup(
+        self, related_model: str, primary: Optional[tuple[str, bool, str]]
+    ) -> Optional[Dict[str, Any]]:
+        """List one related model into a primary value -> id lookup. Failures are logged and yield None."""
+        with self._fk_fetch_locks_guard:
+            fetch_lock = self._fk_fetch_locks.setdefault(related_model, threading.Lock())
+
+        with fetch_lock:
+            return self._fetch_foreign_key_lookup_locked(related_model, primary)
+
+    def _fetch_foreign_key_lookup_locked(
+        self, related_model: str, primary: Optional[tuple[str, bool, str]]
+    ) -> Optional[Dict[str, Any]]:
+        cached = self._fk_lookup_cache.get(related_model)
+        if cached is not None:
+            return cached
+        if primary is None:
+            return None
+
+        try:
+            primary_field, is_secondary_index, _ = primary
+            records = self.get_records(related_model, primary_field, is_secondary_index)
+
+            if not records:
+                return None
+
+            # Falsy but real primary values (0 for an Int key) stay resolvable; on duplicates the later record wins
+            lookup = {
+                str(record[primary_field]): record.get("id")
+                for record in records
+                if record.get(primary_field) not in (None, "")
+            }
+            logger.debug(f"  📦 Cached {len(lookup)} {related_model} records")
+            entry = self._fk_lookup_cache[related_model] = {"lookup": lookup, "primary_field": primary_field}
+            return entry
+        except Exception as e:
+            logger.warning(f"  ⚠️  Could not pre-fetch {related_model}: {e}")
+            return None
@@ -63,6 +63,31 @@ mutation Delete{model_name}($input: Delete{model_name}Input!) {{
 """
         return mutation.strip()
 
+    @staticmethod
+    def build_batch_create_mutation(
+        model_name: str,
+        count: int,
+        return_fields: Optional[List[str]] = None,
+    ) -> str:
+        """Build one operation creating `count` records through aliased fields r0..r{count-1}."""
+        if return_fields is None:
+            return_fields = ["id"]
+
+        fields_str = "\n".join(f"    {field}" for field in return_fields)
+        params = ", ".join(f"$i{i}: Create{model_name}Input!" for i in range(count))
+        selections = "\n".join(f"  r{i}: create{model_name}(input: $i{i}) {{\n{fields_str}\n  }}" for i in range(count))
+
+        mutation = f"""
+mutation BatchCreate{model_name}({params}) {{
+{selections}
+}}
+"""
+        return mutation.strip()
+
+    @staticmethod
+    def build_batch_create_variables(inputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {f"i{i}": input_data for i, input_data in enumerate(inputs)}
+
     @staticmethod
     def build_create_variables(input_data: Dict[str, Any]) -> Dict[str, Any]:
         return {"input": input_data}
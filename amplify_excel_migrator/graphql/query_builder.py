@@ -2,6 +2,63 @@
 
 from typing import List, Optional, Any, Dict
 
+# Selection set for one __type, nested deep enough for NON_NULL { LIST { NON_NULL { ENUM } } } field types
+_TYPE_SELECTION = """\
+    name
+    kind
+    enumValues {
+      name
+    }
+    fields {
+      name
+      description
+      type {
+        name
+        kind
+        enumValues {
+          name
+        }
+        ofType {
+          name
+          kind
+          enumValues {
+            name
+          }
+          ofType {
+            name
+            kind
+            enumValues {
+              name
+            }
+            ofType {
+              name
+              kind
+              enumValues {
+                name
+              }
+            }
+          }
+        }
+      }
+    }"""
+
+
+# Introspection documents are fixed apart from the type name, so they are assembled once at import
+_MODEL_INTROSPECTION_TEMPLATE = 'query IntrospectModel {\n  __type(name: "%s") {\n' + _TYPE_SELECTION + "\n  }\n}"
+
+_SCHEMA_INTROSPECTION_QUERY = """\
+query IntrospectSchema {
+  __schema {
+    types {
+      name
+      kind
+      enumValues {
+        name
+      }
+    }
+  }
+}"""
+
 
 class QueryBuilder:
     """Builds GraphQL query strings for Amplify GraphQL API."""
@@ -116,6 +173,59 @@ query {query_name}(${index_field}: {field_type}!) {{
     }}
   }}
 }}
+"""
+        return query.strip()
+
+    @staticmethod
+    def build_batch_secondary_index_query(
+        model_name: str,
+        index_field: str,
+        count: int,
+        fields: Optional[List[str]] = None,
+        field_type: str = "String",
+    ) -> str:
+        """Build one query running `count` secondary index lookups through aliased fields c0..c{count-1}."""
+        if fields is None:
+            fields = ["id", index_field]
+
+        fields_str = "\n".join(f"      {field}" for field in fields)
+        query_name = f"list{model_name}By{index_field[0].upper() + index_field[1:]}"
+        params = ", ".join(f"$v{i}: {field_type}!" for i in range(count))
+        selections = "\n".join(
+            f"  c{i}: {query_name}({index_field}: $v{i}) {{\n    items {{\n{fields_str}\n    }}\n  }}"
+            for i in range(count)
+        )
+
+        query = f"""
+query Check{query_name[0].upper() + query_name[1:]}({params}) {{
+{selections}
+}}
+"""
+        return query.strip()
+
+    @staticmethod
+    def build_batch_list_query_with_filter(
+        model_name: str,
+        count: int,
+        fields: Optional[List[str]] = None,
+        query_name: Optional[str] = None,
+    ) -> str:
+        """Build one query running `count` filtered listings through aliased fields c0..c{count-1}."""
+        if fields is None:
+            fields = ["id"]
+        if query_name is None:
+            query_name = f"list{model_name}s"
+
+        fields_str = "\n".join(f"      {field}" for field in fields)
+        params = ", ".join(f"$f{i}: Model{model_name}FilterInput" for i in range(count))
+        selections = "\n".join(
+            f"  c{i}: {query_name}(filter: $f{i}) {{\n    items {{\n{fields_str}\n    }}\n  }}" for i in range(count)
+        )
+
+        query = f"""
+query Check{query_name[0].upper() + query_name[1:]}({params}) {{
+{selections}
+}}
 """
         return query.strip()
 
@@ -140,67 +250,20 @@ query Get{model_name}($id: ID!) {{
 
     @staticmethod
     def build_introspection_query(model_name: str) -> str:
-        query = f"""
-query IntrospectModel {{
-  __type(name: "{model_name}") {{
-    name
-    kind
-    enumValues {{
-      name
-    }}
-    fields {{
-      name
-      description
-      type {{
-        name
-        kind
-        enumValues {{
-          name
-        }}
-        ofType {{
-          name
-          kind
-          enumValues {{
-            name
-          }}
-          ofType {{
-            name
-            kind
-            enumValues {{
-              name
-            }}
-            ofType {{
-              name
-              kind
-              enumValues {{
-                name
-              }}
-            }}
-          }}
-        }}
-      }}
-    }}
-  }}
-}}
-"""
-        return query.strip()
+        return _MODEL_INTROSPECTION_TEMPLATE % model_name
+
+    @staticmethod
+    def build_batch_introspection_query(model_names: List[str]) -> str:
+        """Introspect several types in one request; the structure of model_names[i] is returned under alias t{i}."""
+        aliased = "\n".join(
+            f'  t{i}: __type(name: "{model_name}") {{\n{_TYPE_SELECTION}\n  }}'
+            for i, model_name in enumerate(model_names)
+        )
+        return f"query IntrospectModels {{\n{aliased}\n}}"
 
     @staticmethod
     def build_schema_introspection_query() -> str:
-        query = """
-query IntrospectSchema {
-  __schema {
-    types {
-      name
-      kind
-      enumValues {
-        name
-      }
-    }
-  }
-}
-"""
-        return query.strip()
+        return _SCHEMA_INTROSPECTION_QUERY
 
     @staticmethod
     def build_variables_for_list(
@@ -1,6 +1,7 @@
 """Headless migration engine: builds an inspectable plan and executes uploads."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 
 class MigrationOrchestrator:
+    # Sheets are planned in parallel: each one waits on its own FK listings and primary-field lookups
+    PLAN_CONCURRENCY = 8
+
     def __init__(
         self,
         excel_reader,
@@ -30,6 +34,10 @@ class MigrationOrchestrator:
         self.amplify_client = amplify_client
         self.field_parser = field_parser
         self.batch_uploader = batch_uploader
+        # build_plan runs again on every agent iteration; the schema does not change within a run
+        self._parsed_structure_cache: Dict[str, Dict[str, Any]] = {}
+        # Custom types (e.g. an Address) are often embedded by several models; parse each one once
+        self._custom_type_fields_cache: Dict[str, List[Dict[str, Any]]] = {}
 
     def set_sheets(self, sheets: Dict[str, pd.DataFrame]) -> None:
         """Re-target the engine at in-memory frames (requires an InMemoryExcelReader)."""
@@ -37,9 +45,29 @@ class MigrationOrchestrator:
 
     def build_plan(self) -> MigrationPlan:
         all_sheets = self.excel_reader.read_all_sheets()
-        sheets = [self._plan_sheet(df, sheet_name) for sheet_name, df in all_sheets.items()]
+        # One concurrent warm-up instead of a sequential introspection round trip per sheet
+        self.amplify_client.prefetch_model_structures(["Query", *all_sheets])
+        self._prefetch_foreign_key_lookups(all_sheets)
+        max_workers = max(1, min(self.PLAN_CONCURRENCY, len(all_sheets)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            sheets = list(pool.map(self._plan_sheet, all_sheets.values(), all_sheets.keys()))
         return MigrationPlan(sheets=sheets)
 
+    def _prefetch_foreign_key_lookups(self, all_sheets: Dict[str, pd.DataFrame]) -> None:
+        # Sheets referencing the same model share one listing; the sheet threads then only read the lookups
+        related_models: List[str] = []
+        for sheet_name, df in all_sheets.items():
+            try:
+                parsed_model_structure = self._get_parsed_model_structure(sheet_name)
+            except ValueError:
+                continue  # _plan_sheet reports the skip
+            columns = [self.data_transformer.to_camel_case(column) for column in df.columns]
+            related_models.extend(self.amplify_client.get_related_models(columns, parsed_model_structure))
+
+        if related_models:
+            logger.info("🚀 Pre-fetching foreign key lookups...")
+            self.amplify_client.prefetch_foreign_key_lookups(related_models)
+
     def _plan_sheet(self, df: pd.DataFrame, sheet_name: str) -> SheetPlan:
         total_rows = len(df)
         try:
@@ -122,8 +150,10 @@ class MigrationOrchestrator:
 
         fk_lookup_cache: Dict[str, Any] = {}
         if self.amplify_client:
-            logger.info("🚀 Pre-fetching foreign key lookups...")
-            fk_lookup_cache = self.amplify_client.build_foreign_key_lookups(df, parsed_model_structure)
+            # build_plan listed every sheet's related models up front, so no sheet thread lists one again
+            fk_lookup_cache = self.amplify_client.build_foreign_key_lookups(
+                df, parsed_model_structure, fetch_missing=False
+            )
 
         records, row_dict_by_primary, failed_rows = self.data_transformer.transform_rows_to_records(
             df, parsed_model_structure, primary_field, fk_lookup_cache
@@ -143,18 +173,31 @@ class MigrationOrchestrator:
         return records, row_dict_by_primary, parsing_failures
 
     def _get_parsed_model_structure(self, sheet_name: str) -> Dict[str, Any]:
+        cached = self._parsed_structure_cache.get(sheet_name)
+        if cached is not None:
+            return cached
+
         model_structure = self.amplify_client.get_model_structure(sheet_name)
         parsed_structure: Dict[str, Any] = self.field_parser.parse_model_structure(model_structure)
 
         for field in parsed_structure["fields"]:
             if field.get("is_custom_type"):
                 try:
-                    custom_type_raw = self.amplify_client.get_model_structure(field["type"])
-                    custom_type_parsed = self.field_parser.parse_model_structure(custom_type_raw)
-                    field["custom_type_fields"] = custom_type_parsed["fields"]
+                    field["custom_type_fields"] = self._get_custom_type_fields(field["type"])
                 except ValueError:
                     raise ValueError(
                         f"Custom type '{field['type']}' not found in schema (referenced by '{sheet_name}')"
                     )
 
+        self._parsed_structure_cache[sheet_name] = parsed_structure
         return parsed_structure
+
+    def _get_custom_type_fields(self, type_name: str) -> List[Dict[str, Any]]:
+        cached = self._custom_type_fields_cache.get(type_name)
+        if cached is not None:
+            return cached
+
+        custom_type_raw = self.amplify_client.get_model_structure(type_name)
+        custom_type_fields: List[Dict[str, Any]] = self.field_parser.parse_model_structure(custom_type_raw)["fields"]
+        self._custom_type_fields_cache[type_name] = custom_type_fields
+        return custom_type_fields
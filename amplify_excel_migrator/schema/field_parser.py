@@ -1,5 +1,6 @@
 from typing import Dict, Any, List, Optional
 import logging
+import orjson
 import pandas as pd
 import unicodedata
 from datetime import datetime
@@ -72,8 +73,7 @@ class FieldParser:
         return model_info
 
     def _extract_relationship_info(self, field: Dict) -> Dict[str, str] | None:
-        base_type = self.get_base_type_name(field.get("type", {}))
-        type_kind = self._get_type_kind(field.get("type", {}))
+        base_type, type_kind, _, _ = self._unwrap_type(field.get("type", {}))
         field_name = field.get("name", "")
 
         if type_kind != "OBJECT" or "Connection" in base_type or field_name in self.metadata_fields:
@@ -83,8 +83,8 @@ class FieldParser:
         return {"target_model": base_type, "foreign_key": inferred_foreign_key}
 
     def _parse_field(self, field: Dict) -> Dict[str, Any]:
-        base_type = self.get_base_type_name(field.get("type", {}))
-        type_kind = self._get_type_kind(field.get("type", {}))
+        type_obj = field.get("type", {})
+        base_type, type_kind, is_list, inline_enum_values = self._unwrap_type(type_obj)
 
         if "Connection" in base_type or field.get("name") in self.metadata_fields or type_kind == "INTERFACE":
             return {}
@@ -93,69 +93,61 @@ class FieldParser:
             "name": field.get("name"),
             "description": field.get("description"),
             "type": base_type,
-            "is_required": self._is_required_field(field.get("type", {})),
-            "is_list": self._is_list_type(field.get("type", {})),
+            "is_required": self._is_required_field(type_obj),
+            "is_list": is_list,
             "is_scalar": base_type in self.scalar_types,
             "is_id": base_type == "ID",
-            "is_enum": self._get_type_kind(field.get("type", {})) == "ENUM",
+            "is_enum": type_kind == "ENUM",
             "is_custom_type": type_kind == "OBJECT",
-            "inline_enum_values": self._extract_inline_enum_values(field.get("type", {})),
+            "inline_enum_values": inline_enum_values,
         }
 
         return field_info
 
-    def _extract_inline_enum_values(self, type_obj: Dict) -> List[str]:
-        if not type_obj:
-            return []
-        enum_values = type_obj.get("enumValues")
-        if enum_values:
-            return [ev["name"] for ev in enum_values]
-        if type_obj.get("ofType"):
-            return self._extract_inline_enum_values(type_obj["ofType"])
-        return []
-
-    def get_base_type_name(self, type_obj: Dict) -> str:
+    @staticmethod
+    def _unwrap_type(type_obj: Dict) -> tuple[str, str, bool, List[str]]:
         """
-        Get the base type name, unwrapping NON_NULL and LIST wrappers
+        Walk the ofType chain once, returning (base type name, base kind, is list, inline enum values).
         """
+        name: Optional[str] = None
+        kind: Optional[str] = None
+        is_list = False
+        enum_values: Optional[List[str]] = None
+
+        current: Optional[Dict] = type_obj
+        while current:
+            type_kind = current.get("kind")
+            if type_kind == "LIST":
+                is_list = True
+            if name is None and current.get("name"):
+                name = str(current["name"])
+            if kind is None and (type_kind not in ("NON_NULL", "LIST") or not current.get("ofType")):
+                kind = str(current.get("kind", "UNKNOWN"))
+            if enum_values is None and current.get("enumValues"):
+                enum_values = [ev["name"] for ev in current["enumValues"]]
+            current = current.get("ofType")
+
+        return name or "Unknown", kind or "UNKNOWN", is_list, enum_values or []
 
-        if not type_obj:
-            return "Unknown"
-
-        name = type_obj.get("name")
-        if name:
-            return str(name)
+    @staticmethod
+    def get_base_type_name(type_obj: Dict) -> str:
+        """
+        Get the base type name, unwrapping NON_NULL and LIST wrappers
+        """
 
-        if type_obj.get("ofType"):
-            return self.get_base_type_name(type_obj["ofType"])
+        current: Optional[Dict] = type_obj
+        while current:
+            name = current.get("name")
+            if name:
+                return str(name)
+            current = current.get("ofType")
 
         return "Unknown"
 
-    def _get_type_kind(self, type_obj: Dict) -> str:
-        if not type_obj:
-            return "UNKNOWN"
-
-        if type_obj["kind"] in ["NON_NULL", "LIST"] and type_obj.get("ofType"):
-            return self._get_type_kind(type_obj["ofType"])
-
-        return str(type_obj.get("kind", "UNKNOWN"))
-
     @staticmethod
     def _is_required_field(type_obj: Dict) -> bool:
         return bool(type_obj and type_obj.get("kind") == "NON_NULL")
 
-    def _is_list_type(self, type_obj: Dict) -> bool:
-        if not type_obj:
-            return False
-
-        if type_obj["kind"] == "LIST":
-            return True
-
-        if type_obj.get("ofType"):
-            return self._is_list_type(type_obj["ofType"])
-
-        return False
-
     def build_custom_type_from_columns(
         self, row: pd.Series, custom_type_fields: list, custom_type_name: str, fill_unknown: bool = False
     ) -> Optional[list]:
@@ -325,12 +317,10 @@ class FieldParser:
 
         if input_str.startswith("[") and input_str.endswith("]"):
             try:
-                import json
-
-                parsed_json = json.loads(input_str)
+                parsed_json = orjson.loads(input_str)
                 if isinstance(parsed_json, list):
                     return self._convert_array_elements(field, field_name, parsed_json)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.warning(f"Failed to parse JSON array for field '{field_name}': {input_str}")
 
         if ";" in input_str:
@@ -1,8 +1,10 @@
 """Schema introspection for GraphQL models."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
+import aiohttp
 import inflect
 
 from amplify_excel_migrator.graphql import GraphQLClient
@@ -12,25 +14,80 @@ logger = logging.getLogger(__name__)
 
 
 class SchemaIntrospector:
+    # Types introspected per aliased request when prefetching; bounds the response size of a single request
+    PREFETCH_BATCH_SIZE = 25
+
     def __init__(self, client: GraphQLClient):
         self.client = client
+        # The schema is fixed for the lifetime of a run, so lookups are memoized per instance.
+        # Failed lookups are not cached and are retried on the next call.
+        self._model_structure_cache: Dict[str, Dict[str, Any]] = {}
+        self._list_query_name_cache: Dict[str, str] = {}
+        self._query_field_positions: Optional[Dict[str, int]] = None
+        self._secondary_index_by_model: Optional[Dict[str, str]] = None
+        self._all_types: Optional[list[Dict[str, Any]]] = None
 
     def get_model_structure(self, model_type: str) -> Dict[str, Any]:
+        if model_type in self._model_structure_cache:
+            return self._model_structure_cache[model_type]
+
         query = QueryBuilder.build_introspection_query(model_type)
         response = self.client.request(query)
 
         if response and "data" in response and "__type" in response["data"]:
             type_data: Dict[str, Any] = response["data"]["__type"]
+            if type_data:
+                self._model_structure_cache[model_type] = type_data
             return type_data
 
         return {}
 
-    def get_all_types(self) -> list[Dict[str, Any]]:
+    def prefetch_model_structures(self, model_types: Iterable[str]) -> None:
+        """Warm the structure cache by introspecting all uncached types in aliased batches, sent concurrently.
+
+        Best effort: a type that fails here is left uncached and fetched lazily by get_model_structure.
+        """
+        pending = [
+            model_type for model_type in dict.fromkeys(model_types) if model_type not in self._model_structure_cache
+        ]
+        if pending:
+            batches = [
+                pending[i : i + self.PREFETCH_BATCH_SIZE] for i in range(0, len(pending), self.PREFETCH_BATCH_SIZE)
+            ]
+            asyncio.run(self._prefetch_model_structures_async(batches))
+
+    async def _prefetch_model_structures_async(self, batches: list[list[str]]) -> None:
+        async with aiohttp.ClientSession() as session:
+            responses = await asyncio.gather(
+                *(
+                    self.client.request_async(session, QueryBuilder.build_batch_introspection_query(batch))
+                    for batch in batches
+                ),
+                return_exceptions=True,
+            )
+
+        for batch, response in zip(batches, responses):
+            if isinstance(response, BaseException):
+                logger.debug(f"Prefetching structures of {', '.join(batch)} failed: {response}")
+                continue
+            data = (response or {}).get("data") or {}
+            for i, model_type in enumerate(batch):
+                type_data = data.get(f"t{i}")
+                if type_data:
+                    self._model_structure_cache[model_type] = type_data
+
+    def get_all_types(self, refresh: bool = False) -> list[Dict[str, Any]]:
+        """Return every type in the schema, introspected once per instance unless `refresh` is set."""
+        if self._all_types is not None and not refresh:
+            return self._all_types
+
         query = QueryBuilder.build_schema_introspection_query()
         response = self.client.request(query)
 
         if response and "data" in response and "__schema" in response["data"]:
             types: list[Dict[str, Any]] = response["data"]["__schema"].get("types", [])
+            if types:
+                self._all_types = types
             return types
 
         return []
@@ -68,30 +125,55 @@ class SchemaIntrospector:
         logger.error("No suitable primary field found (required scalar field other than id)")
         return "", False, "String"
 
-    def _get_secondary_index(self, model_name: str) -> str:
+    def _get_query_field_positions(self) -> Optional[Dict[str, int]]:
+        """Return the root Query field names mapped to their schema order, indexed once per introspector."""
+        if self._query_field_positions is not None:
+            return self._query_field_positions
+
         query_structure = self.get_model_structure("Query")
         if not query_structure:
             logger.error("Query type not found in schema")
-            return ""
+            return None
 
-        query_fields = query_structure["fields"]
-        prefix = f"list{model_name}By"
+        self._query_field_positions = {query["name"]: i for i, query in enumerate(query_structure["fields"])}
+        return self._query_field_positions
 
-        for query in query_fields:
-            query_name = query["name"]
-            if query_name.startswith(prefix):
-                field_name = query_name[len(prefix) :]
-                return field_name[0].lower() + field_name[1:] if field_name else ""
+    def _get_secondary_index(self, model_name: str) -> str:
+        if self._secondary_index_by_model is None:
+            query_positions = self._get_query_field_positions()
+            if query_positions is None:
+                return ""
+            self._secondary_index_by_model = self._index_secondary_indexes(query_positions)
 
-        return ""
+        return self._secondary_index_by_model.get(model_name, "")
+
+    @staticmethod
+    def _index_secondary_indexes(query_names: Iterable[str]) -> Dict[str, str]:
+        """Map each model to the field of its first list{Model}By{Field} query, in schema order.
+
+        Every "By" in a name is tried as the separator because model names may contain "By" themselves.
+        """
+        secondary_index_by_model: Dict[str, str] = {}
+        for query_name in query_names:
+            if not query_name.startswith("list"):
+                continue
+            separator = query_name.find("By", 4)
+            while separator != -1:
+                field_name = query_name[separator + 2 :]
+                secondary_index_by_model.setdefault(
+                    query_name[4:separator], field_name[0].lower() + field_name[1:] if field_name else ""
+                )
+                separator = query_name.find("By", separator + 1)
+        return secondary_index_by_model
 
     def get_list_query_name(self, model_name: str) -> Optional[str]:
-        query_structure = self.get_model_structure("Query")
-        if not query_structure:
-            logger.error("Query type not found in schema")
+        if model_name in self._list_query_name_cache:
+            return self._list_query_name_cache[model_name]
+
+        query_positions = self._get_query_field_positions()
+        if query_positions is None:
             return f"list{model_name}s"
 
-        query_fields = query_structure["fields"]
         p = inflect.engine()
 
         candidates = [f"list{model_name}"]
@@ -112,10 +194,11 @@ class SchemaIntrospector:
         full_plural_cap = full_plural[0].upper() + full_plural[1:] if full_plural else ""
         candidates.append(f"list{full_plural_cap}")
 
-        for query in query_fields:
-            query_name = query["name"]
-            if query_name in candidates and "By" not in query_name:
-                return str(query_name)
+        matches = [name for name in candidates if name in query_positions and "By" not in name]
+        if matches:
+            query_name = str(min(matches, key=query_positions.__getitem__))
+            self._list_query_name_cache[model_name] = query_name
+            return query_name
 
         logger.error(f"No list query found for model {model_name}, tried: {candidates}")
         return None
@@ -1,19 +1,19 @@
 #!/usr/bin/env python3
 """Script to automatically bump patch version in setup.py"""
 
+import os
 import re
 import sys
 
+VERSION_RE = re.compile(r'(version\s*=\s*["\'])([0-9]+\.[0-9]+\.[0-9]+)(["\'])')
 
-def get_current_version(setup_file="setup.py"):
-    with open(setup_file, "r") as f:
-        content = f.read()
 
-    match = re.search(r'version\s*=\s*["\']([0-9]+\.[0-9]+\.[0-9]+)["\']', content)
+def get_current_version(content):
+    match = VERSION_RE.search(content)
     if not match:
         raise ValueError("Could not find version in setup.py")
 
-    return match.group(1)
+    return match.group(2)
 
 
 def bump_patch_version(version):
@@ -22,35 +22,32 @@ def bump_patch_version(version):
     return f"{major}.{minor}.{new_patch}"
 
 
-def update_version_in_file(setup_file, old_version, new_version):
-    with open(setup_file, "r") as f:
-        content = f.read()
-
-    pattern = rf'version\s*=\s*["\']({re.escape(old_version)})["\']'
-    new_content = re.sub(pattern, f'version="{new_version}"', content)
-
-    with open(setup_file, "w") as f:
-        f.write(new_content)
-
-    return new_version
+def replace_version(content, new_version):
+    return VERSION_RE.sub(lambda m: f"{m.group(1)}{new_version}{m.group(3)}", content, count=1)
 
 
 def main():
     setup_file = "setup.py"
 
     try:
-        current_version = get_current_version(setup_file)
+        with open(setup_file, "r") as f:
+            content = f.read()
+
+        current_version = get_current_version(content)
         print(f"Current version: {current_version}")
 
         new_version = bump_patch_version(current_version)
         print(f"New version: {new_version}")
 
-        update_version_in_file(setup_file, current_version, new_version)
+        with open(setup_file, "w") as f:
+            f.write(replace_version(content, new_version))
         print(f"Updated {setup_file}")
 
         # Output for GitHub Actions
-        print(f"::set-output name=version::{new_version}")
-        print(f"::set-output name=old_version::{current_version}")
+        github_output = os.environ.get("GITHUB_OUTPUT")
+        if github_output:
+            with open(github_output, "a") as f:
+                f.write(f"version={new_version}\nold_version={current_version}\n")
 
         return 0
     except Exception as e:
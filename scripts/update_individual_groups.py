@@ -102,7 +102,9 @@ def main():
     print(f"  IndividualGroup fields: {[f['name'] for f in custom_type_fields]}")
 
     print("\nFetching existing Observation records (sequentialId → id)...")
-    records, _ = amplify_client.get_model_records("Observation", field_parser)
+    records, _, errors = amplify_client.get_complete_model_records("Observation", field_parser)
+    if errors:
+        sys.exit(f"  Failed to fetch Observation records: {'; '.join(errors)}")
     id_map = {str(r["sequentialId"]): r["id"] for r in records if "sequentialId" in r and "id" in r}
     print(f"  {len(id_map)} records found.")
 
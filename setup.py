@@ -9,7 +9,7 @@ with open("README.md", "r", encoding="utf-8") as fh:
 
 
 def _parse_requirements() -> dict[str, list[str]]:
-    buckets: dict[str, list[str]] = {"core": [], "agent": [], "dev": []}
+    buckets: dict[str, list[str]] = {"core": [], "fast": [], "agent": [], "dev": []}
     section = "core"
     for raw in (Path(__file__).parent / "requirements.txt").read_text().splitlines():
         line = raw.strip()
@@ -21,6 +21,8 @@ def _parse_requirements() -> dict[str, list[str]]:
                 section = "agent"
             elif "dev" in lowered:
                 section = "dev"
+            elif "fast" in lowered:
+                section = "fast"
             elif "core" in lowered:
                 section = "core"
             continue
@@ -51,6 +53,7 @@ setup(
     python_requires=">=3.11",
     install_requires=_requirements["core"],
     extras_require={
+        "fast": _requirements["fast"],
         "agent": _requirements["agent"],
         "dev": _requirements["dev"],
     },
@@ -0,0 +1,72 @@
+"""Tests for cached-token authentication"""
+
+import time
+from unittest.mock import MagicMock
+
+import jwt
+
+from amplify_excel_migrator.core.auth import CachedTokenAuthProvider, token_expiry
+
+
+class TestTokenExpiry:
+    """Test token_expiry helper"""
+
+    def test_reads_exp_claim(self):
+        token = jwt.encode({"exp": 1_900_000_000, "sub": "user"}, "secret", algorithm="HS256")
+        assert token_expiry(token) == 1_900_000_000.0
+
+    def test_returns_none_for_malformed_token(self):
+        assert token_expiry("not-a-jwt") is None
+
+    def test_returns_none_without_exp_claim(self):
+        token = jwt.encode({"sub": "user"}, "secret", algorithm="HS256")
+        assert token_expiry(token) is None
+
+
+class TestCachedTokenAuthProvider:
+    """Test CachedTokenAuthProvider"""
+
+    def test_serves_cached_token(self):
+        provider = CachedTokenAuthProvider("cached-token")
+
+        assert provider.is_authenticated()
+        assert provider.get_id_token() == "cached-token"
+        assert provider.authenticate("user", "ignored") is True
+
+    def test_expiry_round_trip(self):
+        exp = int(time.time()) + 3600
+        token = jwt.encode({"exp": exp}, "secret", algorithm="HS256")
+        assert token_expiry(CachedTokenAuthProvider(token).get_id_token()) == exp
+
+
+def _token(expires_in: float) -> str:
+    return jwt.encode({"exp": int(time.time() + expires_in)}, "secret", algorithm="HS256")
+
+
+class TestCachedTokenReauthentication:
+    """Test signing in again once the cached token nears expiry"""
+
+    def test_does_not_reauthenticate_with_fresh_token(self):
+        token = _token(3600)
+        reauthenticate = MagicMock()
+
+        assert CachedTokenAuthProvider(token, reauthenticate=reauthenticate).get_id_token() == token
+        reauthenticate.assert_not_called()
+
+    def test_reauthenticates_close_to_expiry(self):
+        new_token = _token(3600)
+        reauthenticate = MagicMock(return_value=new_token)
+        provider = CachedTokenAuthProvider(_token(60), reauthenticate=reauthenticate)
+
+        assert provider.get_id_token() == new_token
+        assert provider.get_id_token() == new_token
+        reauthenticate.assert_called_once()
+
+    def test_rejected_sign_in_is_not_retried_on_every_request(self):
+        token = _token(60)
+        reauthenticate = MagicMock(return_value=None)
+        provider = CachedTokenAuthProvider(token, reauthenticate=reauthenticate)
+
+        assert provider.get_id_token() == token
+        assert provider.get_id_token() == token
+        reauthenticate.assert_called_once()
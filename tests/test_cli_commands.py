@@ -1,7 +1,10 @@
 """Tests for CLI commands"""
 
 import json
+import subprocess
 import sys
+import time
+import jwt
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -12,9 +15,16 @@ from amplify_excel_migrator.cli.commands import (
     cmd_migrate,
     cmd_export_data,
     main,
+    _build_parser,
+    _append_records_sheet,
+    _iter_model_records,
+    _reauthenticate,
 )
 from amplify_excel_migrator.core import ConfigManager
 
+# Tests patch ConfigManager.__init__ to point it at a temporary config file; delegate so every attribute is set
+_real_config_init = ConfigManager.__init__
+
 
 @pytest.fixture
 def sample_config():
@@ -35,12 +45,46 @@ def mock_config_manager(tmp_path):
     test_config_file = tmp_path / "config.json"
 
     def init_mock(self, config_path=None):
-        self.config_path = test_config_file
-        self._config = {}
+        _real_config_init(self, str(test_config_file))
 
     return init_mock
 
 
+class TestCliImports:
+    """Test CLI start-up import cost"""
+
+    def test_importing_commands_does_not_load_heavy_dependencies(self):
+        """Test pandas and the auth stack are only imported by the commands that need them"""
+        code = (
+            "import sys, amplify_excel_migrator.cli.commands; "
+            "sys.exit(any(m in sys.modules for m in ('pandas', 'amplify_auth', 'aiohttp')))"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code])
+
+        assert result.returncode == 0
+
+
+class TestBuildParser:
+    """Test argument parser construction"""
+
+    def test_parser_is_built_once(self):
+        assert _build_parser() is _build_parser()
+
+    def test_cached_parser_parses_independent_invocations(self):
+        parser = _build_parser()
+
+        first = parser.parse_args(["export-data", "--model", "Reporter", "--concurrency", "2"])
+        second = parser.parse_args(["export-data", "--all"])
+
+        assert first.model == ["Reporter"]
+        assert first.concurrency == 2
+        assert second.all is True
+        assert second.model is None
+        assert second.concurrency == 4
+        assert second.limit is None
+
+
 class TestCmdShow:
     """Test 'show' command"""
 
@@ -62,8 +106,7 @@ class TestCmdShow:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         with patch.object(ConfigManager, "__init__", init_mock):
             cmd_show()
@@ -83,8 +126,7 @@ class TestCmdShow:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         with patch.object(ConfigManager, "__init__", init_mock):
             cmd_show()
@@ -101,8 +143,7 @@ class TestCmdConfig:
         test_config_file = tmp_path / "config.json"
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         # fill_unknown=no so the FK loop is skipped
         inputs = [
@@ -132,8 +173,7 @@ class TestCmdConfig:
         test_config_file = tmp_path / "config.json"
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         inputs = [
             "test.xlsx",
@@ -163,8 +203,7 @@ class TestCmdConfig:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         # sample_config has no fill_unknown so default is "no" — FK loop skipped
         # final "" declines the composite-keys prompt (default "no")
@@ -184,8 +223,7 @@ class TestCmdConfig:
         test_config_file = tmp_path / "config.json"
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         inputs = [
             "test.xlsx",
@@ -222,8 +260,7 @@ class TestCmdConfig:
             json.dump(existing, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         inputs = [
             "",
@@ -254,8 +291,7 @@ class TestCmdConfig:
         test_config_file = tmp_path / "config.json"
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         inputs = [
             "test.xlsx",
@@ -285,8 +321,7 @@ class TestCmdConfig:
         test_config_file = tmp_path / "config.json"
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         inputs = [
             "test.xlsx",
@@ -320,8 +355,7 @@ class TestCmdMigrate:
         test_config_file = tmp_path / "config.json"
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         with patch.object(ConfigManager, "__init__", init_mock):
             with pytest.raises(SystemExit) as exc_info:
@@ -342,14 +376,13 @@ class TestCmdMigrate:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         # Mock the entire migration process
         with patch.object(ConfigManager, "__init__", init_mock):
             with patch("amplify_auth.CognitoAuthProvider") as mock_auth_provider_class:
-                with patch("amplify_excel_migrator.cli.commands.ExcelReader") as mock_excel_reader_class:
-                    with patch("amplify_excel_migrator.cli.commands.MigrationOrchestrator") as mock_orchestrator_class:
+                with patch("amplify_excel_migrator.data.ExcelReader") as mock_excel_reader_class:
+                    with patch("amplify_excel_migrator.migration.MigrationOrchestrator") as mock_orchestrator_class:
                         with patch(
                             "amplify_excel_migrator.core.config.getpass",
                             return_value="password123",
@@ -394,13 +427,12 @@ class TestCmdMigrate:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         with patch.object(ConfigManager, "__init__", init_mock):
             with patch("amplify_auth.CognitoAuthProvider") as mock_auth_provider_class:
-                with patch("amplify_excel_migrator.cli.commands.ExcelReader") as mock_excel_reader_class:
-                    with patch("amplify_excel_migrator.cli.commands.MigrationOrchestrator") as mock_orchestrator_class:
+                with patch("amplify_excel_migrator.data.ExcelReader") as mock_excel_reader_class:
+                    with patch("amplify_excel_migrator.migration.MigrationOrchestrator") as mock_orchestrator_class:
                         with patch(
                             "amplify_excel_migrator.core.config.getpass",
                             return_value="secret_password",
@@ -435,12 +467,11 @@ class TestCmdMigrate:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         with patch.object(ConfigManager, "__init__", init_mock):
             with patch("amplify_auth.CognitoAuthProvider") as mock_auth_provider_class:
-                with patch("amplify_excel_migrator.cli.commands.MigrationOrchestrator") as mock_orchestrator_class:
+                with patch("amplify_excel_migrator.migration.MigrationOrchestrator") as mock_orchestrator_class:
                     with patch(
                         "amplify_excel_migrator.core.config.getpass",
                         return_value="wrong_password",
@@ -452,12 +483,144 @@ class TestCmdMigrate:
                         mock_orchestrator_instance = MagicMock()
                         mock_orchestrator_class.return_value = mock_orchestrator_instance
 
-                        cmd_migrate()
+                        with pytest.raises(SystemExit) as exc_info:
+                            cmd_migrate()
 
+                        assert exc_info.value.code == 1
                         # Verify the migration flow was NOT driven
                         mock_orchestrator_instance.build_plan.assert_not_called()
 
 
+class TestReauthenticate:
+    """Test signing in again when a cached token nears expiry"""
+
+    def test_prompts_for_password_and_caches_new_token(self, tmp_path, sample_config):
+        config_manager = ConfigManager(str(tmp_path / "config.json"))
+        new_token = jwt.encode({"exp": int(time.time()) + 3600}, "secret", algorithm="HS256")
+
+        with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_excel_migrator.core.config.getpass", return_value="password") as mock_getpass:
+                mock_auth_class.return_value.authenticate.return_value = True
+                mock_auth_class.return_value.get_id_token.return_value = new_token
+
+                assert _reauthenticate(config_manager, sample_config) == new_token
+
+        mock_getpass.assert_called_once()
+        mock_auth_class.return_value.authenticate.assert_called_once_with(sample_config["username"], "password")
+        identity = f"{sample_config['user_pool_id']}:{sample_config['client_id']}:{sample_config['username']}"
+        assert config_manager.load_token(identity) == new_token
+
+    def test_returns_none_when_rejected(self, tmp_path, sample_config):
+        config_manager = ConfigManager(str(tmp_path / "config.json"))
+
+        with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_excel_migrator.core.config.getpass", return_value="wrong"):
+                mock_auth_class.return_value.authenticate.return_value = False
+
+                assert _reauthenticate(config_manager, sample_config) is None
+
+
+class TestIterModelRecords:
+    """Test concurrent model fetching for export-data"""
+
+    def test_yields_results_in_model_order(self):
+        client = MagicMock()
+        client.get_complete_model_records.side_effect = lambda model_name, *_: ([{"name": model_name}], "name", [])
+
+        results = list(_iter_model_records(client, MagicMock(), ["A", "B", "C", "D", "E"], concurrency=2))
+
+        assert [name for name, *_ in results] == ["A", "B", "C", "D", "E"]
+        assert results[2] == ("C", [{"name": "C"}], "name", [])
+
+    def test_passes_limit_to_each_fetch(self):
+        client = MagicMock()
+        client.get_complete_model_records.return_value = ([], "id", [])
+        field_parser = MagicMock()
+
+        list(_iter_model_records(client, field_parser, ["A", "B"], concurrency=2, limit=10))
+
+        assert [c.args for c in client.get_complete_model_records.call_args_list] == [
+            ("A", field_parser, 10),
+            ("B", field_parser, 10),
+        ]
+
+    def test_reports_fetch_errors_per_model(self):
+        client = MagicMock()
+        error = RuntimeError("boom")
+
+        def get_model_records(model_name, *_):
+            if model_name == "Broken":
+                raise error
+            return [{"id": "1"}], "id", []
+
+        client.get_complete_model_records.side_effect = get_model_records
+
+        results = list(_iter_model_records(client, MagicMock(), ["Ok", "Broken", "Other"], concurrency=3))
+
+        assert results[1] == ("Broken", None, None, ["boom"])
+        assert results[2][3] == []
+
+    def test_concurrent_export_leaves_records_cache_empty(self):
+        from amplify_excel_migrator.client import AmplifyClient
+
+        client = AmplifyClient(api_endpoint="https://example.com/graphql")
+        client._executor.get_model_structure = MagicMock(return_value={"data": {}})
+        client._executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        client._executor._get_list_query_name = lambda model_name: f"list{model_name}s"
+        page = {"items": [{"id": "1", "name": "x"}], "nextToken": None}
+        client._executor.client.request = MagicMock(
+            return_value={"data": {"listAs": page, "listBs": page, "listCs": page}}
+        )
+        field_parser = MagicMock()
+        field_parser.metadata_fields = set()
+        field_parser.parse_model_structure.return_value = {
+            "fields": [{"name": "name", "is_scalar": True, "is_enum": False, "is_id": False}]
+        }
+
+        results = list(_iter_model_records(client, field_parser, ["A", "B", "C"], concurrency=3))
+
+        assert [(name, records) for name, records, *_ in results] == [
+            ("A", [{"id": "1", "name": "x"}]),
+            ("B", [{"id": "1", "name": "x"}]),
+            ("C", [{"id": "1", "name": "x"}]),
+        ]
+        assert len(client._executor.records_cache) == 0
+
+
+class TestAppendRecordsSheet:
+    """Test the write-only sheet writer used by export"""
+
+    def _write_and_reload(self, tmp_path, df):
+        from openpyxl import Workbook, load_workbook
+
+        workbook = Workbook(write_only=True)
+        _append_records_sheet(workbook, "Reporter", df)
+        output_file = tmp_path / "export.xlsx"
+        workbook.save(output_file)
+        return load_workbook(output_file)["Reporter"]
+
+    def test_header_is_plain_bold(self, tmp_path):
+        sheet = self._write_and_reload(tmp_path, pd.DataFrame({"name": ["Alice"], "age": [30]}))
+
+        header = sheet[1]
+        assert [cell.value for cell in header] == ["name", "age"]
+        for cell in header:
+            assert cell.font.b is True
+            assert cell.border.left.style is None
+            assert cell.border.bottom.style is None
+            assert cell.alignment.horizontal is None
+
+    def test_writes_non_scalar_cells_as_text(self, tmp_path):
+        df = pd.DataFrame({"name": ["Alice", None], "tags": [["a", "b"], {"k": 1}]})
+
+        sheet = self._write_and_reload(tmp_path, df)
+
+        assert [[cell.value for cell in row] for row in sheet.iter_rows(min_row=2)] == [
+            ["Alice", "['a', 'b']"],
+            [None, "{'k': 1}"],
+        ]
+
+
 class TestCmdExportData:
     """Test 'export-data' command"""
 
@@ -465,13 +628,14 @@ class TestCmdExportData:
         test_config_file = tmp_path / "config.json"
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         args = MagicMock()
         args.model = ["Reporter"]
         args.output = None
         args.all = False
+        args.concurrency = 4
+        args.limit = None
 
         with patch.object(ConfigManager, "__init__", init_mock):
             with pytest.raises(SystemExit) as exc_info:
@@ -490,16 +654,17 @@ class TestCmdExportData:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         args = MagicMock()
         args.model = ["Reporter"]
         args.output = None
         args.all = False
+        args.concurrency = 4
+        args.limit = None
 
         with patch.object(ConfigManager, "__init__", init_mock):
-            with patch("amplify_excel_migrator.cli.commands.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
                 with patch(
                     "amplify_excel_migrator.core.config.getpass",
                     return_value="wrong",
@@ -508,9 +673,12 @@ class TestCmdExportData:
                     mock_auth_instance.authenticate.return_value = False
                     mock_auth_class.return_value = mock_auth_instance
 
-                    cmd_export_data(args)
+                    with pytest.raises(SystemExit) as exc_info:
+                        cmd_export_data(args)
 
+        assert exc_info.value.code == 1
         captured = capsys.readouterr()
+        assert "Authentication failed" in captured.out
         assert "Exported" not in captured.out
 
     def test_export_data_exports_records_to_excel(self, tmp_path, sample_config):
@@ -521,8 +689,7 @@ class TestCmdExportData:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         output_file = str(tmp_path / "Reporter_records.xlsx")
 
@@ -530,6 +697,8 @@ class TestCmdExportData:
         args.model = ["Reporter"]
         args.output = output_file
         args.all = False
+        args.concurrency = 4
+        args.limit = None
 
         records = [
             {"name": "Zara"},
@@ -538,18 +707,18 @@ class TestCmdExportData:
         ]
 
         with patch.object(ConfigManager, "__init__", init_mock):
-            with patch("amplify_excel_migrator.cli.commands.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
                 with patch(
                     "amplify_excel_migrator.core.config.getpass",
                     return_value="password",
                 ):
-                    with patch("amplify_excel_migrator.cli.commands.AmplifyClient") as mock_client_class:
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
                         mock_auth_instance = MagicMock()
                         mock_auth_instance.authenticate.return_value = True
                         mock_auth_class.return_value = mock_auth_instance
 
                         mock_client_instance = MagicMock()
-                        mock_client_instance.get_model_records.return_value = (records, "name")
+                        mock_client_instance.get_complete_model_records.return_value = (records, "name", [])
                         mock_client_class.return_value = mock_client_instance
 
                         cmd_export_data(args)
@@ -559,6 +728,141 @@ class TestCmdExportData:
         assert list(df.columns)[0] == "name"
         assert list(df["name"]) == ["Alice", "Bob", "Zara"]
 
+    def test_export_data_sorts_case_insensitively_and_stably(self, tmp_path, sample_config):
+        test_config_file = tmp_path / "config.json"
+        test_config_file.write_text(json.dumps(sample_config))
+
+        def init_mock(self, config_path=None):
+            _real_config_init(self, str(test_config_file))
+
+        output_file = str(tmp_path / "Reporter_records.xlsx")
+
+        args = MagicMock()
+        args.model = ["Reporter"]
+        args.output = output_file
+        args.all = False
+        args.concurrency = 4
+        args.limit = None
+
+        records = [
+            {"id": "1", "name": "bob"},
+            {"id": "2", "name": "Alice"},
+            {"id": "3", "name": "alice"},
+            {"id": "4", "name": 10},
+        ]
+
+        with patch.object(ConfigManager, "__init__", init_mock):
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
+                with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
+                        mock_auth_class.return_value.authenticate.return_value = True
+                        mock_client_class.return_value.get_complete_model_records.return_value = (records, "name", [])
+
+                        cmd_export_data(args)
+
+        df = pd.read_excel(output_file, engine="openpyxl", dtype=str)
+        assert list(df["id"]) == ["4", "2", "3", "1"]
+
+    def test_export_data_writes_nested_values_as_text_and_blanks_for_missing(self, tmp_path, sample_config):
+        test_config_file = tmp_path / "config.json"
+        test_config_file.write_text(json.dumps(sample_config))
+
+        def init_mock(self, config_path=None):
+            _real_config_init(self, str(test_config_file))
+
+        output_file = str(tmp_path / "Reporter_records.xlsx")
+
+        args = MagicMock()
+        args.model = ["Reporter"]
+        args.output = output_file
+        args.all = False
+        args.concurrency = 4
+        args.limit = None
+
+        records = [
+            {"id": "1", "name": "Alice", "age": 30, "tags": ["a", "b"]},
+            {"id": "2", "name": "Bob", "age": None, "tags": None},
+        ]
+
+        with patch.object(ConfigManager, "__init__", init_mock):
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
+                with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
+                        mock_auth_class.return_value.authenticate.return_value = True
+                        mock_client_class.return_value.get_complete_model_records.return_value = (records, "name", [])
+
+                        cmd_export_data(args)
+
+        df = pd.read_excel(output_file, engine="openpyxl")
+        assert df["tags"].iloc[0] == "['a', 'b']"
+        assert df["age"].iloc[0] == 30
+        assert pd.isna(df["age"].iloc[1])
+        assert pd.isna(df["tags"].iloc[1])
+
+    def test_export_data_moves_id_and_primary_field_first(self, tmp_path, sample_config):
+        test_config_file = tmp_path / "config.json"
+        test_config_file.write_text(json.dumps(sample_config))
+
+        def init_mock(self, config_path=None):
+            _real_config_init(self, str(test_config_file))
+
+        output_file = str(tmp_path / "Reporter_records.xlsx")
+
+        args = MagicMock()
+        args.model = ["Reporter"]
+        args.output = output_file
+        args.all = False
+        args.concurrency = 4
+        args.limit = None
+
+        records = [{"bio": "x", "name": "Alice", "email": "a@b.c", "id": "1"}]
+
+        with patch.object(ConfigManager, "__init__", init_mock):
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
+                with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
+                        mock_auth_class.return_value.authenticate.return_value = True
+                        mock_client_class.return_value.get_complete_model_records.return_value = (records, "name", [])
+
+                        cmd_export_data(args)
+
+        df = pd.read_excel(output_file, engine="openpyxl")
+        assert list(df.columns) == ["id", "name", "bio", "email"]
+
+    def test_export_data_reuses_cached_token_without_password_prompt(self, tmp_path, sample_config):
+        test_config_file = tmp_path / "config.json"
+        test_config_file.write_text(json.dumps(sample_config))
+
+        def init_mock(self, config_path=None):
+            _real_config_init(self, str(test_config_file))
+
+        identity = f"{sample_config['user_pool_id']}:{sample_config['client_id']}:{sample_config['username']}"
+        ConfigManager(str(test_config_file)).save_token(identity, "cached-id-token", time.time() + 3600)
+
+        args = MagicMock()
+        args.model = ["Reporter"]
+        args.output = str(tmp_path / "out.xlsx")
+        args.all = False
+        args.concurrency = 4
+        args.limit = None
+
+        with patch.object(ConfigManager, "__init__", init_mock):
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
+                with patch("amplify_excel_migrator.core.config.getpass") as mock_getpass:
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
+                        mock_client_class.return_value.get_complete_model_records.return_value = (
+                            [{"name": "Alice"}],
+                            "name",
+                            [],
+                        )
+
+                        cmd_export_data(args)
+
+        mock_getpass.assert_not_called()
+        mock_auth_class.assert_not_called()
+        auth_provider = mock_client_class.call_args.kwargs["auth_provider"]
+        assert auth_provider.get_id_token() == "cached-id-token"
+
     def test_export_data_handles_no_records(self, tmp_path, sample_config, capsys):
         test_config_file = tmp_path / "config.json"
         test_config_file.parent.mkdir(parents=True, exist_ok=True)
@@ -567,27 +871,28 @@ class TestCmdExportData:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         args = MagicMock()
         args.model = ["Reporter"]
         args.output = None
         args.all = False
+        args.concurrency = 4
+        args.limit = None
 
         with patch.object(ConfigManager, "__init__", init_mock):
-            with patch("amplify_excel_migrator.cli.commands.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
                 with patch(
                     "amplify_excel_migrator.core.config.getpass",
                     return_value="password",
                 ):
-                    with patch("amplify_excel_migrator.cli.commands.AmplifyClient") as mock_client_class:
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
                         mock_auth_instance = MagicMock()
                         mock_auth_instance.authenticate.return_value = True
                         mock_auth_class.return_value = mock_auth_instance
 
                         mock_client_instance = MagicMock()
-                        mock_client_instance.get_model_records.return_value = ([], "name")
+                        mock_client_instance.get_complete_model_records.return_value = ([], "name", [])
                         mock_client_class.return_value = mock_client_instance
 
                         cmd_export_data(args)
@@ -595,6 +900,33 @@ class TestCmdExportData:
         captured = capsys.readouterr()
         assert "No records found" in captured.out
 
+    def test_export_data_writes_no_file_when_no_records(self, tmp_path, sample_config):
+        test_config_file = tmp_path / "config.json"
+        test_config_file.write_text(json.dumps(sample_config))
+
+        def init_mock(self, config_path=None):
+            _real_config_init(self, str(test_config_file))
+
+        output_file = tmp_path / "empty.xlsx"
+
+        args = MagicMock()
+        args.model = ["Reporter", "Article"]
+        args.output = str(output_file)
+        args.all = False
+        args.concurrency = 4
+        args.limit = None
+
+        with patch.object(ConfigManager, "__init__", init_mock):
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
+                with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
+                        mock_auth_class.return_value.authenticate.return_value = True
+                        mock_client_class.return_value.get_complete_model_records.return_value = ([], "name", [])
+
+                        cmd_export_data(args)
+
+        assert not output_file.exists()
+
     def test_export_data_multiple_models(self, tmp_path, sample_config):
         test_config_file = tmp_path / "config.json"
         test_config_file.parent.mkdir(parents=True, exist_ok=True)
@@ -603,8 +935,7 @@ class TestCmdExportData:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         output_file = str(tmp_path / "multi.xlsx")
 
@@ -612,24 +943,26 @@ class TestCmdExportData:
         args.model = ["Reporter", "Article"]
         args.output = output_file
         args.all = False
+        args.concurrency = 4
+        args.limit = None
 
-        def mock_get_records(model_name, field_parser):
+        def mock_get_records(model_name, field_parser, limit):
             if model_name == "Reporter":
-                return ([{"name": "Alice"}, {"name": "Bob"}], "name")
+                return ([{"name": "Alice"}, {"name": "Bob"}], "name", [])
             elif model_name == "Article":
-                return ([{"title": "News"}], "title")
-            return ([], "id")
+                return ([{"title": "News"}], "title", [])
+            return ([], "id", [])
 
         with patch.object(ConfigManager, "__init__", init_mock):
-            with patch("amplify_excel_migrator.cli.commands.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
                 with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
-                    with patch("amplify_excel_migrator.cli.commands.AmplifyClient") as mock_client_class:
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
                         mock_auth_instance = MagicMock()
                         mock_auth_instance.authenticate.return_value = True
                         mock_auth_class.return_value = mock_auth_instance
 
                         mock_client_instance = MagicMock()
-                        mock_client_instance.get_model_records.side_effect = mock_get_records
+                        mock_client_instance.get_complete_model_records.side_effect = mock_get_records
                         mock_client_class.return_value = mock_client_instance
 
                         cmd_export_data(args)
@@ -645,6 +978,41 @@ class TestCmdExportData:
         df_article = pd.read_excel(output_file, sheet_name="Article", engine="openpyxl")
         assert list(df_article["title"]) == ["News"]
 
+    def test_export_data_skips_incomplete_models_and_exits_nonzero(self, tmp_path, sample_config, capsys):
+        test_config_file = tmp_path / "config.json"
+        test_config_file.write_text(json.dumps(sample_config))
+
+        def init_mock(self, config_path=None):
+            _real_config_init(self, str(test_config_file))
+
+        output_file = str(tmp_path / "export.xlsx")
+
+        args = MagicMock()
+        args.model = ["Reporter", "Article"]
+        args.output = output_file
+        args.all = False
+        args.concurrency = 4
+        args.limit = None
+
+        with patch.object(ConfigManager, "__init__", init_mock):
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
+                with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
+                        mock_auth_class.return_value.authenticate.return_value = True
+                        mock_client_class.return_value.get_complete_model_records.side_effect = lambda model_name, *_: {
+                            "Reporter": ([{"name": "Alice"}], "name", []),
+                            "Article": ([], "title", ["Incomplete listing of Article"]),
+                        }[model_name]
+
+                        with pytest.raises(SystemExit) as exc_info:
+                            cmd_export_data(args)
+
+        assert exc_info.value.code == 1
+        assert pd.ExcelFile(output_file, engine="openpyxl").sheet_names == ["Reporter"]
+        captured = capsys.readouterr()
+        assert "Incomplete listing of Article" in captured.out
+        assert "1 model(s) could not be fully fetched" in captured.out
+
     def test_export_data_all_flag(self, tmp_path, sample_config, capsys):
         test_config_file = tmp_path / "config.json"
         test_config_file.parent.mkdir(parents=True, exist_ok=True)
@@ -653,8 +1021,7 @@ class TestCmdExportData:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         output_file = str(tmp_path / "all.xlsx")
 
@@ -662,12 +1029,14 @@ class TestCmdExportData:
         args.model = None
         args.output = output_file
         args.all = True
+        args.concurrency = 4
+        args.limit = None
 
         with patch.object(ConfigManager, "__init__", init_mock):
-            with patch("amplify_excel_migrator.cli.commands.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
                 with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
-                    with patch("amplify_excel_migrator.cli.commands.AmplifyClient") as mock_client_class:
-                        with patch("amplify_excel_migrator.cli.commands.SchemaExporter") as mock_exporter_class:
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
+                        with patch("amplify_excel_migrator.schema.SchemaExporter") as mock_exporter_class:
                             mock_auth_instance = MagicMock()
                             mock_auth_instance.authenticate.return_value = True
                             mock_auth_class.return_value = mock_auth_instance
@@ -677,10 +1046,10 @@ class TestCmdExportData:
                             mock_exporter_class.return_value = mock_exporter_instance
 
                             mock_client_instance = MagicMock()
-                            mock_client_instance.get_model_records.side_effect = [
-                                ([{"name": "Alice"}], "name"),
-                                ([{"title": "News"}], "title"),
-                            ]
+                            mock_client_instance.get_complete_model_records.side_effect = lambda model_name, *_: {
+                                "Reporter": ([{"name": "Alice"}], "name", []),
+                                "Article": ([{"title": "News"}], "title", []),
+                            }[model_name]
                             mock_client_class.return_value = mock_client_instance
 
                             cmd_export_data(args)
@@ -698,8 +1067,7 @@ class TestCmdExportData:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         output_file = str(tmp_path / "partial.xlsx")
 
@@ -707,12 +1075,14 @@ class TestCmdExportData:
         args.model = None
         args.output = output_file
         args.all = True
+        args.concurrency = 4
+        args.limit = None
 
         with patch.object(ConfigManager, "__init__", init_mock):
-            with patch("amplify_excel_migrator.cli.commands.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
                 with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
-                    with patch("amplify_excel_migrator.cli.commands.AmplifyClient") as mock_client_class:
-                        with patch("amplify_excel_migrator.cli.commands.SchemaExporter") as mock_exporter_class:
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
+                        with patch("amplify_excel_migrator.schema.SchemaExporter") as mock_exporter_class:
                             mock_auth_instance = MagicMock()
                             mock_auth_instance.authenticate.return_value = True
                             mock_auth_class.return_value = mock_auth_instance
@@ -722,11 +1092,11 @@ class TestCmdExportData:
                             mock_exporter_class.return_value = mock_exporter_instance
 
                             mock_client_instance = MagicMock()
-                            mock_client_instance.get_model_records.side_effect = [
-                                ([{"name": "Alice"}], "name"),
-                                ([], "id"),
-                                ([{"title": "News"}], "title"),
-                            ]
+                            mock_client_instance.get_complete_model_records.side_effect = lambda model_name, *_: {
+                                "Reporter": ([{"name": "Alice"}], "name", []),
+                                "EmptyModel": ([], "id", []),
+                                "Article": ([{"title": "News"}], "title", []),
+                            }[model_name]
                             mock_client_class.return_value = mock_client_instance
 
                             cmd_export_data(args)
@@ -748,8 +1118,7 @@ class TestCmdExportData:
             json.dump(sample_config, f)
 
         def init_mock(self, config_path=None):
-            self.config_path = test_config_file
-            self._config = {}
+            _real_config_init(self, str(test_config_file))
 
         monkeypatch.chdir(tmp_path)
 
@@ -757,17 +1126,19 @@ class TestCmdExportData:
         args.model = ["Reporter"]
         args.output = None
         args.all = False
+        args.concurrency = 4
+        args.limit = None
 
         with patch.object(ConfigManager, "__init__", init_mock):
-            with patch("amplify_excel_migrator.cli.commands.CognitoAuthProvider") as mock_auth_class:
+            with patch("amplify_auth.CognitoAuthProvider") as mock_auth_class:
                 with patch("amplify_excel_migrator.core.config.getpass", return_value="password"):
-                    with patch("amplify_excel_migrator.cli.commands.AmplifyClient") as mock_client_class:
+                    with patch("amplify_excel_migrator.client.AmplifyClient") as mock_client_class:
                         mock_auth_instance = MagicMock()
                         mock_auth_instance.authenticate.return_value = True
                         mock_auth_class.return_value = mock_auth_instance
 
                         mock_client_instance = MagicMock()
-                        mock_client_instance.get_model_records.return_value = ([{"name": "Alice"}], "name")
+                        mock_client_instance.get_complete_model_records.return_value = ([{"name": "Alice"}], "name", [])
                         mock_client_class.return_value = mock_client_instance
 
                         cmd_export_data(args)
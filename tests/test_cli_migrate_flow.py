@@ -113,7 +113,7 @@ def test_declined_sheet_parse_failures_still_exported(mock_input):
     )
     orchestrator.execute.return_value = MigrationResult(sheets=[], total_success=0)
 
-    with patch("amplify_excel_migrator.cli.commands.FailureTracker") as mock_tracker_cls:
+    with patch("amplify_excel_migrator.migration.FailureTracker") as mock_tracker_cls:
         tracker_instance = MagicMock()
         tracker_instance.export_to_excel.return_value = "/path/to/data_failed_records.xlsx"
         mock_tracker_cls.from_failures_by_sheet.return_value = tracker_instance
@@ -133,7 +133,7 @@ def test_exports_failures_when_confirmed(mock_input):
         sheets=[SheetResult("Reporter", success_count=1, failures=[failure])], total_success=1
     )
 
-    with patch("amplify_excel_migrator.cli.commands.FailureTracker") as mock_tracker_cls:
+    with patch("amplify_excel_migrator.migration.FailureTracker") as mock_tracker_cls:
         tracker_instance = MagicMock()
         tracker_instance.export_to_excel.return_value = "/path/to/data_failed_records.xlsx"
         mock_tracker_cls.from_failures_by_sheet.return_value = tracker_instance
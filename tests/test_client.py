@@ -4,17 +4,23 @@ import pytest
 import pandas as pd
 from unittest.mock import MagicMock
 from amplify_excel_migrator.client import AmplifyClient
+from amplify_excel_migrator.graphql import GraphQLError
 from amplify_excel_migrator.schema import FieldParser
 
 
+@pytest.fixture
+def client():
+    return AmplifyClient(api_endpoint="https://test.com")
+
+
 class TestBuildForeignKeyLookups:
     """Test build_foreign_key_lookups method for performance optimization"""
 
-    def test_builds_lookup_cache_for_related_models(self):
+    def test_builds_lookup_cache_for_related_models(self, client):
         """Test that FK lookup cache is built correctly"""
-        client = AmplifyClient(api_endpoint="https://test.com")
-
-        client._executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        client._executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
         client._executor.get_records = MagicMock(
             return_value=[
                 {"id": "reporter-1", "name": "John Doe"},
@@ -43,14 +49,12 @@ class TestBuildForeignKeyLookups:
         assert result["Reporter"]["primary_field"] == "name"
 
         # Verify API was called once
-        client._executor.get_primary_field_name.assert_called_once_with("Reporter", parsed_model_structure)
+        client._executor.get_primary_field_names_batch.assert_called_once_with(["Reporter"])
         client._executor.get_records.assert_called_once_with("Reporter", "name", False)
 
-    def test_skips_non_id_fields(self):
+    def test_skips_non_id_fields(self, client):
         """Test that non-ID fields are skipped"""
-        client = AmplifyClient(api_endpoint="https://test.com")
-
-        client._executor.get_primary_field_name = MagicMock()
+        client._executor.get_primary_field_names_batch = MagicMock()
         client._executor.get_records = MagicMock()
 
         df = pd.DataFrame({"title": ["Story 1"], "content": ["Content 1"]})
@@ -65,14 +69,12 @@ class TestBuildForeignKeyLookups:
 
         # No lookups should be built
         assert result == {}
-        client._executor.get_primary_field_name.assert_not_called()
+        client._executor.get_primary_field_names_batch.assert_not_called()
         client._executor.get_records.assert_not_called()
 
-    def test_skips_fields_not_in_dataframe(self):
+    def test_skips_fields_not_in_dataframe(self, client):
         """Test that fields not in DataFrame columns are skipped"""
-        client = AmplifyClient(api_endpoint="https://test.com")
-
-        client._executor.get_primary_field_name = MagicMock()
+        client._executor.get_primary_field_names_batch = MagicMock()
 
         df = pd.DataFrame({"title": ["Story 1"]})
         parsed_model_structure = {
@@ -90,13 +92,13 @@ class TestBuildForeignKeyLookups:
 
         # No lookups should be built
         assert result == {}
-        client._executor.get_primary_field_name.assert_not_called()
+        client._executor.get_primary_field_names_batch.assert_not_called()
 
-    def test_infers_related_model_from_field_name(self):
+    def test_infers_related_model_from_field_name(self, client):
         """Test that related model is inferred when not explicitly provided"""
-        client = AmplifyClient(api_endpoint="https://test.com")
-
-        client._executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        client._executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
         client._executor.get_records = MagicMock(return_value=[{"id": "author-1", "name": "Author One"}])
 
         df = pd.DataFrame({"author": ["Author One"]})
@@ -114,13 +116,11 @@ class TestBuildForeignKeyLookups:
         assert result["Author"]["lookup"]["Author One"] == "author-1"
 
         # Verify API was called with inferred model name
-        client._executor.get_primary_field_name.assert_called_once_with("Author", parsed_model_structure)
+        client._executor.get_primary_field_names_batch.assert_called_once_with(["Author"])
 
-    def test_handles_errors_gracefully(self):
+    def test_handles_errors_gracefully(self, client):
         """Test that errors in fetching don't crash the whole process"""
-        client = AmplifyClient(api_endpoint="https://test.com")
-
-        client._executor.get_primary_field_name = MagicMock(side_effect=Exception("API Error"))
+        client._executor.get_primary_field_names_batch = MagicMock(side_effect=Exception("API Error"))
 
         df = pd.DataFrame({"photographer": ["John Doe"]})
         parsed_model_structure = {
@@ -140,11 +140,11 @@ class TestBuildForeignKeyLookups:
         # Cache should be empty but process continues
         assert result == {}
 
-    def test_deduplicates_same_related_model(self):
+    def test_deduplicates_same_related_model(self, client):
         """Test that the same related model is only fetched once"""
-        client = AmplifyClient(api_endpoint="https://test.com")
-
-        client._executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        client._executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
         client._executor.get_records = MagicMock(return_value=[{"id": "reporter-1", "name": "John Doe"}])
 
         df = pd.DataFrame({"photographer": ["John Doe"], "editor": ["Jane Smith"]})
@@ -172,14 +172,14 @@ class TestBuildForeignKeyLookups:
         assert "Reporter" in result
 
         # API should be called only once
-        client._executor.get_primary_field_name.assert_called_once()
+        client._executor.get_primary_field_names_batch.assert_called_once()
         client._executor.get_records.assert_called_once()
 
-    def test_handles_empty_records_response(self):
+    def test_handles_empty_records_response(self, client):
         """Test that empty records from API don't break the cache"""
-        client = AmplifyClient(api_endpoint="https://test.com")
-
-        client._executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        client._executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
         client._executor.get_records = MagicMock(return_value=None)  # API returns None
 
         df = pd.DataFrame({"photographer": ["John Doe"]})
@@ -199,11 +199,11 @@ class TestBuildForeignKeyLookups:
         # Cache should be empty
         assert result == {}
 
-    def test_filters_out_records_without_primary_field(self):
+    def test_filters_out_records_without_primary_field(self, client):
         """Test that records without the primary field are filtered out"""
-        client = AmplifyClient(api_endpoint="https://test.com")
-
-        client._executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        client._executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
         client._executor.get_records = MagicMock(
             return_value=[
                 {"id": "reporter-1", "name": "John Doe"},
@@ -244,9 +244,7 @@ class TestGetModelRecords:
             "fields": fields,
         }
 
-    def test_get_model_records_returns_records_and_primary_field(self):
-        client = AmplifyClient(api_endpoint="https://test.com")
-
+    def test_get_model_records_returns_records_and_primary_field(self, client):
         parsed = self._make_parsed_structure(
             [
                 {"name": "name", "is_scalar": True, "is_enum": False, "is_id": False, "is_list": False},
@@ -270,9 +268,7 @@ class TestGetModelRecords:
         assert primary_field == "name"
         client._executor.get_records.assert_called_once_with("Reporter", "name", True, fields=["id", "name"])
 
-    def test_get_model_records_raises_on_missing_model(self):
-        client = AmplifyClient(api_endpoint="https://test.com")
-
+    def test_get_model_records_raises_on_missing_model(self, client):
         field_parser = MagicMock(spec=FieldParser)
         field_parser.metadata_fields = {"id", "createdAt", "updatedAt", "owner"}
         field_parser.parse_model_structure.side_effect = ValueError("Invalid sheet name or model does not exist")
@@ -281,9 +277,7 @@ class TestGetModelRecords:
         with pytest.raises(ValueError, match="model does not exist"):
             client.get_model_records("NonExistent", field_parser)
 
-    def test_get_model_records_returns_empty_list_when_no_records(self):
-        client = AmplifyClient(api_endpoint="https://test.com")
-
+    def test_get_model_records_returns_empty_list_when_no_records(self, client):
         parsed = self._make_parsed_structure(
             [
                 {"name": "name", "is_scalar": True, "is_enum": False, "is_id": False, "is_list": False},
@@ -302,9 +296,7 @@ class TestGetModelRecords:
         assert result_records == []
         assert primary_field == "name"
 
-    def test_get_model_records_includes_enum_and_id_fields(self):
-        client = AmplifyClient(api_endpoint="https://test.com")
-
+    def test_get_model_records_includes_enum_and_id_fields(self, client):
         parsed = self._make_parsed_structure(
             [
                 {"name": "name", "is_scalar": True, "is_enum": False, "is_id": False, "is_list": False},
@@ -333,6 +325,58 @@ class TestGetModelRecords:
         assert "bio" not in fields
 
 
+class TestGetCompleteModelRecords:
+    """Test get_complete_model_records method"""
+
+    @pytest.fixture
+    def field_parser(self):
+        field_parser = MagicMock(spec=FieldParser)
+        field_parser.metadata_fields = {"id", "createdAt", "updatedAt", "owner"}
+        field_parser.parse_model_structure.return_value = {
+            "name": "Reporter",
+            "fields": [{"name": "name", "is_scalar": True, "is_enum": False, "is_id": False, "is_list": False}],
+        }
+        return field_parser
+
+    @pytest.fixture(autouse=True)
+    def _structure(self, client):
+        client._executor.get_model_structure = MagicMock(return_value={"data": {}})
+        client._executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+
+    def test_streams_records_without_errors(self, client, field_parser):
+        records = [{"id": "1", "name": "Alice"}]
+        client._executor.get_records = MagicMock()
+        client._executor.iter_records = MagicMock(return_value=iter(records))
+
+        result = client.get_complete_model_records("Reporter", field_parser)
+
+        assert result == (records, "name", [])
+        client._executor.iter_records.assert_called_once_with("Reporter", fields=["id", "name"], limit=None)
+        client._executor.get_records.assert_not_called()
+
+    def test_returns_only_the_first_records_with_limit(self, client, field_parser):
+        client._executor.iter_records = MagicMock(return_value=iter([{"id": "1", "name": "Alice"}]))
+
+        result = client.get_complete_model_records("Reporter", field_parser, limit=1)
+
+        assert result == ([{"id": "1", "name": "Alice"}], "name", [])
+        client._executor.iter_records.assert_called_once_with("Reporter", fields=["id", "name"], limit=1)
+
+    def test_reports_incomplete_listing(self, client, field_parser):
+        client._executor.iter_records = MagicMock(side_effect=GraphQLError("Failed to fetch a page of listReporters"))
+
+        result = client.get_complete_model_records("Reporter", field_parser)
+
+        assert result == ([], "name", ["Failed to fetch a page of listReporters"])
+
+    def test_reports_failed_page_with_limit(self, client, field_parser):
+        client._executor.iter_records = MagicMock(side_effect=GraphQLError("Failed to fetch a page of listReporters"))
+
+        result = client.get_complete_model_records("Reporter", field_parser, limit=5)
+
+        assert result == ([], "name", ["Failed to fetch a page of listReporters"])
+
+
 def test_amplify_client_forwards_composite_unique_fields():
     from amplify_excel_migrator.client import AmplifyClient
 
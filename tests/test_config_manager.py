@@ -1,6 +1,8 @@
 """Tests for ConfigManager class"""
 
 import json
+import os
+import time
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -71,6 +73,26 @@ class TestConfigManagerLoad:
         result = temp_config_manager.load()
         assert result == {}
 
+    def test_load_reuses_parsed_config_while_file_is_unchanged(self, temp_config_manager, sample_config):
+        """Test repeated loads skip re-parsing an unchanged file"""
+        temp_config_manager.save(sample_config)
+
+        with patch("amplify_excel_migrator.core.config.json.load") as mock_json_load:
+            result = temp_config_manager.load()
+
+        mock_json_load.assert_not_called()
+        assert result == sample_config
+
+    def test_load_rereads_file_after_external_change(self, temp_config_manager, sample_config):
+        """Test a modified file is parsed again"""
+        temp_config_manager.save(sample_config)
+        temp_config_manager.load()
+
+        temp_config_manager.config_path.write_text(json.dumps({"region": "eu-west-1"}))
+        os.utime(temp_config_manager.config_path, ns=(0, 1))
+
+        assert temp_config_manager.load() == {"region": "eu-west-1"}
+
 
 class TestConfigManagerSave:
     """Test ConfigManager.save() method"""
@@ -268,6 +290,17 @@ class TestConfigManagerGetOrPrompt:
             result = temp_config_manager.get_or_prompt("missing_key", "Test prompt", "default123")
             assert result == "default123"
 
+    def test_get_or_prompt_many_prompts_only_for_missing_keys(self, temp_config_manager):
+        """Test that several keys resolve from one snapshot, prompting in spec order"""
+        temp_config_manager._config = {"region": "eu-west-1"}
+        specs = [("api_endpoint", "API endpoint", ""), ("region", "AWS Region", "us-east-1"), ("username", "User", "")]
+
+        with patch("builtins.input", side_effect=["https://api", "admin"]) as mock_input:
+            result = temp_config_manager.get_or_prompt_many(specs)
+
+        assert result == {"api_endpoint": "https://api", "region": "eu-west-1", "username": "admin"}
+        assert [c.args[0] for c in mock_input.call_args_list] == ["API endpoint: ", "User: "]
+
     def test_get_or_prompt_loads_config_if_empty(self, temp_config_manager, sample_config):
         """Test that get_or_prompt loads config if _config is empty"""
         temp_config_manager.config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -345,3 +378,57 @@ class TestConfigManagerIntegration:
         manager2 = ConfigManager(str(config_file))
         loaded = manager2.load()
         assert loaded == sample_config
+
+
+class TestConfigManagerTokenCache:
+    """Test ConfigManager token persistence"""
+
+    def test_save_and_load_token(self, temp_config_manager):
+        """Test a fresh token is returned for the same identity"""
+        temp_config_manager.save_token("pool:client:user", "id-token", time.time() + 3600)
+
+        assert temp_config_manager.load_token("pool:client:user") == "id-token"
+
+    def test_token_file_is_private(self, temp_config_manager):
+        """Test the token file is only readable by its owner"""
+        temp_config_manager.save_token("pool:client:user", "id-token", time.time() + 3600)
+
+        assert temp_config_manager.token_path.stat().st_mode & 0o777 == 0o600
+
+    def test_existing_token_file_is_made_private(self, temp_config_manager):
+        """Test overwriting a token file with wider permissions restricts it to its owner"""
+        temp_config_manager.token_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_config_manager.token_path.write_text("{}")
+        temp_config_manager.token_path.chmod(0o644)
+
+        temp_config_manager.save_token("pool:client:user", "id-token", time.time() + 3600)
+
+        assert temp_config_manager.token_path.stat().st_mode & 0o777 == 0o600
+
+    def test_ignores_token_for_other_identity(self, temp_config_manager):
+        """Test a token cached for another user is not reused"""
+        temp_config_manager.save_token("pool:client:someone", "id-token", time.time() + 3600)
+
+        assert temp_config_manager.load_token("pool:client:user") is None
+
+    def test_ignores_token_close_to_expiry(self, temp_config_manager):
+        """Test tokens expiring within the minimum TTL are not reused"""
+        temp_config_manager.save_token("pool:client:user", "id-token", time.time() + 30)
+
+        assert temp_config_manager.load_token("pool:client:user") is None
+
+    def test_missing_or_corrupt_token_file(self, temp_config_manager):
+        """Test unreadable token caches are treated as absent"""
+        assert temp_config_manager.load_token("pool:client:user") is None
+
+        temp_config_manager.token_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_config_manager.token_path.write_text("not json")
+        assert temp_config_manager.load_token("pool:client:user") is None
+
+    def test_clear_removes_token(self, temp_config_manager):
+        """Test clear() also drops the cached token"""
+        temp_config_manager.save_token("pool:client:user", "id-token", time.time() + 3600)
+
+        temp_config_manager.clear()
+
+        assert not temp_config_manager.token_path.exists()
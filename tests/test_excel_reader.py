@@ -129,6 +129,40 @@ class TestInMemoryExcelReader:
         assert reader.read_all_sheets() is new_sheets
 
 
+class TestCalamineEngine:
+    """The optional calamine engine is used when installed, with openpyxl as the fallback"""
+
+    @patch("amplify_excel_migrator.data.excel_reader._CALAMINE_AVAILABLE", True)
+    @patch("amplify_excel_migrator.data.excel_reader.pd.read_excel")
+    def test_uses_calamine_when_installed(self, mock_read_excel):
+        mock_read_excel.return_value = {"Sheet1": pd.DataFrame()}
+
+        ExcelReader(file_path="/path/to/file.xlsx").read_all_sheets()
+
+        mock_read_excel.assert_called_once_with("/path/to/file.xlsx", sheet_name=None, engine="calamine")
+
+    @patch("amplify_excel_migrator.data.excel_reader._CALAMINE_AVAILABLE", True)
+    @patch("amplify_excel_migrator.data.excel_reader.pd.read_excel")
+    def test_falls_back_to_openpyxl_when_calamine_fails(self, mock_read_excel):
+        df = pd.DataFrame({"name": ["John"]})
+        mock_read_excel.side_effect = [RuntimeError("unsupported workbook"), df]
+
+        result = ExcelReader(file_path="/path/to/file.xlsx").read_sheet("Sheet1")
+
+        assert mock_read_excel.call_args_list[-1] == (("/path/to/file.xlsx",), {"sheet_name": "Sheet1"})
+        assert result.equals(df)
+
+    @patch("amplify_excel_migrator.data.excel_reader._CALAMINE_AVAILABLE", True)
+    @patch("amplify_excel_migrator.data.excel_reader.pd.read_excel")
+    def test_missing_file_is_not_retried(self, mock_read_excel):
+        mock_read_excel.side_effect = FileNotFoundError
+
+        with pytest.raises(FileNotFoundError, match="Excel file not found: /missing/file.xlsx"):
+            ExcelReader(file_path="/missing/file.xlsx").read_all_sheets()
+
+        mock_read_excel.assert_called_once()
+
+
 def _workbook_with_unknown_extension(path):
     openpyxl.Workbook().save(path)
     ext = (
@@ -2,7 +2,8 @@
 
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
-from amplify_excel_migrator.graphql import QueryExecutor, GraphQLClient
+from amplify_excel_migrator.graphql import QueryExecutor, GraphQLClient, GraphQLError
+from amplify_excel_migrator.graphql.query_builder import QueryBuilder
 
 
 @pytest.fixture
@@ -39,6 +40,10 @@ class TestQueryExecutorInit:
         executor = QueryExecutor(mock_client)
         assert executor.composite_unique_fields == {}
 
+    def test_initializes_with_max_concurrent_batches(self, mock_client):
+        assert QueryExecutor(mock_client).max_concurrent_batches == 4
+        assert QueryExecutor(mock_client, max_concurrent_batches=8).max_concurrent_batches == 8
+
 
 class TestCompositeMatching:
     """Test composite duplicate-key helpers"""
@@ -214,6 +219,22 @@ class TestListRecordsBySecondaryIndex:
 
         assert result is None
 
+    def test_builds_each_query_shape_once(self, executor):
+        executor.client.request = MagicMock(
+            return_value={"data": {"listStoryByTitle": {"items": [{"id": "1"}], "nextToken": None}}}
+        )
+
+        with patch(
+            "amplify_excel_migrator.graphql.executor.QueryBuilder.build_secondary_index_query",
+            wraps=QueryBuilder.build_secondary_index_query,
+        ) as build:
+            executor.list_records_by_secondary_index("Story", "title", value="First")
+            executor.list_records_by_secondary_index("Story", "title", value="Second")
+
+        build.assert_called_once()
+        first_query, second_query = (c.args[0] for c in executor.client.request.call_args_list)
+        assert first_query is second_query
+
 
 class TestListRecordsByField:
     """Test list_records_by_field method"""
@@ -253,6 +274,111 @@ class TestListRecordsByField:
 
         assert result is None
 
+    def test_returns_none_without_list_query(self, executor):
+        executor._get_list_query_name = MagicMock(return_value=None)
+
+        assert executor.list_records_by_field("Story", "title") is None
+        assert executor.list_records_by_secondary_index("Story", "title") is None
+        executor.client.request.assert_not_called()
+
+    def test_strict_listing_without_list_query_raises(self, executor):
+        executor._get_list_query_name = MagicMock(return_value=None)
+
+        with pytest.raises(GraphQLError, match="No list query found for model Story"):
+            executor.list_records_by_field("Story", "title", strict=True)
+
+
+class TestStrictListing:
+    """Test that strict listings refuse to return results cut short by a failed page"""
+
+    def _fail_second_page(self, executor):
+        executor._get_list_query_name = MagicMock(return_value="listStories")
+        executor.client.request = MagicMock(
+            side_effect=[{"data": {"listStories": {"items": [{"id": "1"}], "nextToken": "t1"}}}, None]
+        )
+
+    def test_lenient_listing_returns_partial_items(self, executor):
+        self._fail_second_page(executor)
+
+        assert executor.list_records_by_field("Story", "title") == [{"id": "1"}]
+
+    def test_strict_listing_by_field_raises(self, executor):
+        self._fail_second_page(executor)
+
+        with pytest.raises(GraphQLError, match="Incomplete listing of Story"):
+            executor.list_records_by_field("Story", "title", strict=True)
+
+    def test_strict_listing_by_secondary_index_raises(self, executor):
+        self._fail_second_page(executor)
+
+        with pytest.raises(GraphQLError, match="Incomplete listing of Story"):
+            executor.list_records_by_secondary_index("Story", "title", strict=True)
+
+    def test_strict_get_records_does_not_cache_partial_results(self, executor):
+        self._fail_second_page(executor)
+
+        with pytest.raises(GraphQLError):
+            executor.get_records("Story", "title", False, strict=True)
+
+        assert "Story" not in executor.records_cache
+
+
+class TestIterRecords:
+    """Test iter_records streaming"""
+
+    def test_yields_items_across_pages(self, executor):
+        executor._get_list_query_name = MagicMock(return_value="listStories")
+        executor.client.request = MagicMock(
+            side_effect=[
+                {"data": {"listStories": {"items": [{"id": "1"}, {"id": "2"}], "nextToken": "t1"}}},
+                {"data": {"listStories": {"items": [{"id": "3"}], "nextToken": None}}},
+            ]
+        )
+
+        records = executor.iter_records("Story", ["id"], page_size=2)
+
+        assert next(records) == {"id": "1"}
+        assert executor.client.request.call_count == 1
+        assert list(records) == [{"id": "2"}, {"id": "3"}]
+        assert executor.client.request.call_args.args[1] == {"limit": 2, "nextToken": "t1"}
+
+    def test_stops_after_limit(self, executor):
+        executor._get_list_query_name = MagicMock(return_value="listStories")
+        executor.client.request = MagicMock(
+            side_effect=[
+                {"data": {"listStories": {"items": [{"id": "1"}, {"id": "2"}], "nextToken": "t1"}}},
+                {"data": {"listStories": {"items": [{"id": "3"}], "nextToken": "t2"}}},
+            ]
+        )
+
+        records = list(executor.iter_records("Story", ["id"], page_size=2, limit=3))
+
+        assert records == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        assert executor.client.request.call_count == 2
+        assert executor.client.request.call_args.args[1] == {"limit": 1, "nextToken": "t1"}
+
+    def test_zero_limit_makes_no_requests(self, executor):
+        executor._get_list_query_name = MagicMock(return_value="listStories")
+        executor.client.request = MagicMock()
+
+        assert list(executor.iter_records("Story", limit=0)) == []
+        executor.client.request.assert_not_called()
+
+    def test_raises_when_page_fails(self, executor):
+        executor._get_list_query_name = MagicMock(return_value="listStories")
+        executor.client.request = MagicMock(
+            side_effect=[{"data": {"listStories": {"items": [{"id": "1"}], "nextToken": "t1"}}}, None]
+        )
+
+        with pytest.raises(GraphQLError):
+            list(executor.iter_records("Story"))
+
+    def test_raises_without_list_query(self, executor):
+        executor._get_list_query_name = MagicMock(return_value=None)
+
+        with pytest.raises(GraphQLError, match="No list query"):
+            list(executor.iter_records("Story"))
+
 
 class TestGetRecordById:
     """Test get_record_by_id method"""
@@ -312,6 +438,33 @@ class TestGetRecords:
         assert result is None
 
 
+class TestBoundedRecordsCache:
+    """records_cache_size caps the cached listings"""
+
+    def test_unbounded_by_default(self, mock_client):
+        assert type(QueryExecutor(mock_client).records_cache) is dict
+
+    def test_evicts_least_recently_used_model(self, mock_client):
+        executor = QueryExecutor(mock_client, records_cache_size=2)
+        executor.list_records_by_field = MagicMock(side_effect=lambda model, *a, **k: [{"id": model}])
+
+        executor.get_records("Story", "title", False)
+        executor.get_records("Reporter", "name", False)
+        executor.get_records("Story", "title", False)
+        executor.get_records("Photo", "url", False)
+
+        assert list(executor.records_cache) == ["Story", "Photo"]
+        assert executor.list_records_by_field.call_count == 3
+
+    def test_get_returns_default_for_evicted_model(self, mock_client):
+        executor = QueryExecutor(mock_client, records_cache_size=1)
+        executor.records_cache["Story"] = [{"id": "1"}]
+        executor.records_cache["Reporter"] = [{"id": "2"}]
+
+        assert executor.records_cache.get("Story") is None
+        assert executor.records_cache.get("Reporter") == [{"id": "2"}]
+
+
 class TestGetRecord:
     """Test get_record method"""
 
@@ -379,6 +532,13 @@ class TestUpload:
         assert success == 0
         assert error == len(records)
 
+    def test_returns_early_for_no_records(self, executor):
+        executor.get_primary_field_name = MagicMock()
+
+        assert executor.upload([], "Story", {"fields": []}) == (0, 0, [])
+        executor.get_primary_field_name.assert_not_called()
+        executor.client.request.assert_not_called()
+
 
 class TestUploadPassesCompositeFields:
     def test_upload_looks_up_composite_fields_for_model(self, mock_client):
@@ -386,7 +546,9 @@ class TestUploadPassesCompositeFields:
         executor.get_primary_field_name = MagicMock(return_value=("sequentialId", True, "Int"))
         captured = {}
 
-        async def fake_batch(batch, model_name, primary_field, is_secondary_index, field_type, composite_fields):
+        async def fake_batch(
+            batch, model_name, primary_field, is_secondary_index, field_type, composite_fields, **kwargs
+        ):
             captured["composite_fields"] = composite_fields
             return (len(batch), 0, [])
 
@@ -395,6 +557,379 @@ class TestUploadPassesCompositeFields:
         assert captured["composite_fields"] == ["country"]
 
 
+class TestCheckRecordsExistAsync:
+    """Batched duplicate checks used when the upfront listing is unavailable"""
+
+    async def test_secondary_index_checks_share_one_request(self, mock_client):
+        executor = QueryExecutor(mock_client, composite_unique_fields={"Observation": ["country"]})
+        executor.client.request_async = AsyncMock(
+            return_value={
+                "data": {
+                    "c0": {"items": [{"id": "1", "countryId": "c-med"}]},
+                    "c1": {"items": [{"id": "2", "countryId": "c-red"}]},
+                }
+            }
+        )
+        batch = [{"sequentialId": 5, "countryId": "c-red"}, {"sequentialId": 6, "countryId": "c-red"}]
+
+        results = await executor.check_records_exist_async(
+            MagicMock(), batch, "Observation", "sequentialId", True, "Int", ["country"]
+        )
+
+        assert results == [batch[0], None]
+        _, query, variables, _ = executor.client.request_async.call_args.args
+        assert "c1: listObservationBySequentialId(sequentialId: $v1)" in query
+        assert variables == {"v0": 5, "v1": 6}
+
+    async def test_filter_checks_include_composite_conditions(self, executor):
+        executor._get_list_query_name = MagicMock(return_value="listObservations")
+        executor.client.request_async = AsyncMock(return_value={"data": {"c0": {"items": []}}})
+        batch = [{"sequentialId": 5, "countryId": "c-red"}]
+
+        results = await executor.check_records_exist_async(
+            MagicMock(), batch, "Observation", "sequentialId", False, "Int", ["country"]
+        )
+
+        assert results == batch
+        variables = executor.client.request_async.call_args.args[2]
+        assert variables == {"f0": {"and": [{"sequentialId": {"eq": 5}}, {"countryId": {"eq": "c-red"}}]}}
+
+    async def test_unresolvable_records_fail_without_querying(self, executor):
+        executor.client.request_async = AsyncMock()
+
+        results = await executor.check_records_exist_async(
+            MagicMock(), [{"sequentialId": 5}], "Observation", "sequentialId", True, "Int", ["country"]
+        )
+
+        assert isinstance(results[0], ValueError)
+        executor.client.request_async.assert_not_called()
+
+
+class TestCreateRecordsAsync:
+    """Aliased batch creation"""
+
+    async def test_sends_one_request_for_all_records(self, executor):
+        executor.client.request_async = AsyncMock(
+            return_value={"data": {"r0": {"id": "1", "title": "A"}, "r1": {"id": "2", "title": "B"}}}
+        )
+
+        results = await executor.create_records_async(MagicMock(), [{"title": "A"}, {"title": "B"}], "Story", "title")
+
+        assert results == [{"id": "1", "title": "A"}, {"id": "2", "title": "B"}]
+        executor.client.request_async.assert_called_once()
+        _, mutation, variables, _ = executor.client.request_async.call_args.args
+        assert "r1: createStory(input: $i1)" in mutation
+        assert variables == {"i0": {"title": "A"}, "i1": {"title": "B"}}
+
+    async def test_sends_batch_as_non_idempotent(self, executor):
+        executor.client.request_async = AsyncMock(return_value={"data": {"r0": {"id": "1", "title": "A"}}})
+
+        await executor.create_records_async(MagicMock(), [{"title": "A"}], "Story", "title")
+
+        assert executor.client.request_async.call_args.kwargs["idempotent"] is False
+
+    async def test_attributes_partial_errors_by_alias(self, executor):
+        executor.client.request_async = AsyncMock(
+            return_value={
+                "data": {"r0": {"id": "1", "title": "A"}, "r1": None},
+                "errors": [{"path": ["r1"], "message": "Invalid input"}],
+            }
+        )
+
+        results = await executor.create_records_async(MagicMock(), [{"title": "A"}, {"title": "B"}], "Story", "title")
+
+        assert results[0] == {"id": "1", "title": "A"}
+        assert isinstance(results[1], GraphQLError)
+        assert "Invalid input" in str(results[1])
+
+    async def test_errors_without_path_apply_to_every_failed_record(self, executor):
+        executor.client.request_async = AsyncMock(
+            return_value={"data": {"r0": {"id": "1", "title": "A"}, "r1": None}, "errors": [{"message": "Throttled"}]}
+        )
+
+        results = await executor.create_records_async(MagicMock(), [{"title": "A"}, {"title": "B"}], "Story", "title")
+
+        assert results[0] == {"id": "1", "title": "A"}
+        assert isinstance(results[1], GraphQLError)
+        assert "Throttled" in str(results[1])
+
+    async def test_request_failure_fails_every_record(self, executor):
+        executor.client.request_async = AsyncMock(side_effect=GraphQLError("boom"))
+
+        results = await executor.create_records_async(MagicMock(), [{"title": "A"}, {"title": "B"}], "Story", "title")
+
+        assert [str(r) for r in results] == ["boom", "boom"]
+
+    def test_chunks_large_payloads(self, executor):
+        records = [{"title": "x" * 400_000} for _ in range(5)]
+
+        chunks = executor._chunk_by_payload_size(records)
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+class TestUploadPrefetchesExistingKeys:
+    """Duplicate detection against a single upfront listing"""
+
+    @pytest.fixture
+    def prefetch_executor(self, mock_client):
+        executor = QueryExecutor(mock_client, batch_size=2)
+        executor.get_primary_field_name = MagicMock(return_value=("title", False, "String"))
+        executor._get_list_query_name = MagicMock(return_value="listStories")
+        executor.create_records_async = AsyncMock(
+            side_effect=lambda session, records, *args: [{"id": "new"}] * len(records)
+        )
+        executor.check_record_exists_async = AsyncMock()
+        return executor
+
+    def test_lists_once_and_skips_existing_records(self, prefetch_executor):
+        prefetch_executor.client.request = MagicMock(
+            return_value={"data": {"listStories": {"items": [{"id": "1", "title": "Old"}], "nextToken": None}}}
+        )
+        records = [{"title": "Old"}, {"title": "New 1"}, {"title": "New 2"}]
+
+        success, error, failed = prefetch_executor.upload(records, "Story", {"fields": []})
+
+        assert (success, error, failed) == (2, 1, [])
+        prefetch_executor.client.request.assert_called_once()
+        prefetch_executor.check_record_exists_async.assert_not_called()
+        created = [r["title"] for c in prefetch_executor.create_records_async.call_args_list for r in c.args[1]]
+        assert created == ["New 1", "New 2"]
+
+    def test_repeated_records_are_created_once(self, prefetch_executor):
+        prefetch_executor.client.request = MagicMock(
+            return_value={"data": {"listStories": {"items": [], "nextToken": None}}}
+        )
+        records = [{"title": "Same"}, {"title": "Other"}, {"title": "Same"}]
+
+        success, error, _ = prefetch_executor.upload(records, "Story", {"fields": []})
+
+        assert (success, error) == (2, 1)
+        created = [r["title"] for c in prefetch_executor.create_records_async.call_args_list for r in c.args[1]]
+        assert sorted(created) == ["Other", "Same"]
+
+    def test_composite_fields_are_part_of_the_key(self, mock_client):
+        executor = QueryExecutor(mock_client, batch_size=10, composite_unique_fields={"Observation": ["country"]})
+        executor.get_primary_field_name = MagicMock(return_value=("sequentialId", True, "Int"))
+        executor._get_list_query_name = MagicMock(return_value="listObservations")
+        executor.create_records_async = AsyncMock(
+            side_effect=lambda session, records, *args: [{"id": "new"}] * len(records)
+        )
+        executor.client.request = MagicMock(
+            return_value={
+                "data": {
+                    "listObservations": {
+                        "items": [{"id": "1", "sequentialId": 5, "countryId": "c-med"}],
+                        "nextToken": None,
+                    }
+                }
+            }
+        )
+        records = [{"sequentialId": 5, "countryId": "c-med"}, {"sequentialId": 5, "countryId": "c-red"}]
+
+        success, error, _ = executor.upload(records, "Observation", {"fields": []})
+
+        assert (success, error) == (1, 1)
+        query = executor.client.request.call_args.args[0]
+        assert "countryId" in query
+
+    def test_falls_back_to_batched_checks_when_listing_fails(self, prefetch_executor):
+        prefetch_executor.client.request = MagicMock(return_value=None)
+        prefetch_executor.client.request_async = AsyncMock(
+            return_value={"data": {"c0": {"items": []}, "c1": {"items": [{"id": "1"}]}}}
+        )
+
+        success, error, _ = prefetch_executor.upload([{"title": "A"}, {"title": "B"}], "Story", {"fields": []})
+
+        assert (success, error) == (1, 1)
+        prefetch_executor.client.request_async.assert_called_once()
+        created = [r["title"] for c in prefetch_executor.create_records_async.call_args_list for r in c.args[1]]
+        assert created == ["A"]
+
+    def test_warns_when_listing_fails(self, prefetch_executor):
+        prefetch_executor.client.request = MagicMock(return_value=None)
+        prefetch_executor.client.request_async = AsyncMock(return_value={"data": {"c0": {"items": []}}})
+
+        with patch("amplify_excel_migrator.graphql.executor.logger") as mock_logger:
+            prefetch_executor.upload([{"title": "A"}], "Story", {"fields": []})
+
+        mock_logger.warning.assert_called_once_with(
+            "Could not prefetch existing Story records, checking duplicates per record"
+        )
+
+    def test_warns_when_records_disagree_on_key_fields(self, mock_client):
+        executor = QueryExecutor(mock_client, batch_size=10, composite_unique_fields={"Observation": ["country"]})
+        executor.get_primary_field_name = MagicMock(return_value=("sequentialId", True, "Int"))
+        executor.check_records_exist_async = AsyncMock(side_effect=lambda session, batch, *args: list(batch))
+        executor.create_records_async = AsyncMock(
+            side_effect=lambda session, records, *args: [{"id": "new"}] * len(records)
+        )
+        records = [{"sequentialId": 1, "country": "med"}, {"sequentialId": 2, "countryId": "c-red"}]
+
+        with patch("amplify_excel_migrator.graphql.executor.logger") as mock_logger:
+            executor.upload(records, "Observation", {"fields": []})
+
+        executor.client.request.assert_not_called()
+        mock_logger.warning.assert_called_once_with(
+            "Observation records disagree on their key fields, checking duplicates per record"
+        )
+
+    def test_does_not_warn_when_no_record_resolves_its_key_fields(self, mock_client):
+        executor = QueryExecutor(mock_client, batch_size=10, composite_unique_fields={"Observation": ["country"]})
+        executor.get_primary_field_name = MagicMock(return_value=("sequentialId", True, "Int"))
+        executor._upload_async = AsyncMock(return_value=(0, 1, []))
+
+        with patch("amplify_excel_migrator.graphql.executor.logger") as mock_logger:
+            executor.upload([{"sequentialId": 1}], "Observation", {"fields": []})
+
+        executor.client.request.assert_not_called()
+        mock_logger.warning.assert_not_called()
+
+    def test_fallback_creates_keys_repeated_across_batches_once(self, prefetch_executor):
+        prefetch_executor.client.request = MagicMock(return_value=None)
+        prefetch_executor.client.request_async = AsyncMock(
+            return_value={"data": {"c0": {"items": []}, "c1": {"items": []}}}
+        )
+        records = [{"title": "A"}, {"title": "B"}, {"title": "A"}, {"title": "C"}]
+
+        success, error, _ = prefetch_executor.upload(records, "Story", {"fields": []})
+
+        assert (success, error) == (3, 1)
+        created = [r["title"] for c in prefetch_executor.create_records_async.call_args_list for r in c.args[1]]
+        assert sorted(created) == ["A", "B", "C"]
+
+    def test_reuses_one_session_across_batches(self, prefetch_executor):
+        prefetch_executor.client.request = MagicMock(
+            return_value={"data": {"listStories": {"items": [], "nextToken": None}}}
+        )
+        records = [{"title": f"Story {i}"} for i in range(5)]
+
+        with patch("amplify_excel_migrator.graphql.executor.aiohttp.ClientSession") as mock_session_cls:
+            mock_session_cls.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+            mock_session_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            success, _, _ = prefetch_executor.upload(records, "Story", {"fields": []})
+
+        assert success == 5
+        mock_session_cls.assert_called_once()
+        sessions = {c.args[0] for c in prefetch_executor.create_records_async.call_args_list}
+        assert len(sessions) == 1
+
+    def test_invalidates_records_cache_after_creating(self, prefetch_executor):
+        prefetch_executor.client.request = MagicMock(
+            return_value={"data": {"listStories": {"items": [], "nextToken": None}}}
+        )
+        prefetch_executor.records_cache["Story"] = [{"id": "1", "title": "Old"}]
+        prefetch_executor._fk_lookup_cache["Story"] = {"lookup": {"Old": "1"}, "primary_field": "title"}
+
+        prefetch_executor.upload([{"title": "New"}], "Story", {"fields": []})
+
+        assert "Story" not in prefetch_executor.records_cache
+        assert "Story" not in prefetch_executor._fk_lookup_cache
+
+
+class TestUploadConcurrency:
+    """Batches are dispatched concurrently under a bound"""
+
+    def test_limits_batches_in_flight(self, mock_client):
+        import asyncio
+
+        executor = QueryExecutor(mock_client, batch_size=1, max_concurrent_batches=2)
+        executor.get_primary_field_name = MagicMock(return_value=("title", False, "String"))
+        executor._fetch_existing_keys = MagicMock(return_value=set())
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_batch(batch, *args, **kwargs):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return (len(batch), 0, [])
+
+        executor.upload_batch_async = fake_batch
+        success, error, _ = executor.upload([{"title": str(i)} for i in range(6)], "Story", {"fields": []})
+
+        assert (success, error) == (6, 0)
+        assert in_flight["max"] == 2
+
+    def test_failed_batch_counts_all_records(self, mock_client):
+        executor = QueryExecutor(mock_client, batch_size=2)
+        executor.get_primary_field_name = MagicMock(return_value=("title", False, "String"))
+        executor._fetch_existing_keys = MagicMock(return_value=set())
+
+        async def fake_batch(batch, *args, **kwargs):
+            if batch[0]["title"] == "A":
+                raise RuntimeError("boom")
+            return (len(batch), 0, [])
+
+        executor.upload_batch_async = fake_batch
+        records = [{"title": "A"}, {"title": "B"}, {"title": "C"}]
+
+        success, error, failed = executor.upload(records, "Story", {"fields": []})
+
+        assert (success, error) == (1, 2)
+        assert [f["primary_field_value"] for f in failed] == ["A", "B"]
+        assert failed[0]["error"] == "boom"
+
+
+class TestGetPrimaryFieldNamesBatch:
+    """Test resolving related models' primary fields from their own structures"""
+
+    @staticmethod
+    def _raw_type(name, fields):
+        return {
+            "name": name,
+            "kind": "OBJECT",
+            "fields": [
+                {"name": field_name, "type": {"kind": "NON_NULL", "ofType": {"kind": "SCALAR", "name": "String"}}}
+                for field_name in fields
+            ],
+        }
+
+    def test_introspects_all_models_in_one_prefetch(self, executor):
+        structures = {
+            "Reporter": self._raw_type("Reporter", ["name"]),
+            "Story": self._raw_type("Story", ["title"]),
+        }
+        executor.prefetch_model_structures = MagicMock()
+        executor.get_model_structure = MagicMock(side_effect=structures.get)
+        executor.schema._get_secondary_index = MagicMock(return_value="")
+
+        result = executor.get_primary_field_names_batch(["Reporter", "Story"])
+
+        executor.prefetch_model_structures.assert_called_once_with(["Reporter", "Story"])
+        assert result == {"Reporter": ("name", False, "String"), "Story": ("title", False, "String")}
+
+    def test_skips_models_missing_from_schema(self, executor):
+        executor.prefetch_model_structures = MagicMock()
+        executor.get_model_structure = MagicMock(side_effect={"Reporter": self._raw_type("Reporter", ["name"])}.get)
+        executor.schema._get_secondary_index = MagicMock(return_value="")
+
+        result = executor.get_primary_field_names_batch(["Reporter", "Ghost"])
+
+        assert result == {"Reporter": ("name", False, "String")}
+
+    def test_build_lookups_uses_the_related_models_primary_field(self, executor):
+        import pandas as pd
+
+        df = pd.DataFrame({"photographer": ["John"]})
+        # The sheet's own first required scalar ("title") must not be mistaken for Reporter's primary field
+        sheet_structure = {
+            "fields": [
+                {"name": "title", "type": "String", "is_required": True, "is_scalar": True, "is_id": False},
+                {"name": "photographerId", "is_id": True, "related_model": "Reporter"},
+            ]
+        }
+        executor.prefetch_model_structures = MagicMock()
+        executor.get_model_structure = MagicMock(return_value=self._raw_type("Reporter", ["name"]))
+        executor.schema._get_secondary_index = MagicMock(return_value="")
+        executor.get_records = MagicMock(return_value=[{"id": "r-1", "name": "John"}])
+
+        result = executor.build_foreign_key_lookups(df, sheet_structure)
+
+        executor.get_records.assert_called_once_with("Reporter", "name", False)
+        assert result["Reporter"] == {"lookup": {"John": "r-1"}, "primary_field": "name"}
+
+
 class TestBuildForeignKeyLookups:
     """Test build_foreign_key_lookups method"""
 
@@ -404,7 +939,9 @@ class TestBuildForeignKeyLookups:
         df = pd.DataFrame({"photographer": ["John Doe", "Jane Smith"]})
         model_structure = {"fields": [{"name": "photographerId", "is_id": True, "related_model": "Reporter"}]}
 
-        executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
         executor.get_records = MagicMock(
             return_value=[
                 {"id": "1", "name": "John Doe"},
@@ -445,20 +982,45 @@ class TestBuildForeignKeyLookups:
         df = pd.DataFrame({"author": ["Author One"]})
         model_structure = {"fields": [{"name": "authorId", "is_id": True}]}
 
-        executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
         executor.get_records = MagicMock(return_value=[{"id": "1", "name": "Author One"}])
 
         result = executor.build_foreign_key_lookups(df, model_structure)
 
         assert "Author" in result
 
+    @pytest.mark.parametrize(
+        "column, field_name, expected_model",
+        [
+            ("photographer", "photographerId", "Photographer"),
+            ("reporterId", "reporterId", "Reporter"),
+            ("photoGallery", "photoGalleryId", "PhotoGallery"),
+            ("editor", "editor", "Editor"),
+        ],
+    )
+    def test_infers_related_model_from_field_not_column(self, executor, column, field_name, expected_model):
+        import pandas as pd
+
+        df = pd.DataFrame({column: ["x"]})
+        model_structure = {"fields": [{"name": field_name, "is_id": True}]}
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(return_value=[{"id": "1", "name": "x"}])
+
+        result = executor.build_foreign_key_lookups(df, model_structure)
+
+        assert list(result) == [expected_model]
+
     def test_handles_errors_gracefully(self, executor):
         import pandas as pd
 
         df = pd.DataFrame({"photographer": ["John"]})
         model_structure = {"fields": [{"name": "photographerId", "is_id": True, "related_model": "Reporter"}]}
 
-        executor.get_primary_field_name = MagicMock(side_effect=Exception("Error"))
+        executor.get_primary_field_names_batch = MagicMock(side_effect=Exception("Error"))
 
         result = executor.build_foreign_key_lookups(df, model_structure)
 
@@ -475,11 +1037,218 @@ class TestBuildForeignKeyLookups:
             ]
         }
 
-        executor.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
         executor.get_records = MagicMock(return_value=[{"id": "1", "name": "John"}])
 
         result = executor.build_foreign_key_lookups(df, model_structure)
 
         assert len(result) == 1
         assert "Reporter" in result
-        executor.get_primary_field_name.assert_called_once()
+        executor.get_primary_field_names_batch.assert_called_once()
+
+    def test_fetches_each_related_model_once_even_when_empty(self, executor):
+        import pandas as pd
+
+        df = pd.DataFrame({"photographer": ["John"], "editor": ["Jane"]})
+        model_structure = {
+            "fields": [
+                {"name": "photographerId", "is_id": True, "related_model": "Reporter"},
+                {"name": "editorId", "is_id": True, "related_model": "Reporter"},
+            ]
+        }
+
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(return_value=None)
+
+        result = executor.build_foreign_key_lookups(df, model_structure)
+
+        assert result == {}
+        executor.get_records.assert_called_once_with("Reporter", "name", False)
+
+    def test_fetches_distinct_related_models_concurrently(self, executor):
+        import threading
+        import pandas as pd
+
+        df = pd.DataFrame({"photographer": ["John"], "story": ["Intro"]})
+        model_structure = {
+            "fields": [
+                {"name": "photographerId", "is_id": True, "related_model": "Reporter"},
+                {"name": "storyId", "is_id": True, "related_model": "Story"},
+            ]
+        }
+        # Both listings must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_records(model_name, primary_field, is_secondary_index):
+            barrier.wait()
+            return [{"id": f"{model_name}-1", "name": f"{model_name} one"}]
+
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(side_effect=get_records)
+
+        result = executor.build_foreign_key_lookups(df, model_structure)
+
+        assert list(result) == ["Reporter", "Story"]
+        assert result["Story"]["lookup"] == {"Story one": "Story-1"}
+
+    def test_one_failing_model_does_not_drop_the_others(self, executor):
+        import pandas as pd
+
+        df = pd.DataFrame({"photographer": ["John"], "story": ["Intro"]})
+        model_structure = {
+            "fields": [
+                {"name": "photographerId", "is_id": True, "related_model": "Reporter"},
+                {"name": "storyId", "is_id": True, "related_model": "Story"},
+            ]
+        }
+
+        def get_records(model_name, primary_field, is_secondary_index):
+            if model_name == "Reporter":
+                raise RuntimeError("listing failed")
+            return [{"id": "s-1", "name": "Intro"}]
+
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(side_effect=get_records)
+
+        result = executor.build_foreign_key_lookups(df, model_structure)
+
+        assert list(result) == ["Story"]
+
+    def test_lookup_keeps_falsy_keys_and_last_duplicate(self, executor):
+        import pandas as pd
+
+        df = pd.DataFrame({"station": [0]})
+        model_structure = {"fields": [{"name": "stationId", "is_id": True, "related_model": "Station"}]}
+        executor.get_primary_field_names_batch = MagicMock(return_value={"Station": ("number", False, "Int")})
+        executor.get_records = MagicMock(
+            return_value=[
+                {"id": "s-0", "number": 0},
+                {"id": "s-1", "number": 1},
+                {"id": "s-1b", "number": 1},
+                {"id": "s-blank", "number": ""},
+                {"id": "s-none", "number": None},
+            ]
+        )
+
+        result = executor.build_foreign_key_lookups(df, model_structure)
+
+        assert result["Station"]["lookup"] == {"0": "s-0", "1": "s-1b"}
+
+    def test_caches_lookups_across_calls(self, executor):
+        import pandas as pd
+
+        df = pd.DataFrame({"photographer": ["John"]})
+        model_structure = {"fields": [{"name": "photographerId", "is_id": True, "related_model": "Reporter"}]}
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(return_value=[{"id": "1", "name": "John"}])
+
+        first = executor.build_foreign_key_lookups(df, model_structure)
+        second = executor.build_foreign_key_lookups(df, model_structure)
+
+        assert second == first
+        assert executor.get_records.call_count == 1
+        executor.get_primary_field_names_batch.assert_called_once()
+
+    def test_clear_fk_cache_refetches(self, executor):
+        import pandas as pd
+
+        df = pd.DataFrame({"photographer": ["John"]})
+        model_structure = {"fields": [{"name": "photographerId", "is_id": True, "related_model": "Reporter"}]}
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(return_value=[{"id": "1", "name": "John"}])
+
+        executor.build_foreign_key_lookups(df, model_structure)
+        executor.clear_fk_cache()
+        executor.build_foreign_key_lookups(df, model_structure)
+
+        assert executor.get_records.call_count == 2
+
+    def test_failed_lookup_is_not_cached(self, executor):
+        import pandas as pd
+
+        df = pd.DataFrame({"photographer": ["John"]})
+        model_structure = {"fields": [{"name": "photographerId", "is_id": True, "related_model": "Reporter"}]}
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(side_effect=[None, [{"id": "1", "name": "John"}]])
+
+        assert executor.build_foreign_key_lookups(df, model_structure) == {}
+        assert executor.build_foreign_key_lookups(df, model_structure)["Reporter"]["lookup"] == {"John": "1"}
+
+    def test_without_fetch_missing_only_reads_prefetched_lookups(self, executor):
+        import pandas as pd
+
+        df = pd.DataFrame({"photographer": ["John"], "editor": ["Jane"]})
+        model_structure = {
+            "fields": [
+                {"name": "photographerId", "is_id": True, "related_model": "Reporter"},
+                {"name": "editorId", "is_id": True, "related_model": "Editor"},
+            ]
+        }
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(return_value=[{"id": "1", "name": "John"}])
+        executor.prefetch_foreign_key_lookups(["Reporter"])
+
+        result = executor.build_foreign_key_lookups(df, model_structure, fetch_missing=False)
+
+        assert list(result) == ["Reporter"]
+        executor.get_records.assert_called_once_with("Reporter", "name", False)
+
+    def test_prefetch_lists_a_model_shared_by_several_sheets_once(self, executor):
+        executor.get_primary_field_names_batch = MagicMock(
+            side_effect=lambda models: dict.fromkeys(models, ("name", False, "String"))
+        )
+        executor.get_records = MagicMock(return_value=[{"id": "1", "name": "John"}])
+
+        executor.prefetch_foreign_key_lookups(["Reporter", "Station", "Reporter"])
+
+        assert sorted(c.args[0] for c in executor.get_records.call_args_list) == ["Reporter", "Station"]
+        executor.get_primary_field_names_batch.assert_called_once_with(["Reporter", "Station"])
+
+    def test_concurrent_callers_share_one_listing_per_model(self, executor):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def slow_listing(*args, **kwargs):
+            time.sleep(0.05)
+            return [{"id": "1", "name": "John"}]
+
+        executor.get_records = MagicMock(side_effect=slow_listing)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            entries = list(
+                pool.map(lambda _: executor._fetch_foreign_key_lookup("Reporter", ("name", False, "String")), range(4))
+            )
+
+        executor.get_records.assert_called_once()
+        assert all(entry == {"lookup": {"John": "1"}, "primary_field": "name"} for entry in entries)
+
+    def test_get_related_models_dedupes_in_field_order(self, executor):
+        model_structure = {
+            "fields": [
+                {"name": "photographerId", "is_id": True, "related_model": "Reporter"},
+                {"name": "stationId", "is_id": True},
+                {"name": "editorId", "is_id": True, "related_model": "Reporter"},
+                {"name": "deskId", "is_id": True, "related_model": "Desk"},
+            ]
+        }
+
+        assert executor.get_related_models(["photographer", "stationId", "editor"], model_structure) == [
+            "Reporter",
+            "Station",
+        ]
@@ -1,7 +1,7 @@
 """Tests for QueryExecutor create_record, update_record, and delete_record methods"""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from amplify_excel_migrator.graphql import QueryExecutor, GraphQLClient
 
 
@@ -31,6 +31,20 @@ class TestCreateRecord:
         assert "createCountry" in call_args[0][0]
         assert call_args[0][1] == {"input": {"name": "Israel Red"}}
 
+    def test_reuses_built_mutation_for_same_shape(self, executor):
+        executor.client.request = MagicMock(return_value={"data": {"createCountry": {"id": "1"}}})
+
+        with patch(
+            "amplify_excel_migrator.graphql.executor.MutationBuilder.build_create_mutation",
+            return_value="mutation",
+        ) as build:
+            executor.create_record("Country", {"name": "A"})
+            executor.create_record("Country", {"name": "B"})
+            executor.create_record("Country", {"name": "C"}, return_fields=["id", "name"])
+
+        assert build.call_count == 2
+        assert executor.client.request.call_args_list[1].args[0] == "mutation"
+
     def test_returns_none_on_failure(self, executor):
         executor.client.request = MagicMock(return_value=None)
 
@@ -246,6 +246,48 @@ class TestParseModelStructure:
         assert addresses_field["is_custom_type"] is True
         assert addresses_field["is_list"] is True
 
+    def test_unwraps_required_list_of_required_enums(self):
+        """Test NON_NULL { LIST { NON_NULL { ENUM } } } resolves to the enum's name, kind and values"""
+        parser = FieldParser()
+
+        introspection_result = {
+            "name": "Story",
+            "kind": "OBJECT",
+            "description": None,
+            "fields": [
+                {
+                    "name": "tags",
+                    "description": None,
+                    "type": {
+                        "kind": "NON_NULL",
+                        "name": None,
+                        "ofType": {
+                            "kind": "LIST",
+                            "name": None,
+                            "ofType": {
+                                "kind": "NON_NULL",
+                                "name": None,
+                                "ofType": {
+                                    "kind": "ENUM",
+                                    "name": "Tag",
+                                    "enumValues": [{"name": "NEWS"}, {"name": "SPORT"}],
+                                    "ofType": None,
+                                },
+                            },
+                        },
+                    },
+                }
+            ],
+        }
+
+        tags = parser.parse_model_structure(introspection_result)["fields"][0]
+
+        assert tags["type"] == "Tag"
+        assert tags["is_required"] is True
+        assert tags["is_list"] is True
+        assert tags["is_enum"] is True
+        assert tags["inline_enum_values"] == ["NEWS", "SPORT"]
+
     def test_detects_enum_wrapped_in_non_null(self):
         """Test that required (NON_NULL-wrapped) enum fields are correctly detected as enums"""
         parser = FieldParser()
@@ -340,6 +382,46 @@ class TestParseModelStructure:
         assert stage_field["inline_enum_values"] == ["NA", "JUVENILE"]
 
 
+class TestUnwrapType:
+    """Test the single-pass _unwrap_type walker"""
+
+    @pytest.mark.parametrize(
+        "type_obj, expected",
+        [
+            ({}, ("Unknown", "UNKNOWN", False, [])),
+            ({"kind": "SCALAR", "name": "String", "ofType": None}, ("String", "SCALAR", False, [])),
+            (
+                {"kind": "NON_NULL", "name": None, "ofType": {"kind": "SCALAR", "name": "ID", "ofType": None}},
+                ("ID", "SCALAR", False, []),
+            ),
+            (
+                {
+                    "kind": "NON_NULL",
+                    "name": None,
+                    "ofType": {
+                        "kind": "LIST",
+                        "name": None,
+                        "ofType": {
+                            "kind": "NON_NULL",
+                            "name": None,
+                            "ofType": {
+                                "kind": "ENUM",
+                                "name": "Stage",
+                                "enumValues": [{"name": "NA"}, {"name": "ADULT"}],
+                            },
+                        },
+                    },
+                },
+                ("Stage", "ENUM", True, ["NA", "ADULT"]),
+            ),
+            ({"kind": "OBJECT", "name": "Address", "ofType": None}, ("Address", "OBJECT", False, [])),
+            ({"kind": "LIST", "name": None, "ofType": None}, ("Unknown", "LIST", True, [])),
+        ],
+    )
+    def test_unwraps_type(self, type_obj, expected):
+        assert FieldParser._unwrap_type(type_obj) == expected
+
+
 class TestParseFieldWithRelationships:
     """Test _parse_field method behavior with relationship fields"""
 
@@ -778,6 +860,15 @@ class TestParseScalarArray:
 
         assert result == [1, 2, 3, 4, 5]
 
+    def test_malformed_json_array_falls_back_to_separators(self):
+        """Test bracketed text that is not valid JSON is split like any other cell"""
+        parser = FieldParser()
+        field = {"name": "tags", "type": "String", "is_list": True, "is_scalar": True}
+
+        result = parser.parse_scalar_array(field, "tags", "[a; b]")
+
+        assert result == ["[a", "b]"]
+
     def test_handles_invalid_type_conversion_gracefully(self):
         """Test that invalid type conversions are skipped with warning"""
         parser = FieldParser()
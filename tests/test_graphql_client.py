@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 import aiohttp
+import numpy as np
+import orjson
 import requests
 from amplify_excel_migrator.graphql.client import (
     GraphQLClient,
@@ -26,6 +28,15 @@ def client(mock_auth_provider):
     return GraphQLClient(api_endpoint="https://test.api.com/graphql", auth_provider=mock_auth_provider)
 
 
+@pytest.fixture(autouse=True)
+def no_retry_sleep():
+    """Skip real backoff delays between retries"""
+    with patch("amplify_excel_migrator.graphql.client.time.sleep") as sync_sleep, patch(
+        "amplify_excel_migrator.graphql.client.asyncio.sleep", new_callable=AsyncMock
+    ) as async_sleep:
+        yield sync_sleep, async_sleep
+
+
 @pytest.fixture
 def unauthenticated_client():
     """Create a GraphQLClient without auth provider"""
@@ -40,12 +51,42 @@ class TestGraphQLClientInit:
         assert client.api_endpoint == "https://test.com/graphql"
         assert client.auth_provider is None
 
+    def test_reuses_one_requests_session(self, mock_auth_provider):
+        client = GraphQLClient(api_endpoint="https://test.com/graphql", auth_provider=mock_auth_provider)
+        assert isinstance(client._requests_session, requests.Session)
+
     def test_initializes_with_auth_provider(self, mock_auth_provider):
         client = GraphQLClient(api_endpoint="https://test.com/graphql", auth_provider=mock_auth_provider)
         assert client.api_endpoint == "https://test.com/graphql"
         assert client.auth_provider == mock_auth_provider
 
 
+class TestConnectionPool:
+    """Test the pooled requests session"""
+
+    def test_session_pool_fits_concurrent_callers(self, client):
+        adapter = client._requests_session.get_adapter(client.api_endpoint)
+
+        assert adapter._pool_maxsize == GraphQLClient.POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+
+
+class TestAuthHeaders:
+    """Test header reuse across requests"""
+
+    def test_reuses_headers_while_token_is_unchanged(self, client, mock_auth_provider):
+        assert client._auth_headers(mock_auth_provider) is client._auth_headers(mock_auth_provider)
+
+    def test_rebuilds_headers_when_token_is_refreshed(self, client, mock_auth_provider):
+        first = client._auth_headers(mock_auth_provider)
+        mock_auth_provider.get_id_token.return_value = "refreshed-token"
+
+        second = client._auth_headers(mock_auth_provider)
+
+        assert first["Authorization"] == "test-token"
+        assert second == {"Authorization": "refreshed-token", "Content-Type": "application/json"}
+
+
 class TestRequest:
     """Test synchronous request method"""
 
@@ -61,11 +102,11 @@ class TestRequest:
         with pytest.raises(AuthenticationError, match="Not authenticated"):
             client.request("{ test }")
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_makes_successful_request(self, mock_post, client):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"getUser": {"id": "123"}}}
+        mock_response.content = orjson.dumps({"data": {"getUser": {"id": "123"}}})
         mock_post.return_value = mock_response
 
         result = client.request("{ getUser { id } }")
@@ -74,14 +115,15 @@ class TestRequest:
         mock_post.assert_called_once_with(
             "https://test.api.com/graphql",
             headers={"Authorization": "test-token", "Content-Type": "application/json"},
-            json={"query": "{ getUser { id } }", "variables": {}},
+            data=orjson.dumps({"query": "{ getUser { id } }", "variables": {}}),
+            timeout=30,
         )
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_includes_variables_in_request(self, mock_post, client):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"getUser": {"id": "123"}}}
+        mock_response.content = orjson.dumps({"data": {"getUser": {"id": "123"}}})
         mock_post.return_value = mock_response
 
         result = client.request(
@@ -90,30 +132,53 @@ class TestRequest:
         )
 
         assert result == {"data": {"getUser": {"id": "123"}}}
-        called_json = mock_post.call_args[1]["json"]
+        called_json = orjson.loads(mock_post.call_args[1]["data"])
         assert called_json["variables"] == {"id": "123"}
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
+    def test_serializes_numpy_scalars_in_variables(self, mock_post, client):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"data": {"ok": True}})
+        mock_post.return_value = mock_response
+
+        client.request("mutation { ok }", variables={"input": {"count": np.int64(3), "flag": np.bool_(True)}})
+
+        called_json = orjson.loads(mock_post.call_args[1]["data"])
+        assert called_json["variables"] == {"input": {"count": 3, "flag": True}}
+
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_returns_none_when_errors_in_response(self, mock_post, client):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"errors": [{"message": "Field not found"}]}
+        mock_response.content = orjson.dumps({"errors": [{"message": "Field not found"}]})
         mock_post.return_value = mock_response
 
         result = client.request("{ invalidField }")
         assert result is None
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_returns_none_with_context_in_error_message(self, mock_post, client):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"errors": [{"message": "Error"}]}
+        mock_response.content = orjson.dumps({"errors": [{"message": "Error"}]})
         mock_post.return_value = mock_response
 
         result = client.request("{ test }", context="User Query")
         assert result is None
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
+    def test_returns_none_on_invalid_json_body(self, mock_post, client):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>Bad Gateway</html>"
+        mock_post.return_value = mock_response
+
+        result = client.request("{ test }")
+
+        assert result is None
+
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_returns_none_on_non_200_status(self, mock_post, client):
         mock_response = MagicMock()
         mock_response.status_code = 500
@@ -124,14 +189,83 @@ class TestRequest:
 
         assert result is None
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_raises_connection_error_on_connection_failure(self, mock_post, client):
         mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
 
         with pytest.raises(ConnectionError, match="Unable to connect to API endpoint"):
             client.request("{ test }")
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
+    def test_retries_transient_connection_errors(self, mock_post, client, no_retry_sleep):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"data": {"ok": True}})
+        mock_post.side_effect = [requests.exceptions.ConnectionError("DNS failure"), mock_response]
+
+        result = client.request("{ ok }")
+
+        assert result == {"data": {"ok": True}}
+        assert mock_post.call_count == 2
+        no_retry_sleep[0].assert_called_once()
+
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
+    def test_retries_server_errors_then_gives_up(self, mock_post, client):
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_response.text = "Service Unavailable"
+        mock_post.return_value = mock_response
+
+        result = client.request("{ test }")
+
+        assert result is None
+        assert mock_post.call_count == GraphQLClient.MAX_RETRIES + 1
+
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
+    def test_does_not_resend_mutation_after_server_error(self, mock_post, client):
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_response.text = "Service Unavailable"
+        mock_post.return_value = mock_response
+
+        result = client.request("mutation { createStory }", idempotent=False)
+
+        assert result is None
+        mock_post.assert_called_once()
+
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
+    def test_retries_mutation_connect_timeout(self, mock_post, client):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"data": {"ok": True}})
+        mock_post.side_effect = [requests.exceptions.ConnectTimeout("connect timed out"), mock_response]
+
+        result = client.request("mutation { ok }", idempotent=False)
+
+        assert result == {"data": {"ok": True}}
+        assert mock_post.call_count == 2
+
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
+    def test_does_not_resend_mutation_after_connection_drop(self, mock_post, client):
+        mock_post.side_effect = requests.exceptions.ConnectionError("Connection aborted")
+
+        with pytest.raises(ConnectionError):
+            client.request("mutation { createStory }", idempotent=False)
+
+        mock_post.assert_called_once()
+
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
+    def test_does_not_retry_client_errors(self, mock_post, client):
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.text = "Bad Request"
+        mock_post.return_value = mock_response
+
+        client.request("{ test }")
+
+        mock_post.assert_called_once()
+
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_returns_none_on_timeout(self, mock_post, client):
         mock_post.side_effect = requests.exceptions.Timeout("Request timed out")
 
@@ -139,7 +273,7 @@ class TestRequest:
 
         assert result is None
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_returns_none_on_http_error(self, mock_post, client):
         mock_post.side_effect = requests.exceptions.HTTPError("HTTP Error")
 
@@ -147,7 +281,7 @@ class TestRequest:
 
         assert result is None
 
-    @patch("amplify_excel_migrator.graphql.client.requests.post")
+    @patch("amplify_excel_migrator.graphql.client.requests.Session.post")
     def test_returns_none_on_request_exception(self, mock_post, client):
         mock_post.side_effect = requests.exceptions.RequestException("Generic error")
 
@@ -179,7 +313,7 @@ class TestRequestAsync:
     async def test_makes_successful_async_request(self, client):
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={"data": {"getUser": {"id": "123"}}})
+        mock_response.read = AsyncMock(return_value=orjson.dumps({"data": {"getUser": {"id": "123"}}}))
 
         mock_session = MagicMock()
         mock_session.post = MagicMock(return_value=mock_response)
@@ -192,14 +326,14 @@ class TestRequestAsync:
         mock_session.post.assert_called_once_with(
             "https://test.api.com/graphql",
             headers={"Authorization": "test-token", "Content-Type": "application/json"},
-            json={"query": "{ getUser { id } }", "variables": {}},
+            data=orjson.dumps({"query": "{ getUser { id } }", "variables": {}}),
         )
 
     @pytest.mark.asyncio
     async def test_includes_variables_in_async_request(self, client):
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={"data": {"getUser": {"id": "123"}}})
+        mock_response.read = AsyncMock(return_value=orjson.dumps({"data": {"getUser": {"id": "123"}}}))
 
         mock_session = MagicMock()
         mock_session.post = MagicMock(return_value=mock_response)
@@ -213,17 +347,17 @@ class TestRequestAsync:
         )
 
         assert result == {"data": {"getUser": {"id": "123"}}}
-        called_json = mock_session.post.call_args[1]["json"]
+        called_json = orjson.loads(mock_session.post.call_args[1]["data"])
         assert called_json["variables"] == {"id": "123"}
 
     @pytest.mark.asyncio
     async def test_raises_graphql_error_on_errors_in_async_response(self, client):
-        async def mock_json():
-            return {"errors": [{"message": "Field not found"}]}
+        async def mock_read():
+            return orjson.dumps({"errors": [{"message": "Field not found"}]})
 
         mock_response = MagicMock()
         mock_response.status = 200
-        mock_response.json = mock_json
+        mock_response.read = mock_read
 
         class MockAsyncContextManager:
             async def __aenter__(self):
@@ -240,12 +374,12 @@ class TestRequestAsync:
 
     @pytest.mark.asyncio
     async def test_includes_context_in_async_error_message(self, client):
-        async def mock_json():
-            return {"errors": [{"message": "Error"}]}
+        async def mock_read():
+            return orjson.dumps({"errors": [{"message": "Error"}]})
 
         mock_response = MagicMock()
         mock_response.status = 200
-        mock_response.json = mock_json
+        mock_response.read = mock_read
 
         class MockAsyncContextManager:
             async def __aenter__(self):
@@ -260,14 +394,39 @@ class TestRequestAsync:
         with pytest.raises(GraphQLError):
             await client.request_async(mock_session, "{ test }", context="User Query")
 
+    @pytest.mark.asyncio
+    async def test_returns_partial_data_when_partial_errors_allowed(self, client):
+        partial = {"data": {"r0": {"id": "1"}, "r1": None}, "errors": [{"path": ["r1"], "message": "Bad input"}]}
+
+        async def mock_read():
+            return orjson.dumps(partial)
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.read = mock_read
+
+        class MockAsyncContextManager:
+            async def __aenter__(self):
+                return mock_response
+
+            async def __aexit__(self, *args):
+                pass
+
+        mock_session = MagicMock()
+        mock_session.post.return_value = MockAsyncContextManager()
+
+        result = await client.request_async(mock_session, "mutation { test }", allow_partial_errors=True)
+
+        assert result == partial
+
     @pytest.mark.asyncio
     async def test_raises_client_error_on_non_200_status(self, client):
-        async def mock_text():
-            return "Internal Server Error"
+        async def mock_read():
+            return b"Internal Server Error"
 
         mock_response = MagicMock()
         mock_response.status = 500
-        mock_response.text = mock_text
+        mock_response.read = mock_read
 
         class MockAsyncContextManager:
             async def __aenter__(self):
@@ -282,6 +441,65 @@ class TestRequestAsync:
         with pytest.raises(aiohttp.ClientError):
             await client.request_async(mock_session, "{ test }")
 
+    @pytest.mark.asyncio
+    async def test_retries_async_server_errors(self, client, no_retry_sleep):
+        responses = [(503, b"Service Unavailable"), (200, orjson.dumps({"data": {"ok": True}}))]
+
+        def post(*args, **kwargs):
+            status, body = responses.pop(0)
+            mock_response = MagicMock()
+            mock_response.status = status
+            mock_response.read = AsyncMock(return_value=body)
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=mock_response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+
+        mock_session = MagicMock()
+        mock_session.post.side_effect = post
+
+        result = await client.request_async(mock_session, "{ ok }")
+
+        assert result == {"data": {"ok": True}}
+        assert mock_session.post.call_count == 2
+        no_retry_sleep[1].assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retries_async_connection_failures_then_raises(self, client):
+        mock_session = MagicMock()
+        mock_session.post.return_value.__aenter__ = AsyncMock(side_effect=aiohttp.ServerDisconnectedError())
+        mock_session.post.return_value.__aexit__ = AsyncMock()
+
+        with pytest.raises(aiohttp.ClientConnectionError, match="Connection error"):
+            await client.request_async(mock_session, "{ test }")
+
+        assert mock_session.post.call_count == GraphQLClient.MAX_RETRIES + 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_resend_async_mutation_after_server_error(self, client):
+        mock_response = MagicMock()
+        mock_response.status = 502
+        mock_response.read = AsyncMock(return_value=b"Bad Gateway")
+        mock_session = MagicMock()
+        mock_session.post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with pytest.raises(aiohttp.ClientError, match="HTTP Error 502"):
+            await client.request_async(mock_session, "mutation { createStory }", idempotent=False)
+
+        mock_session.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_does_not_resend_async_mutation_after_disconnect(self, client):
+        mock_session = MagicMock()
+        mock_session.post.return_value.__aenter__ = AsyncMock(side_effect=aiohttp.ServerDisconnectedError())
+        mock_session.post.return_value.__aexit__ = AsyncMock()
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await client.request_async(mock_session, "mutation { createStory }", idempotent=False)
+
+        mock_session.post.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_raises_timeout_error_on_async_timeout(self, client):
         mock_session = MagicMock()
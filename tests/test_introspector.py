@@ -1,7 +1,9 @@
 """Tests for SchemaIntrospector class"""
 
+import re
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from amplify_excel_migrator.schema.introspector import SchemaIntrospector
 
 
@@ -247,6 +249,18 @@ class TestGetSecondaryIndex:
 
         assert result == "name"
 
+    def test_handles_model_names_containing_by(self, introspector):
+        introspector.get_model_structure = MagicMock(
+            return_value={
+                "fields": [
+                    {"name": "listBystanderByBadgeNumber", "args": []},
+                    {"name": "listBystanders", "args": []},
+                ]
+            }
+        )
+
+        assert introspector._get_secondary_index("Bystander") == "badgeNumber"
+
 
 class TestGetListQueryName:
     """Test get_list_query_name method"""
@@ -363,3 +377,142 @@ class TestGetListQueryName:
         result = introspector.get_list_query_name("User")
 
         assert result in ["listUser", "listUsers"]
+
+
+class TestLookupCaching:
+    """Schema lookups are memoized per introspector"""
+
+    def test_model_structure_is_fetched_once(self, introspector, mock_client):
+        mock_client.request.return_value = {"data": {"__type": {"name": "User", "fields": []}}}
+
+        first = introspector.get_model_structure("User")
+        second = introspector.get_model_structure("User")
+
+        assert first == second == {"name": "User", "fields": []}
+        mock_client.request.assert_called_once()
+
+    def test_missing_model_structure_is_not_cached(self, introspector, mock_client):
+        mock_client.request.side_effect = [None, {"data": {"__type": {"name": "User", "fields": []}}}]
+
+        assert introspector.get_model_structure("User") == {}
+        assert introspector.get_model_structure("User") == {"name": "User", "fields": []}
+
+    def test_secondary_index_is_resolved_once(self, introspector):
+        introspector.get_model_structure = MagicMock(return_value={"fields": [{"name": "listUserByEmail"}]})
+
+        assert introspector._get_secondary_index("User") == "email"
+        assert introspector._get_secondary_index("User") == "email"
+        introspector.get_model_structure.assert_called_once_with("Query")
+
+    def test_list_query_name_is_resolved_once(self, introspector):
+        introspector.get_model_structure = MagicMock(return_value={"fields": [{"name": "listUsers"}]})
+
+        assert introspector.get_list_query_name("User") == "listUsers"
+        assert introspector.get_list_query_name("User") == "listUsers"
+        introspector.get_model_structure.assert_called_once_with("Query")
+
+    def test_query_type_is_fetched_once_across_models(self, introspector):
+        introspector.get_model_structure = MagicMock(
+            return_value={"fields": [{"name": "listUserByEmail"}, {"name": "listUsers"}, {"name": "listPosts"}]}
+        )
+
+        assert introspector._get_secondary_index("User") == "email"
+        assert introspector.get_list_query_name("User") == "listUsers"
+        assert introspector.get_list_query_name("Post") == "listPosts"
+        introspector.get_model_structure.assert_called_once_with("Query")
+
+    def test_missing_query_type_is_retried(self, introspector):
+        introspector.get_model_structure = MagicMock(side_effect=[{}, {"fields": [{"name": "listUsers"}]}])
+
+        assert introspector.get_list_query_name("User") == "listUsers"
+        assert introspector.get_list_query_name("User") == "listUsers"
+        assert introspector.get_model_structure.call_count == 2
+
+
+class TestGetAllTypes:
+    """Test get_all_types method"""
+
+    SCHEMA_RESPONSE = {"data": {"__schema": {"types": [{"name": "Status", "kind": "ENUM", "enumValues": []}]}}}
+
+    def test_schema_is_fetched_once(self, introspector, mock_client):
+        mock_client.request.return_value = self.SCHEMA_RESPONSE
+
+        introspector.get_all_types()
+        introspector.get_all_enums()
+
+        assert introspector.get_all_types() == [{"name": "Status", "kind": "ENUM", "enumValues": []}]
+        mock_client.request.assert_called_once()
+
+    def test_refresh_refetches_schema(self, introspector, mock_client):
+        mock_client.request.return_value = self.SCHEMA_RESPONSE
+
+        introspector.get_all_types()
+        introspector.get_all_types(refresh=True)
+
+        assert mock_client.request.call_count == 2
+
+    def test_failed_fetch_is_not_cached(self, introspector, mock_client):
+        mock_client.request.side_effect = [None, self.SCHEMA_RESPONSE]
+
+        assert introspector.get_all_types() == []
+        assert len(introspector.get_all_types()) == 1
+
+
+class TestPrefetchModelStructures:
+    """Test prefetch_model_structures method"""
+
+    @staticmethod
+    def _aliased_response(query, structures):
+        data = {}
+        for i, name in enumerate(re.findall(r'__type\(name: "(\w+)"\)', query)):
+            data[f"t{i}"] = structures.get(name)
+        return {"data": data}
+
+    def test_caches_each_fetched_structure_in_one_request(self, introspector, mock_client):
+        structures = {"User": {"name": "User", "fields": []}, "Post": {"name": "Post", "fields": []}}
+
+        async def fake_request(session, query):
+            return self._aliased_response(query, structures)
+
+        mock_client.request_async = AsyncMock(side_effect=fake_request)
+
+        introspector.prefetch_model_structures(["User", "Post", "User"])
+
+        assert mock_client.request_async.await_count == 1
+        assert introspector.get_model_structure("User") == {"name": "User", "fields": []}
+        assert introspector.get_model_structure("Post") == {"name": "Post", "fields": []}
+        mock_client.request.assert_not_called()
+
+    def test_splits_types_into_batches(self, introspector, mock_client):
+        introspector.PREFETCH_BATCH_SIZE = 2
+        structures = {name: {"name": name, "fields": []} for name in ["A", "B", "C"]}
+
+        async def fake_request(session, query):
+            return self._aliased_response(query, structures)
+
+        mock_client.request_async = AsyncMock(side_effect=fake_request)
+
+        introspector.prefetch_model_structures(["A", "B", "C"])
+
+        assert mock_client.request_async.await_count == 2
+        assert introspector.get_model_structure("C") == {"name": "C", "fields": []}
+        mock_client.request.assert_not_called()
+
+    def test_skips_already_cached_structures(self, introspector, mock_client):
+        introspector._model_structure_cache["User"] = {"name": "User", "fields": []}
+        mock_client.request_async = AsyncMock()
+
+        introspector.prefetch_model_structures(["User"])
+
+        mock_client.request_async.assert_not_called()
+
+    def test_failed_prefetch_falls_back_to_lazy_fetch(self, introspector, mock_client):
+        introspector.PREFETCH_BATCH_SIZE = 1
+        mock_client.request_async = AsyncMock(side_effect=[RuntimeError("boom"), {"data": {"t0": None}}])
+        mock_client.request.return_value = {"data": {"__type": {"name": "User", "fields": []}}}
+
+        introspector.prefetch_model_structures(["User", "Ghost"])
+
+        assert "Ghost" not in introspector._model_structure_cache
+        assert introspector.get_model_structure("User") == {"name": "User", "fields": []}
+        mock_client.request.assert_called_once()
@@ -53,6 +53,23 @@ class TestBuildCreateMutation:
             assert f"create{model}(input: $input)" in mutation
 
 
+class TestBuildBatchCreateMutation:
+    """Test build_batch_create_mutation and build_batch_create_variables"""
+
+    def test_aliases_each_create(self):
+        mutation = MutationBuilder.build_batch_create_mutation("Story", 2, return_fields=["id", "title"])
+
+        assert "mutation BatchCreateStory($i0: CreateStoryInput!, $i1: CreateStoryInput!)" in mutation
+        assert "r0: createStory(input: $i0)" in mutation
+        assert "r1: createStory(input: $i1)" in mutation
+        assert mutation.count("title") == 2
+
+    def test_variables_match_aliases(self):
+        variables = MutationBuilder.build_batch_create_variables([{"title": "A"}, {"title": "B"}])
+
+        assert variables == {"i0": {"title": "A"}, "i1": {"title": "B"}}
+
+
 class TestBuildUpdateMutation:
     """Test MutationBuilder.build_update_mutation() method"""
 
@@ -1,5 +1,7 @@
 """Tests for the headless MigrationOrchestrator (plan/execute)."""
 
+import threading
+
 import pytest
 from unittest.mock import MagicMock
 import pandas as pd
@@ -151,6 +153,77 @@ class TestBuildPlan:
 
         pd.testing.assert_frame_equal(df, original)
 
+    def test_prefetches_all_sheet_structures_before_planning(
+        self, orchestrator, mock_excel_reader, mock_amplify_client
+    ):
+        mock_excel_reader.read_all_sheets.return_value = {
+            "Reporter": pd.DataFrame({"name": ["a"]}),
+            "Story": pd.DataFrame({"title": ["b"]}),
+        }
+        orchestrator._get_parsed_model_structure = MagicMock(return_value={"fields": []})
+        orchestrator._transform_rows_to_records = MagicMock(return_value=([], {}, []))
+
+        orchestrator.build_plan()
+
+        mock_amplify_client.prefetch_model_structures.assert_called_once_with(["Query", "Reporter", "Story"])
+
+    def test_lists_related_models_once_across_sheets_before_planning(
+        self, orchestrator, mock_excel_reader, mock_amplify_client, mock_data_transformer
+    ):
+        mock_excel_reader.read_all_sheets.return_value = {
+            "Story": pd.DataFrame({"Reporter": ["a"]}),
+            "Photo": pd.DataFrame({"Reporter": ["b"]}),
+        }
+        orchestrator._get_parsed_model_structure = MagicMock(return_value={"fields": []})
+        mock_data_transformer.to_camel_case = lambda s: s.lower()
+        mock_amplify_client.get_related_models = MagicMock(return_value=["Reporter"])
+        mock_amplify_client.get_primary_field_name = MagicMock(return_value=("name", False, "String"))
+        mock_amplify_client.build_foreign_key_lookups = MagicMock(return_value={})
+        mock_data_transformer.transform_rows_to_records = MagicMock(return_value=([], {}, []))
+
+        orchestrator.build_plan()
+
+        assert mock_amplify_client.get_related_models.call_args_list[0].args[0] == ["reporter"]
+        mock_amplify_client.prefetch_foreign_key_lookups.assert_called_once_with(["Reporter", "Reporter"])
+        assert mock_amplify_client.build_foreign_key_lookups.call_count == 2
+        assert all(
+            c.kwargs == {"fetch_missing": False} for c in mock_amplify_client.build_foreign_key_lookups.call_args_list
+        )
+
+    def test_skipped_sheets_do_not_contribute_related_models(
+        self, orchestrator, mock_excel_reader, mock_amplify_client
+    ):
+        mock_excel_reader.read_all_sheets.return_value = {"Unknown": pd.DataFrame({"name": ["a"]})}
+        orchestrator._get_parsed_model_structure = MagicMock(side_effect=ValueError("no such model"))
+
+        plan = orchestrator.build_plan()
+
+        assert plan.sheets[0].status == "skipped"
+        mock_amplify_client.get_related_models.assert_not_called()
+        mock_amplify_client.prefetch_foreign_key_lookups.assert_not_called()
+
+    def test_plans_sheets_concurrently_in_workbook_order(self, orchestrator, mock_excel_reader):
+        mock_excel_reader.read_all_sheets.return_value = {
+            "Reporter": pd.DataFrame({"name": ["a"]}),
+            "Story": pd.DataFrame({"title": ["b"]}),
+        }
+        orchestrator._get_parsed_model_structure = MagicMock(return_value={"fields": []})
+        # Both sheets must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def transform(df, parsed_model_structure, sheet_name):
+            barrier.wait()
+            return [{"sheet": sheet_name}], {}, []
+
+        orchestrator._transform_rows_to_records = MagicMock(side_effect=transform)
+
+        plan = orchestrator.build_plan()
+
+        assert [(s.sheet_name, s.records) for s in plan.sheets] == [
+            ("Reporter", [{"sheet": "Reporter"}]),
+            ("Story", [{"sheet": "Story"}]),
+        ]
+
 
 def _ready_sheet_plan(sheet_name="Reporter", records=None, parsing_failures=None, row_dict=None):
     from amplify_excel_migrator.migration.models import SheetPlan
@@ -341,3 +414,40 @@ class TestGetParsedModelStructure:
 
         with pytest.raises(ValueError, match="IndividualGroup"):
             orchestrator._get_parsed_model_structure("Observation")
+
+    def test_parses_each_model_once_across_plans(self, orchestrator, mock_amplify_client, mock_field_parser):
+        mock_amplify_client.get_model_structure.return_value = {"name": "Reporter"}
+        mock_field_parser.parse_model_structure.return_value = {"name": "Reporter", "fields": []}
+
+        first = orchestrator._get_parsed_model_structure("Reporter")
+        second = orchestrator._get_parsed_model_structure("Reporter")
+
+        assert first is second
+        mock_field_parser.parse_model_structure.assert_called_once()
+
+    def test_failed_parse_is_not_cached(self, orchestrator, mock_amplify_client, mock_field_parser):
+        mock_amplify_client.get_model_structure.return_value = {}
+        mock_field_parser.parse_model_structure.side_effect = [
+            ValueError("model does not exist"),
+            {"name": "Reporter", "fields": []},
+        ]
+
+        with pytest.raises(ValueError):
+            orchestrator._get_parsed_model_structure("Reporter")
+
+        assert orchestrator._get_parsed_model_structure("Reporter") == {"name": "Reporter", "fields": []}
+
+    def test_parses_shared_custom_type_once(self, orchestrator, mock_amplify_client, mock_field_parser):
+        mock_amplify_client.get_model_structure.return_value = {"name": "any"}
+        address_field = {"name": "address", "type": "Address", "is_custom_type": True}
+        mock_field_parser.parse_model_structure.side_effect = [
+            {"name": "Reporter", "fields": [dict(address_field)]},
+            {"name": "Address", "fields": [{"name": "city", "type": "String", "is_required": False}]},
+            {"name": "Editor", "fields": [dict(address_field)]},
+        ]
+
+        reporter = orchestrator._get_parsed_model_structure("Reporter")
+        editor = orchestrator._get_parsed_model_structure("Editor")
+
+        assert reporter["fields"][0]["custom_type_fields"] == editor["fields"][0]["custom_type_fields"]
+        assert mock_field_parser.parse_model_structure.call_count == 3
@@ -250,6 +250,25 @@ class TestBuildIntrospectionQuery:
         assert query.count("ofType {") >= 3
 
 
+class TestBuildBatchIntrospectionQuery:
+    """Test QueryBuilder.build_batch_introspection_query() method"""
+
+    def test_aliases_each_type_in_order(self):
+        """Test each requested type gets a positional alias"""
+        query = QueryBuilder.build_batch_introspection_query(["User", "Post"])
+
+        assert query.startswith("query IntrospectModels {")
+        assert 't0: __type(name: "User")' in query
+        assert 't1: __type(name: "Post")' in query
+
+    def test_uses_same_selection_as_single_introspection(self):
+        """Test batched types request the same fields as a single-type introspection"""
+        single = QueryBuilder.build_introspection_query("User")
+        batch = QueryBuilder.build_batch_introspection_query(["User"])
+
+        assert single.split('__type(name: "User")', 1)[1] == batch.split('__type(name: "User")', 1)[1]
+
+
 class TestBuildVariablesForList:
     """Test QueryBuilder.build_variables_for_list() method"""
 
@@ -425,3 +444,23 @@ class TestQueryBuilderIntegration:
         # Without pagination should only have limit
         assert "$limit: Int" in query_without_pagination
         assert "$nextToken: String" not in query_without_pagination
+
+
+class TestBuildBatchExistenceQueries:
+    """Test aliased duplicate-check query builders"""
+
+    def test_batch_secondary_index_query(self):
+        query = QueryBuilder.build_batch_secondary_index_query(
+            "Observation", "sequentialId", 2, fields=["id", "countryId"], field_type="Int"
+        )
+
+        assert "query CheckListObservationBySequentialId($v0: Int!, $v1: Int!)" in query
+        assert "c0: listObservationBySequentialId(sequentialId: $v0)" in query
+        assert "c1: listObservationBySequentialId(sequentialId: $v1)" in query
+        assert query.count("countryId") == 2
+
+    def test_batch_list_query_with_filter(self):
+        query = QueryBuilder.build_batch_list_query_with_filter("Story", 2, query_name="listStories")
+
+        assert "$f0: ModelStoryFilterInput, $f1: ModelStoryFilterInput" in query
+        assert "c1: listStories(filter: $f1)" in query
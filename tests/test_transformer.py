@@ -2,8 +2,9 @@
 
 import pytest
 from unittest.mock import MagicMock
+import numpy as np
 import pandas as pd
-from amplify_excel_migrator.data.transformer import DataTransformer, FieldParseError
+from amplify_excel_migrator.data.transformer import DataTransformer, FieldParseError, _is_missing
 from amplify_excel_migrator.migration.models import FieldError
 
 
@@ -140,6 +141,60 @@ class TestTransformRowsToRecords:
         assert len(records) == 1
         assert records[0]["name"] == "John"
 
+    def test_resolved_foreign_keys_follow_their_rows(self, transformer):
+        df = pd.DataFrame({"name": ["John", "Jane", "Jim"], "reporter": ["Ann", "Bob", "Ann"]})
+        parsed_model = {
+            "fields": [
+                {"name": "name", "is_id": False, "is_required": True, "is_list": False, "is_scalar": True},
+                {
+                    "name": "reporterId",
+                    "is_id": True,
+                    "is_required": True,
+                    "related_model": "Reporter",
+                    "is_list": False,
+                    "is_scalar": False,
+                },
+            ]
+        }
+        fk_cache = {"Reporter": {"lookup": {"Ann": "r-1", "Bob": "r-2"}}}
+
+        records, _, failed = transformer.transform_rows_to_records(df, parsed_model, "name", fk_cache)
+
+        assert failed == []
+        assert [(r["name"], r["reporterId"]) for r in records] == [("John", "r-1"), ("Jane", "r-2"), ("Jim", "r-1")]
+
+    def test_plans_fields_once_per_sheet_without_mutating_structure(self, transformer):
+        df = pd.DataFrame({"name": ["John"], "reporterId": ["Ann"]})
+        fields = [
+            {"name": "name", "is_id": False, "is_required": True, "is_list": False, "is_scalar": True},
+            {"name": "reporterId", "is_id": True, "is_required": True, "is_list": False, "is_scalar": False},
+            {"name": "editorId", "is_id": True, "is_required": True, "is_list": False, "is_scalar": False},
+        ]
+        original = [dict(field) for field in fields]
+
+        planned = transformer._plan_fields(df.columns, fields)
+
+        assert [(f["column"], f.get("related_model")) for f in planned] == [
+            ("name", None),
+            ("reporterId", "Reporter"),
+            ("editor", "Editor"),
+        ]
+        assert fields == original
+
+    def test_plan_skips_optional_fields_without_a_column(self, transformer):
+        df = pd.DataFrame({"name": ["John"]})
+        fields = [
+            {"name": "name", "is_id": False, "is_required": True, "is_list": False, "is_scalar": True},
+            {"name": "nickname", "is_id": False, "is_required": False, "is_list": False, "is_scalar": True},
+            {"name": "editorId", "is_id": True, "is_required": False, "is_list": False, "is_scalar": False},
+            {"name": "age", "is_id": False, "is_required": True, "is_list": False, "is_scalar": True},
+            {"name": "address", "is_id": False, "is_required": False, "is_custom_type": True, "type": "Address"},
+        ]
+
+        planned = transformer._plan_fields(df.columns, fields)
+
+        assert [f["name"] for f in planned] == ["name", "age", "address"]
+
 
 class TestTransformRowToRecord:
     """Test transform_row_to_record method"""
@@ -263,7 +318,7 @@ class TestTransformRowToRecord:
             ]
         }
 
-        def parse_side_effect(row, field, cache):
+        def parse_side_effect(row, field, cache, resolved_fks=None):
             if field["name"] == "depth":
                 raise ValueError("'depth' could not be parsed as Float (value: 'bad')")
             if field["name"] == "temperature":
@@ -345,7 +400,7 @@ class TestTransformRowToRecord:
         """The loop must not stop at the first failing field."""
         call_order = []
 
-        def parse_side_effect(row, field, cache):
+        def parse_side_effect(row, field, cache, resolved_fks=None):
             call_order.append(field["name"])
             if field["name"] == "depth":
                 raise ValueError("bad depth")
@@ -486,7 +541,7 @@ class TestTransformRowToRecord:
             ]
         }
 
-        def raise_on_bad(row, field, cache):
+        def raise_on_bad(row, field, cache, resolved_fks=None):
             if field["name"] in ("depth", "temperature"):
                 raise ValueError(f"'{field['name']}' could not be parsed as Float (value: 'bad')")
             return row.get(field["name"])
@@ -1061,6 +1116,13 @@ class TestResolveForeignKey:
 
         assert result == "author-123"
 
+    def test_infers_related_model_from_field_name_without_id_suffix(self, transformer):
+        field = {"name": "editor", "is_id": True, "is_required": True}
+        fk_cache = {"Editor": {"lookup": {"Jane Roe": "editor-1"}}}
+
+        assert transformer._resolve_foreign_key(field, "Jane Roe", fk_cache) == "editor-1"
+        assert transformer._column_for_field(field, ["editor"]) == "editor"
+
     def test_raises_error_for_missing_optional_fk(self, transformer):
         field = {
             "name": "authorId",
@@ -1144,9 +1206,65 @@ class TestResolveForeignKey:
         assert result == "cat-abc"
 
 
+class TestResolveForeignKeyColumns:
+    """Test resolve_foreign_key_columns bulk resolution"""
+
+    FIELD = {"name": "authorId", "is_id": True, "is_required": True, "related_model": "Author"}
+
+    def test_maps_each_distinct_value_once(self, transformer, mock_field_parser):
+        df = pd.DataFrame({"author": ["John", "Jane", "John", None, "Ghost"]})
+        fk_cache = {"Author": {"lookup": {"John": "a-1", "Jane": "a-2"}}}
+
+        resolved = transformer.resolve_foreign_key_columns(df, {"fields": [self.FIELD]}, fk_cache)
+
+        assert resolved == {"authorId": ["a-1", "a-2", "a-1", None, None]}
+        assert mock_field_parser.clean_input.call_count == 3
+
+    def test_accepts_id_suffixed_column(self, transformer):
+        df = pd.DataFrame({"authorId": ["John"]})
+        fk_cache = {"Author": {"lookup": {"John": "a-1"}}}
+
+        resolved = transformer.resolve_foreign_key_columns(df, {"fields": [self.FIELD]}, fk_cache)
+
+        assert resolved == {"authorId": ["a-1"]}
+
+    def test_skips_models_without_lookup(self, transformer):
+        df = pd.DataFrame({"author": ["John"]})
+
+        assert transformer.resolve_foreign_key_columns(df, {"fields": [self.FIELD]}, {}) == {}
+
+    def test_rows_use_resolved_ids_and_report_unknown_values(self, transformer):
+        df = pd.DataFrame({"author": ["John", "Ghost"]})
+        fk_cache = {"Author": {"lookup": {"John": "a-1"}}}
+
+        records, _, failed = transformer.transform_rows_to_records(df, {"fields": [self.FIELD]}, "author", fk_cache)
+
+        assert records == [{"authorId": "a-1"}]
+        assert failed[0]["field_errors"][0].kind == "fk_not_found"
+
+
+class TestIsMissing:
+    """Test the per-cell missing-value check"""
+
+    @pytest.mark.parametrize("value", [None, float("nan"), np.float64("nan"), pd.NaT, pd.NA])
+    def test_missing_values(self, value):
+        assert _is_missing(value) is True
+
+    @pytest.mark.parametrize("value", ["", "text", 0, False, 1.5, np.float64(2.0), pd.Timestamp("2024-01-01")])
+    def test_present_values(self, value):
+        assert _is_missing(value) is False
+
+
 class TestToCamelCase:
     """Test to_camel_case static method"""
 
+    def test_conversion_is_memoized(self):
+        DataTransformer.to_camel_case("memo_header")
+        hits = DataTransformer.to_camel_case.cache_info().hits
+
+        assert DataTransformer.to_camel_case("memo_header") == "memoHeader"
+        assert DataTransformer.to_camel_case.cache_info().hits == hits + 1
+
     def test_converts_snake_case(self, transformer):
         assert transformer.to_camel_case("first_name") == "firstName"
         assert transformer.to_camel_case("last_name") == "lastName"